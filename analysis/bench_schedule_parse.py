@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Lines per second through parse_schedule_lines on the 2026-27 schedule PDFs.
+
+PDF text is extracted (or read from .cache/pdf_text) once up front, so only
+the line classifier and hunt parsing are timed. Every PDF's lines are fed
+through every category, as a decade of archived schedules would be.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "analysis"))
+
+from build_2026_decision_data import PDF_MAP, RAW, parse_schedule_lines, pdf_lines  # noqa: E402
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="copies of the PDF lines per timed run (default 20)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="timed runs per category; the fastest is kept (default 5)")
+    args = parser.parse_args(argv)
+
+    lines = [line for filename, _ in PDF_MAP.values() for line in pdf_lines(RAW / filename)]
+    batch = lines * args.repeat
+    print(f"{len(lines)} lines from {len(PDF_MAP)} PDFs, x{args.repeat} = {len(batch)} per run")
+
+    total_lines = total_secs = 0.0
+    for category, (_, hunt_type) in PDF_MAP.items():
+        best, hunts = float("inf"), 0
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            hunts = sum(1 for _ in parse_schedule_lines(batch, hunt_type, category))
+            best = min(best, time.perf_counter() - t0)
+        total_lines += len(batch)
+        total_secs += best
+        print(f"  {category:<17} {len(batch) / best:>10,.0f} lines/s  ({hunts} hunts)")
+    print(f"  {'overall':<17} {total_lines / total_secs:>10,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
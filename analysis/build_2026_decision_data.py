@@ -1,26 +1,58 @@
 #!/usr/bin/env python3
 """
 Parse official 2026-27 MDWFP deer draw hunt PDFs, score opportunities using
-Yazoo-region rut timing, 2026-27 moon phases, and 2025 draw competition stats,
-then emit CSVs + decision JSON for the web app.
+Yazoo-region rut timing, 2026-27 moon phases, and draw competition stats
+(2025 per hunt, plus per-area trends across every season in the stats PDFs,
+kept in data/draw_history.sqlite), then emit CSVs + decision JSON for the web app.
+
+Run:  python analysis/build_2026_decision_data.py
+      python analysis/build_2026_decision_data.py --profile   (per-stage timings;
+                                                               see stage_profile.py)
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
+import hashlib
+import io
 import json
+import os
 import re
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import pypdf
 from pypdf import PdfReader
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from atomic_write import write_text_atomic  # noqa: E402
+from draw_forecast import fit_areas, forecast  # noqa: E402
+from draw_history import DrawHistory, area_key  # noqa: E402
+from draw_odds import simulate_slate  # noqa: E402
+from drive_matrix import DriveMatrix, load_pins  # noqa: E402
+from hunt_scoring import moon_score_for, rut_score_for  # noqa: E402
+from interval_index import IntervalIndex, day_number  # noqa: E402
+from stage_profile import StageProfiler  # noqa: E402
+
 RAW = ROOT / "data" / "raw_2026"
 OUT_DATA = ROOT / "data"
 OUT_REPORTS = ROOT / "reports"
 WEB_DATA = ROOT / "web" / "data"
+# --profile writes its stage timings here unless given a path.
+PROFILE_REPORT = ROOT / ".cache" / "profile" / "build_2026_decision_data.json"
+PDF_CACHE = ROOT / ".cache" / "pdf_text"
+
+# Below this many pages a process pool costs more to start than it saves.
+PARALLEL_MIN_PAGES = 4
+# Pages per extraction job; the pool runs a few jobs ahead of the parser.
+PAGES_PER_CHUNK = 2
 
 MONTHS = {
     "jan": 1,
@@ -45,71 +77,87 @@ PDF_MAP = {
     "youth": ("youth_2026.pdf", "Deer Youth"),
     "senior": ("senior_2026.pdf", "Deer Senior"),
 }
+ADULT_CATEGORIES = {"archery", "gun", "primitive_weapon", "group"}
+# The season whose applications are forecast (2026-27).
+TARGET_SEASON = 2026
 
-# Official major phases for the 2026-27 deer season window (UTC-adjacent calendar dates).
-MOON_PHASES = [
-    {"date": datetime(2026, 10, 3), "phase": "Last Quarter", "impact": 1},
-    {"date": datetime(2026, 10, 10), "phase": "New", "impact": 3},
-    {"date": datetime(2026, 10, 18), "phase": "First Quarter", "impact": 1},
-    {"date": datetime(2026, 10, 26), "phase": "Full", "impact": -1},
-    {"date": datetime(2026, 11, 1), "phase": "Last Quarter", "impact": 1},
-    {"date": datetime(2026, 11, 9), "phase": "New", "impact": 3},
-    {"date": datetime(2026, 11, 17), "phase": "First Quarter", "impact": 1},
-    {"date": datetime(2026, 11, 24), "phase": "Full", "impact": -1},
-    {"date": datetime(2026, 12, 1), "phase": "Last Quarter", "impact": 1},
-    {"date": datetime(2026, 12, 9), "phase": "New", "impact": 3},
-    {"date": datetime(2026, 12, 17), "phase": "First Quarter", "impact": 1},
-    {"date": datetime(2026, 12, 24), "phase": "Full", "impact": -1},
-    {"date": datetime(2026, 12, 30), "phase": "Last Quarter", "impact": 1},
-    {"date": datetime(2027, 1, 7), "phase": "New", "impact": 3},
-    {"date": datetime(2027, 1, 15), "phase": "First Quarter", "impact": 1},
-    {"date": datetime(2027, 1, 22), "phase": "Full", "impact": -1},
-    {"date": datetime(2027, 1, 29), "phase": "Last Quarter", "impact": 1},
-]
 
-# Yazoo County / Delta region biological window (same regional timing as prior analysis).
-RUT_PERIODS = [
-    {
-        "id": "pre_rut",
-        "start": datetime(2026, 10, 1),
-        "end": datetime(2026, 12, 15),
-        "score": 3,
-        "label": "Pre-Rut (Building Activity)",
-    },
-    {
-        "id": "pre_peak_rut",
-        "start": datetime(2026, 12, 16),
-        "end": datetime(2026, 12, 28),
-        "score": 4,
-        "label": "Pre-Peak Rut (Chasing Activity)",
-    },
-    {
-        "id": "peak_rut",
-        "start": datetime(2026, 12, 29),
-        "end": datetime(2027, 1, 4),
-        "score": 5,
-        "label": "Peak Rut (Prime Time)",
-    },
-    {
-        "id": "post_rut",
-        "start": datetime(2027, 1, 5),
-        "end": datetime(2027, 1, 20),
-        "score": 3,
-        "label": "Post-Rut (Recovery Period)",
-    },
-    {
-        "id": "late_season",
-        "start": datetime(2027, 1, 21),
-        "end": datetime(2027, 1, 31),
-        "score": 2,
-        "label": "Late Season (Food Focus)",
-    },
-]
+def pdf_cache_dir(path: Path) -> Path:
+    """Cache slot for a PDF, keyed by its content and the pypdf version.
+
+    Renaming or re-downloading an identical file reuses the slot; a pypdf
+    upgrade (which can change extraction output) gets a fresh one.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return PDF_CACHE / f"{digest.hexdigest()[:32]}-pypdf{pypdf.__version__}"
+
+
+def _extract_pages(path: str, start: int, stop: int) -> list[str]:
+    """Worker: text of pages [start, stop). Opens the reader once per chunk."""
+    reader = PdfReader(path)
+    return [(reader.pages[i].extract_text() or "") for i in range(start, stop)]
+
 
+def _in_order(pool: ProcessPoolExecutor | None, jobs: Iterable[tuple], window: int) -> Iterator:
+    """Results of _extract_pages(*job) in job order, at most window jobs ahead.
 
-def pdf_text(path: Path) -> str:
-    reader = PdfReader(str(path))
-    return "\n".join((page.extract_text() or "") for page in reader.pages)
+    The consumer works on one chunk while the pool extracts the next few, and
+    no more than window chunks of text are ever held at once.
+    """
+    if pool is None:
+        for job in jobs:
+            yield _extract_pages(*job)
+        return
+    pending: deque = deque()
+    for job in jobs:
+        pending.append(pool.submit(_extract_pages, *job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def pdf_pages(path: Path, pool: ProcessPoolExecutor | None = None) -> Iterator[str]:
+    """Text of each page of path, produced one page at a time.
+
+    A cached PDF is read back page file by page file. Otherwise pages are
+    extracted in PAGES_PER_CHUNK chunks (on pool when given) and written to
+    the cache as they pass through; meta.json goes last, so a stream that
+    stops early leaves a slot that reads as a miss, not a hit.
+    """
+    slot = pdf_cache_dir(path)
+    meta_path = slot / "meta.json"
+    if meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        for i in range(1, meta["pages"] + 1):
+            yield (slot / f"page_{i:04d}.txt").read_text(encoding="utf-8")
+        return
+
+    n = len(PdfReader(str(path)).pages)
+    if n < PARALLEL_MIN_PAGES:
+        pool = None
+    jobs = ((str(path), i, min(i + PAGES_PER_CHUNK, n)) for i in range(0, n, PAGES_PER_CHUNK))
+    window = 2 * (os.cpu_count() or 1)
+    slot.mkdir(parents=True, exist_ok=True)
+    page = 0
+    for texts in _in_order(pool, jobs, window):
+        for text in texts:
+            page += 1
+            (slot / f"page_{page:04d}.txt").write_text(text, encoding="utf-8")
+            yield text
+    meta = {"source": path.name, "pages": page, "pypdf": pypdf.__version__}
+    tmp = slot / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta), encoding="utf-8")
+    os.replace(tmp, meta_path)
+
+
+def pdf_lines(path: Path, pool: ProcessPoolExecutor | None = None) -> Iterator[str]:
+    """Lines of a PDF's text, page by page, as the pages arrive."""
+    for text in pdf_pages(path, pool):
+        yield from text.splitlines()
 
 
 def parse_date_token(token: str, default_year: int, default_month: int | None = None) -> datetime:
@@ -170,11 +218,62 @@ def extract_location_and_hunt(name: str) -> tuple[str, str | None]:
         location = name.rsplit(" - ", 1)[0].strip()
     else:
         location = name
-    # Normalize LBTC naming between schedule/stats
-    location = location.replace("Pascagoula River - LBTC", "Pascagoula River (LBTC Unit)")
-    location = location.replace("Pascagoula River (LBTC Unit)", "Pascagoula River (LBTC Unit)")
-    location = location.replace("Calling Panther Lake", "Calling Panther")
-    return location, hunt_num
+    return WMA_ALIASES.get(location, location), hunt_num
+
+
+# Schedules and stats name the same hunt differently from year to year. Every
+# name reduces to one canonical key, "location|method|number" in lowercase
+# ("location|method" for a season summary row): WMA spellings go through
+# WMA_ALIASES, methods through METHOD_ALIASES, and a group hunt's method
+# carries a "group " prefix whether or not the name says Group (the group
+# schedule leaves it out; the stats keep it). Summaries that just say Group
+# take the weapon from GROUP_WEAPONS.
+WMA_ALIASES = {
+    "Calling Panther Lake": "Calling Panther",
+    "Pascagoula River - LBTC": "Pascagoula River (LBTC Unit)",
+    "Pascagoula River: Land Between the Creeks": "Pascagoula River (LBTC Unit)",
+    "Pascagoula River - Land Between the Creeks": "Pascagoula River (LBTC Unit)",
+    "Phil Bryant - Backwoods": "Phil Bryant (Backwoods Unit)",
+    "Phil Bryant - Buck Bayou": "Phil Bryant (Buck Bayou Unit)",
+    "Phil Bryant - Goose Lake": "Phil Bryant (Goose Lake Unit)",
+    "Phil Bryant - Ten Point": "Phil Bryant (Ten Point Unit)",
+    "Mahannah and Phil Bryant": "Mahannah/Phil Bryant",
+}
+METHOD_ALIASES = {
+    "primitive weapon": "pw",
+    "senior citizen": "senior",
+    "handicapped": "mobility impaired",
+    "(washington tract) youth": "youth",
+}
+GROUP_WEAPONS = {
+    "Cossar State Park": "limited weapon",
+    "Natchez State Park": "pw",
+}
+HUNT_NAME_RE = re.compile(r"^(?P<location>.+) - (?P<method>.*?)\s*Hunt\s+(?P<number>\d+)$")
+
+
+def canonical_area_key(location: str, method: str, group: bool = False) -> str:
+    """"location|method" for a WMA and hunt type, however a PDF spells them."""
+    location = WMA_ALIASES.get(location.rstrip("*"), location.rstrip("*"))
+    method = WHITESPACE_RE.sub(" ", method).strip().lower()
+    if method.startswith("group"):
+        group, method = True, method[len("group"):].strip(" ()")
+        method = method or GROUP_WEAPONS.get(location, "")
+    method = METHOD_ALIASES.get(method, method)
+    return f"{location.lower()}|{'group ' if group else ''}{method}"
+
+
+def canonical_hunt_key(name: str, group: bool = False) -> str:
+    """One key for a hunt however a given year's PDF spells it."""
+    name = WHITESPACE_RE.sub(" ", name).strip()
+    m = HUNT_NAME_RE.match(name)
+    if not m:
+        return name.lower()
+    return f"{canonical_area_key(m['location'], m['method'], group)}|{int(m['number'])}"
+
+
+def hunt_key(hunt: dict) -> str:
+    return canonical_hunt_key(hunt["hunt_name"], hunt.get("is_group", False))
 
 
 def infer_group_quota(name: str) -> int:
@@ -189,82 +288,91 @@ def infer_group_quota(name: str) -> int:
     return 4
 
 
-def parse_schedule_lines(text: str, hunt_type: str, category: str) -> list[dict]:
-    hunts = []
-    # Skip headers / footers
-    for raw in text.splitlines():
-        line = re.sub(r"\s+", " ", raw).strip()
-        if not line or line.startswith("Hunt Dates") or line.startswith("Total Permits"):
-            continue
-        if line.startswith("WMA ") or re.fullmatch(r"\d+", line):
-            continue
-        if "groups" in line.lower() and "hunt" not in line.lower():
-            continue
-        if line.startswith("*") or line.startswith("Group hunts") or line.startswith("Winners"):
-            continue
-        if "Minimum of two" in line or "for each hunt" in line:
-            continue
-
-        # Pattern with trailing quota integer (supports single-day youth/senior hunts)
-        m = re.match(
-            r"^(?P<name>.+?)\s+(?P<dates>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2}(?:\s*-\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+)?\d{1,2})?)\s+(?P<quota>\d+)\s*$",
-            line,
-            re.IGNORECASE,
-        )
+# Schedule lines, compiled once. A line is whitespace-collapsed first, then
+# classified in one pass: boilerplate (column headers, page numbers, totals,
+# footnotes, the group-slot legend) is dropped, anything else is tried as a
+# "name dates quota" row and, in the group PDF, a "name date-range" row.
+WHITESPACE_RE = re.compile(r"\s+")
+SKIP_LINE_RE = re.compile(
+    r"^(?:Hunt Dates|Total Permits|WMA |\d+$|\*|Group hunts|Winners)"
+    r"|Minimum of two|for each hunt"
+    r"|^(?!(?i:.*hunt))(?i:.*groups)"
+)
+# The date range is captured as start month/day and optional end month/day,
+# so a matched line needs no second parse to become dates.
+_MONTHS = "Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
+_START = rf"(?P<m1>{_MONTHS})\.?\s+(?P<d1>\d{{1,2}})"
+_END = rf"\s*-\s*(?:(?P<m2>{_MONTHS})\.?\s+)?(?P<d2>\d{{1,2}})"
+SCHEDULE_LINE_RE = re.compile(
+    rf"^(?P<name>.+?)\s+{_START}(?:{_END})?\s+(?P<quota>\d+)\s*$", re.IGNORECASE
+)
+GROUP_LINE_RE = re.compile(rf"^(?P<name>.+?)\s+{_START}{_END}\s*$", re.IGNORECASE)
+
+SKIP, SCHEDULE, GROUP, OTHER = "skip", "schedule", "group", "other"
+
+
+def classify_line(raw: str, category: str) -> tuple[str, re.Match | None]:
+    """(kind, match) for one raw schedule line; match is set for SCHEDULE and GROUP."""
+    line = WHITESPACE_RE.sub(" ", raw).strip()
+    if not line or SKIP_LINE_RE.search(line):
+        return SKIP, None
+    m = SCHEDULE_LINE_RE.match(line)
+    if m:
+        return SCHEDULE, m
+    if category == "group":
+        m = GROUP_LINE_RE.match(line)
         if m:
-            name = m.group("name").strip()
-            # Fix double spaces in names like "Gun (Bucks Only)  Hunt"
-            name = re.sub(r"\s+", " ", name)
-            start, end = parse_date_range(m.group("dates"))
-            location, hunt_num = extract_location_and_hunt(name)
-            hunts.append(
-                {
-                    "hunt_name": name,
-                    "hunt_type": hunt_type,
-                    "category": category,
-                    "wma_location": location,
-                    "hunt_number": hunt_num,
-                    "start_date": start,
-                    "end_date": end,
-                    "permits_available": int(m.group("quota")),
-                    "duration_days": (end - start).days + 1,
-                }
-            )
+            return GROUP, m
+    return OTHER, None
+
+
+def line_dates(m: re.Match, season_start_year: int = 2026) -> tuple[datetime, datetime]:
+    """Start and end of a classified line, as parse_date_range reads the same text."""
+    def day(month_name: str, d: str) -> datetime:
+        month = MONTHS[month_name[:3].lower()]
+        return datetime(season_start_year + (month < 6), month, int(d))
+
+    start = day(m.group("m1"), m.group("d1"))
+    if m.group("d2") is None:
+        return start, start
+    end = day(m.group("m2") or m.group("m1"), m.group("d2"))
+    if end < start:
+        end = datetime(end.year + 1, end.month, end.day)
+    return start, end
+
+
+def parse_schedule_lines(lines: Iterable[str], hunt_type: str, category: str) -> Iterator[dict]:
+    """Hunts in a schedule PDF's lines, yielded as each line is parsed."""
+    for raw in lines:
+        kind, m = classify_line(raw, category)
+        if kind is SKIP or kind is OTHER:
             continue
+        # The line was whitespace-collapsed before matching, so the name is too.
+        name = m.group("name").strip()
+        start, end = line_dates(m)
+        location, hunt_num = extract_location_and_hunt(name)
+        hunt = {
+            "hunt_name": name,
+            "hunt_type": hunt_type,
+            "category": category,
+            "wma_location": location,
+            "hunt_number": hunt_num,
+            "start_date": start,
+            "end_date": end,
+            "duration_days": (end - start).days + 1,
+        }
+        if kind is SCHEDULE:
+            hunt["permits_available"] = int(m.group("quota"))
+        else:
+            hunt["permits_available"] = infer_group_quota(name)
+            hunt["is_group"] = True
+        yield hunt
 
-        # Group hunts without inline numeric quota
-        if category == "group":
-            m2 = re.match(
-                r"^(?P<name>.+?)\s+(?P<dates>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2}\s*-\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+)?\d{1,2})\s*$",
-                line,
-                re.IGNORECASE,
-            )
-            if m2:
-                name = re.sub(r"\s+", " ", m2.group("name").strip())
-                start, end = parse_date_range(m2.group("dates"))
-                location, hunt_num = extract_location_and_hunt(name)
-                seats = infer_group_quota(name)
-                hunts.append(
-                    {
-                        "hunt_name": name,
-                        "hunt_type": hunt_type,
-                        "category": category,
-                        "wma_location": location,
-                        "hunt_number": hunt_num,
-                        "start_date": start,
-                        "end_date": end,
-                        "permits_available": seats,
-                        "duration_days": (end - start).days + 1,
-                        "is_group": True,
-                    }
-                )
-    return hunts
-
-
-def parse_stats(text: str) -> dict[str, dict]:
-    """Index 2025 stats by normalized hunt name for competition lookup."""
+
+def parse_stats(lines: Iterable[str]) -> dict[str, tuple[int, int]]:
+    """(applications, quota) by canonical hunt key from a per-hunt stats PDF."""
     stats = {}
-    for raw in text.splitlines():
+    for raw in lines:
         line = re.sub(r"\s+", " ", raw).strip()
         m = re.match(
             r"^(?P<name>.+?)\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2}.+?\s+(?P<quota>\d+|1 group.+?|4 groups.+?)\s+(?P<apps>\d+)\s*$",
@@ -273,9 +381,6 @@ def parse_stats(text: str) -> dict[str, dict]:
         )
         if not m:
             continue
-        name = re.sub(r"\s+", " ", m.group("name").strip())
-        name = name.replace("Calling Panther Lake", "Calling Panther")
-        name = name.replace("Pascagoula River - LBTC", "Pascagoula River (LBTC Unit)")
         apps = int(m.group("apps"))
         quota_raw = m.group("quota")
         if "group" in quota_raw.lower():
@@ -285,88 +390,113 @@ def parse_stats(text: str) -> dict[str, dict]:
                 quota = 1
         else:
             quota = int(re.search(r"\d+", quota_raw).group())
-        ratio = apps / quota if quota else None
-        stats[name] = {
-            "applications_2025": apps,
-            "quota_2025": quota,
-            "apps_per_permit_2025": round(ratio, 2) if ratio is not None else None,
-        }
-        # Also index by location + hunt number for fuzzy match across year date shifts
-        location, hunt_num = extract_location_and_hunt(name)
-        method_key = classify_method_key(name)
-        if hunt_num and method_key:
-            stats[f"{location}|{method_key}|{hunt_num}"] = stats[name]
+        stats[canonical_hunt_key(m.group("name"))] = (apps, quota)
     return stats
 
 
-def classify_method_key(name: str) -> str | None:
-    lower = name.lower()
-    if "group" in lower or "backwoods unit) - archery" in lower or "backwoods unit) - gun" in lower:
-        # group schedule names omit the word Group sometimes
-        if "backwoods" in lower:
-            if "archery" in lower:
-                return "group_archery"
-            if "gun" in lower:
-                return "group_gun"
-        if "limited weapon" in lower:
-            return "group_limited"
-        if "primitive" in lower:
-            return "group_pw"
-    if "youth" in lower:
-        return "youth"
-    if "senior" in lower:
-        return "senior"
-    if "pw hunt" in lower or "primitive" in lower:
-        return "pw"
-    if "gun" in lower:
-        return "gun"
-    if "archery" in lower:
-        return "archery"
-    return None
-
-
-def moon_score_for(start: datetime, end: datetime) -> dict:
-    midpoint = start + (end - start) / 2
-    best_score = -2
-    closest = None
-    for phase in MOON_PHASES:
-        days = abs((midpoint - phase["date"]).days)
-        if days <= 2:
-            score = phase["impact"]
-        elif days <= 4:
-            score = phase["impact"] * 0.7
-        elif days <= 7:
-            score = phase["impact"] * 0.4
+# Season summaries (the 2024-25 stats PDF) list a WMA and hunt type per row
+# instead of single hunts. Layout extraction keeps their columns apart by runs
+# of spaces; a WMA cell is blank under the first row of its WMA, and a long
+# name wraps onto the next row after a trailing connector word.
+SEASON_TITLE_RE = re.compile(r"\((?P<year>\d{4})-\d{2}\)")
+YEARS_HEADER_RE = re.compile(r"Hunt Type(?P<years>(?:\s+\d{4})+)$")
+CELL_SPLIT_RE = re.compile(r"\s{2,}")
+WRAP_WORDS = {"Land", "Between"}
+
+
+def pdf_layout_lines(path: Path) -> Iterator[str]:
+    """Lines of every page in layout mode, columns spaced as printed."""
+    for page in PdfReader(str(path)).pages:
+        yield from (page.extract_text(extraction_mode="layout") or "").splitlines()
+
+
+def parse_area_stats(lines: Iterable[str]) -> list[tuple[int, str, int, int | None]]:
+    """(season, area key, applications, permits) rows from a season summary.
+
+    The season table gives applications and hunters drawn per season; the
+    applications history table gives applications alone, one column per
+    season. A season in both keeps the season table's permits.
+    """
+    found: list[tuple] = []
+    wmas: list[list[str]] = []
+    season = years = None
+    for raw in lines:
+        line = raw.strip()
+        if m := YEARS_HEADER_RE.search(line):
+            years, season = [int(y) for y in m["years"].split()], None
+            continue
+        if (m := SEASON_TITLE_RE.search(line)) and not line[-1].isdigit():
+            season, years = int(m["year"]), None
+            continue
+        cells = CELL_SPLIT_RE.split(line)
+        width = 4 if season is not None else len(years or ())
+        values, head = cells[-width:], cells[:-width]
+        if not width or not 1 <= len(head) <= 2 or head[-1].startswith("TOTAL"):
+            continue
+        if not all(v.isdigit() or v == "n/a" for v in values):
+            continue
+        if len(head) == 2:
+            if wmas and wmas[-1][0].split()[-1] in WRAP_WORDS:
+                wmas[-1][0] += " " + head[0]
+            else:
+                wmas.append([head[0]])
+        if not wmas:
+            continue
+        wma, hunt_type = wmas[-1], head[-1]
+        if season is not None:
+            found.append((season, wma, hunt_type, int(values[1]), int(values[3])))
         else:
-            score = 0
-        if score > best_score:
-            best_score = score
-            closest = phase["phase"]
-    if best_score >= 2.5:
-        desc = "Excellent (New Moon Period)"
-    elif best_score >= 1:
-        desc = "Good (Quarter Moon)"
-    elif best_score >= 0:
-        desc = "Fair (Neutral)"
-    else:
-        desc = "Poor (Full Moon Period)"
-    return {
-        "score": round(best_score, 2),
-        "closest_phase": closest,
-        "description": desc,
-    }
+            found += [(year, wma, hunt_type, int(v), None)
+                      for year, v in zip(years, values) if v != "n/a"]
+
+    # Keys are made last: a wrapped WMA name is only whole once its rows are read.
+    rows: dict[tuple[int, str], tuple[int, str, int, int | None]] = {}
+    for year, wma, hunt_type, apps, permits in found:
+        key = canonical_area_key(wma[0], hunt_type)
+        if permits is None and (year, key) in rows:
+            continue
+        rows[(year, key)] = (year, key, apps, permits)
+    return list(rows.values())
 
 
-def rut_score_for(start: datetime, end: datetime) -> dict:
-    midpoint = start + (end - start) / 2
-    for period in RUT_PERIODS:
-        if period["start"] <= midpoint <= period["end"]:
-            return {
-                "score": period["score"],
-                "period": period["id"],
-                "description": period["label"],
-            }
-    return {"score": 1, "period": "transition", "description": "Transition Period"}
+# Every draw stats PDF on hand: per-hunt tables with the season they cover,
+# and season summaries (None), which name their seasons themselves.
+STATS_PDFS = [
+    (RAW / "stats_2025.pdf", 2025),
+    (OUT_DATA / "WMA_Deer_Draw_Hunt_Stats_(2024-25).pdf", None),
+]
+
+
+def ingest_stats(history: DrawHistory, pool: ProcessPoolExecutor | None = None) -> None:
+    """Load any stats PDF that is new or changed since the last build into history."""
+    for path, season in STATS_PDFS:
+        if not path.exists() or history.is_current(path):
+            continue
+        if season is None:
+            history.ingest(path, areas=parse_area_stats(pdf_layout_lines(path)))
+        else:
+            stats = parse_stats(pdf_lines(path, pool))
+            history.ingest(path, hunts=[(season, key, *row) for key, row in stats.items()])
+        print(f"Ingested {path.name}")
+
+
+def stats_entry(apps: int, quota: int | None, predicted: dict) -> dict:
+    """A hunt's latest stats plus its TARGET_SEASON forecast (see draw_forecast.forecast).
+
+    The forecast ratio keeps last season's quota, which counts groups rather
+    than hunters for group hunts, like the applications it is divided into.
+    """
+    ratio = apps / quota if quota else None
+    return {
+        "applications_2025": apps,
+        "quota_2025": quota,
+        "apps_per_permit_2025": round(ratio, 2) if ratio is not None else None,
+        "applications_forecast": predicted["median"],
+        "applications_forecast_low": predicted["low"],
+        "applications_forecast_high": predicted["high"],
+        "applications_forecast_sd": predicted["log_sd"],
+        "apps_per_permit_forecast": round(predicted["median"] / quota, 2) if quota else None,
+    }
 
 
 def competition_score(ratio: float | None) -> dict:
@@ -397,45 +527,36 @@ def competition_score(ratio: float | None) -> dict:
 
 
 def lookup_stats(hunt: dict, stats: dict) -> dict | None:
-    name = hunt["hunt_name"]
-    # Direct-ish name match after normalizing Group wording differences
-    candidates = [
-        name,
-        name.replace(" - Archery Hunt", " - Group Archery Hunt"),
-        name.replace(" - Gun Hunt", " - Group Gun Hunt"),
-        name.replace("Limited Weapon Hunt", "Group Limited Weapon Hunt"),
-        name.replace("Primitive Weapon Hunt", "Group Primitive Weapon Hunt"),
-        name.replace("Calling Panther", "Calling Panther Lake"),
-    ]
-    for c in candidates:
-        if c in stats and "applications_2025" in stats[c]:
-            return stats[c]
-        # strip Group word variants
-        c2 = c.replace(" Group ", " ")
-        if c2 in stats and "applications_2025" in stats[c2]:
-            return stats[c2]
-
-    method = classify_method_key(name)
-    location, hunt_num = hunt["wma_location"], hunt["hunt_number"]
-    if method and hunt_num:
-        key = f"{location}|{method}|{hunt_num}"
-        if key in stats and "applications_2025" in stats[key]:
-            return stats[key]
-        # Calling Panther Lake alias
-        if location == "Calling Panther":
-            key = f"Calling Panther Lake|{method}|{hunt_num}"
-            if key in stats and "applications_2025" in stats[key]:
-                return stats[key]
-    return None
-
-
-def score_hunt(hunt: dict, stats: dict) -> dict:
+    return stats.get(hunt_key(hunt))
+
+
+FORECAST_FIELDS = (
+    "applications_forecast",
+    "applications_forecast_low",
+    "applications_forecast_high",
+    "applications_forecast_sd",
+    "apps_per_permit_forecast",
+)
+
+
+def score_hunt(hunt: dict, stats: dict, trends: dict) -> dict:
+    """Score one hunt. stats are stats_entry dicts by hunt key; trends by area key.
+
+    Competition is judged on the forecast apps per permit for TARGET_SEASON.
+    A hunt missing from the latest stats falls back to its area's mean apps
+    per permit across seasons, when the area has any history.
+    """
     moon = moon_score_for(hunt["start_date"], hunt["end_date"])
     rut = rut_score_for(hunt["start_date"], hunt["end_date"])
     hist = lookup_stats(hunt, stats)
+    trend = trends.get(area_key(hunt_key(hunt)))
     ratio = hist["apps_per_permit_2025"] if hist else None
     apps = hist["applications_2025"] if hist else None
-    comp = competition_score(ratio)
+    quota = hist["quota_2025"] if hist else None
+    expected = hist["apps_per_permit_forecast"] if hist else None
+    if expected is None and trend is not None:
+        expected = trend["mean"]
+    comp = competition_score(expected)
 
     permit_score = min(hunt["permits_available"] / 10, 5)  # 50 permits => max
     duration_score = min(hunt["duration_days"] / 2, 5)  # 10-day hunt => max
@@ -457,7 +578,10 @@ def score_hunt(hunt: dict, stats: dict) -> dict:
         "moon": moon,
         "rut": rut,
         "applications_2025": apps,
+        "quota_2025": quota,
         "apps_per_permit_2025": ratio,
+        "apps_per_permit_trend": trend,
+        **{k: hist[k] if hist else None for k in FORECAST_FIELDS},
         "competition_label": comp["label"],
         "competition_score": comp["score"],
         "quality_score": round(quality, 2),
@@ -468,6 +592,31 @@ def score_hunt(hunt: dict, stats: dict) -> dict:
     }
 
 
+def unmatched_report(hunts: list[dict], stats: dict) -> str:
+    """Markdown list of hunts with no stats entry, and stats entries no hunt used.
+
+    A hunt on one list with its counterpart on the other usually means a
+    spelling the alias tables do not cover yet.
+    """
+    keys = {hunt_key(h): h for h in hunts}
+    missing = sorted((h for h in hunts if h["applications_2025"] is None),
+                     key=lambda h: (h["category"], hunt_key(h)))
+    unused = sorted(set(stats) - set(keys))
+    lines = [
+        "# Hunts unmatched against 2025 draw stats",
+        "",
+        f"{len(missing)} of {len(hunts)} hunts have no 2025 stats entry; "
+        f"{len(unused)} of {len(stats)} stats entries match no 2026-27 hunt.",
+        "",
+        "## Hunts without stats",
+        "",
+    ]
+    lines += [f"- {h['hunt_name']} ({h['category']}) — `{hunt_key(h)}`" for h in missing] or ["- none"]
+    lines += ["", "## Stats entries without a hunt", ""]
+    lines += [f"- `{key}`" for key in unused] or ["- none"]
+    return "\n".join(lines) + "\n"
+
+
 def format_date_label(start: datetime, end: datetime) -> str:
     if start.month == end.month and start.year == end.year:
         return f"{start.strftime('%b')} {start.day}-{end.day}, {start.year}"
@@ -476,97 +625,102 @@ def format_date_label(start: datetime, end: datetime) -> str:
     return f"{start.strftime('%b')} {start.day}, {start.year} – {end.strftime('%b')} {end.day}, {end.year}"
 
 
-def dates_overlap(a_start, a_end, b_start, b_end) -> bool:
-    return a_start <= b_end and b_start <= a_end
-
-
-def build_strategy(scored: list[dict], n: int = 5, max_drive_miles: float = 120) -> list[dict]:
-    """Build a diversified 5-hunt slate near The Camp when possible."""
-    adult = [
-        h
-        for h in scored
-        if h["category"] in {"archery", "gun", "primitive_weapon", "group"}
-    ]
-    nearby = [h for h in adult if (h.get("miles_drive") or 999) <= max_drive_miles]
-    pool = nearby if len(nearby) >= n else adult
-
-    def conflicts(hunt: dict, picks: list[dict]) -> bool:
-        return any(
-            dates_overlap(hunt["start_date"], hunt["end_date"], p["start_date"], p["end_date"])
-            for p in picks
-        )
-
-    def can_add(hunt: dict, picks: list[dict]) -> bool:
-        if hunt in picks or conflicts(hunt, picks):
-            return False
-        if any(p["wma_location"] == hunt["wma_location"] for p in picks):
-            return False
-        return True
-
-    def ranked(rows: list[dict]) -> list[dict]:
-        # Prefer higher decision score, then shorter drive from cabin.
-        return sorted(
-            rows,
-            key=lambda h: (-h["decision_score"], h.get("miles_drive") or 999),
-        )
-
-    picks: list[dict] = []
-
-    # 1) Best nearby peak-rut hunt
-    for hunt in ranked([h for h in pool if h["rut"]["period"] == "peak_rut"]):
-        if can_add(hunt, picks):
-            picks.append(hunt)
-            break
+def solve_slate(pool: list[dict], n: int, min_methods: int) -> list[dict]:
+    """Exact highest total decision_score slate of n hunts from pool.
 
-    # 2) Best nearby pre-peak / chasing hunt
-    for hunt in ranked([h for h in pool if h["rut"]["period"] == "pre_peak_rut"]):
-        if can_add(hunt, picks):
-            picks.append(hunt)
-            break
-
-    # 3) Best nearby sleeper (known low competition)
-    sleepers = sorted(
-        [
-            h
-            for h in pool
-            if h["apps_per_permit_2025"] is not None and h["apps_per_permit_2025"] <= 6
-        ],
-        key=lambda h: (h["apps_per_permit_2025"], -h["decision_score"], h.get("miles_drive") or 999),
+    Depth-first branch-and-bound over hunts in score order. A branch is cut
+    as soon as its picks plus the next best remaining scores cannot beat the
+    best slate found so far, or the WMAs still reachable cannot fill it, or
+    the categories still reachable cannot reach min_methods (capped at n and
+    at the categories in pool). Picks come back in score order; [] if nothing
+    is feasible.
+    """
+    rows = sorted(
+        pool,
+        key=lambda h: (-h["decision_score"], h.get("miles_drive") or 999, h["hunt_name"]),
     )
-    for hunt in sleepers:
-        if can_add(hunt, picks):
-            picks.append(hunt)
-            break
-
-    # 4) Fill remaining with decision score while diversifying methods
-    remaining = ranked(pool)
-    for hunt in remaining:
-        if len(picks) >= n:
-            break
-        if not can_add(hunt, picks):
-            continue
-        methods = {p["category"] for p in picks}
-        if hunt["category"] in methods and len(methods) < 3:
-            continue
-        if (
-            hunt["apps_per_permit_2025"] is not None
-            and hunt["apps_per_permit_2025"] > 25
-            and len(picks) < n - 1
-        ):
-            continue
-        picks.append(hunt)
-
-    # Final fill from nearby, then statewide if still short
-    for source in (remaining, ranked(adult)):
-        for hunt in source:
-            if len(picks) >= n:
-                break
-            if can_add(hunt, picks):
-                picks.append(hunt)
-        if len(picks) >= n:
-            break
-
-    return picks[:n]
+    # Whole cents keep the bound exact (no float drift between branches).
+    cents = [round(h["decision_score"] * 100) for h in rows]
+    spans = [(day_number(h["start_date"]), day_number(h["end_date"])) for h in rows]
+    index = IntervalIndex(spans, range(len(rows)))
+    clash: dict[int, int] = {}
+
+    def clashes(j: int) -> int:
+        # Bit k set when rows j and k share a day; built only for rows the search reaches.
+        if j not in clash:
+            mask = 0
+            for k in index.overlapping(*spans[j]):
+                mask |= 1 << k
+            clash[j] = mask
+        return clash[j]
+
+    wmas = [h["wma_location"] for h in rows]
+    cats = [h["category"] for h in rows]
+    prefix = [0]
+    for c in cents:
+        prefix.append(prefix[-1] + c)
+    last_index = {cat: i for i, cat in enumerate(cats)}
+    last_wma = {wma: i for i, wma in enumerate(wmas)}
+    min_methods = min(min_methods, n, len(last_index))
+
+    best_total = -1
+    best: list[int] = []
+    picks: list[int] = []
+
+    def search(i: int, total: int, taken: int, used_wmas: frozenset, used_cats: frozenset) -> None:
+        nonlocal best_total, best
+        need = n - len(picks)
+        if need == 0:
+            if total > best_total:
+                best_total, best = total, picks[:]
+            return
+        # Each pick needs a WMA not yet used that still appears at or after row i.
+        if sum(1 for wma, last in last_wma.items() if wma not in used_wmas and last >= i) < need:
+            return
+        missing = min_methods - len(used_cats)
+        if missing > 0:
+            reachable = sum(1 for cat, last in last_index.items() if cat not in used_cats and last >= i)
+            if reachable < missing:
+                return
+        for j in range(i, len(rows) - need + 1):
+            # Rows are score-ordered, so once j's bound fails every later j fails too.
+            if total + prefix[j + need] - prefix[j] <= best_total:
+                return
+            if wmas[j] in used_wmas:
+                continue
+            if clashes(j) & taken:
+                continue
+            cats_j = used_cats | {cats[j]}
+            if min_methods - len(cats_j) > need - 1:
+                continue
+            picks.append(j)
+            search(j + 1, total + cents[j], taken | 1 << j, used_wmas | {wmas[j]}, cats_j)
+            picks.pop()
+
+    search(0, 0, 0, frozenset(), frozenset())
+    return [rows[i] for i in best]
+
+
+def build_strategy(
+    scored: list[dict], n: int = 5, max_drive_miles: float = 120, min_methods: int = 3
+) -> list[dict]:
+    """Optimal diversified n-hunt slate near The Camp when possible.
+
+    Hard constraints: no overlapping dates, one hunt per WMA, at least
+    min_methods weapon categories and every hunt within max_drive_miles.
+    Falls back to statewide, then to fewer hunts, if that is infeasible.
+    """
+    adult = [h for h in scored if h["category"] in ADULT_CATEGORIES]
+    nearby = [h for h in adult if (h.get("miles_drive") or 999) <= max_drive_miles]
+    for pool in (nearby, adult):
+        slate = solve_slate(pool, n, min_methods)
+        if slate:
+            return slate
+    for size in range(n - 1, 0, -1):
+        slate = solve_slate(adult, size, min_methods)
+        if slate:
+            return slate
+    return []
 
 
 def load_cabin_locations() -> dict:
@@ -576,17 +730,25 @@ def load_cabin_locations() -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def attach_distance(hunt: dict, cabin_data: dict) -> dict:
-    locs = cabin_data.get("locations", {})
-    info = locs.get(hunt["wma_location"])
-    if not info:
+def cabin_drive_matrix(cabin_data: dict) -> DriveMatrix:
+    """Home plus every cabin location, with the measured OSRM routes pinned."""
+    if "home" not in cabin_data:
+        return DriveMatrix({})
+    places = {"home": cabin_data["home"], **cabin_data.get("locations", {})}
+    return DriveMatrix(places, load_pins(OUT_DATA / "locations_from_cabin.json"), origins=["home"])
+
+
+def attach_distance(hunt: dict, drive: DriveMatrix) -> dict:
+    wma = hunt["wma_location"]
+    if "home" not in drive or wma not in drive:
         hunt["miles_drive"] = None
         hunt["minutes_drive"] = None
         hunt["miles_straight"] = None
         return hunt
-    hunt["miles_drive"] = info.get("miles_drive")
-    hunt["minutes_drive"] = info.get("minutes_drive")
-    hunt["miles_straight"] = info.get("miles_straight")
+    miles, minutes = drive.route("home", wma)
+    hunt["miles_drive"] = round(miles, 1)
+    hunt["minutes_drive"] = int(round(minutes))
+    hunt["miles_straight"] = round(drive.straight_miles("home", wma), 1)
     return hunt
 
 
@@ -615,6 +777,11 @@ def serialize_hunt(h: dict) -> dict:
         "competition_score": h["competition_score"],
         "applications_2025": h["applications_2025"],
         "apps_per_permit_2025": h["apps_per_permit_2025"],
+        "apps_per_permit_trend": h["apps_per_permit_trend"],
+        "applications_forecast": h["applications_forecast"],
+        "applications_forecast_low": h["applications_forecast_low"],
+        "applications_forecast_high": h["applications_forecast_high"],
+        "apps_per_permit_forecast": h["apps_per_permit_forecast"],
         "miles_drive": h.get("miles_drive"),
         "minutes_drive": h.get("minutes_drive"),
         "miles_straight": h.get("miles_straight"),
@@ -639,202 +806,267 @@ def write_csv(path: Path, rows: list[dict]) -> None:
         "competition_label",
         "apps_per_permit_2025",
         "applications_2025",
+        "apps_per_permit_forecast",
+        "applications_forecast",
     ]
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        for h in rows:
-            writer.writerow(
-                {
-                    "hunt_name": h["hunt_name"],
-                    "hunt_type": h["hunt_type"],
-                    "wma_location": h["wma_location"],
-                    "start_date": h["start_date_iso"],
-                    "end_date": h["end_date_iso"],
-                    "permits_available": h["permits_available"],
-                    "duration_days": h["duration_days"],
-                    "decision_score": h["decision_score"],
-                    "quality_score": h["quality_score"],
-                    "rut_label": h["rut"]["description"],
-                    "moon_label": h["moon"]["description"],
-                    "competition_label": h["competition_label"],
-                    "apps_per_permit_2025": h["apps_per_permit_2025"],
-                    "applications_2025": h["applications_2025"],
-                }
-            )
-
-
-def main() -> None:
-    OUT_DATA.mkdir(parents=True, exist_ok=True)
-    OUT_REPORTS.mkdir(parents=True, exist_ok=True)
-    WEB_DATA.mkdir(parents=True, exist_ok=True)
-
-    all_hunts: list[dict] = []
-    for category, (filename, hunt_type) in PDF_MAP.items():
-        text = pdf_text(RAW / filename)
-        parsed = parse_schedule_lines(text, hunt_type=hunt_type, category=category)
-        print(f"Parsed {category}: {len(parsed)} hunts")
-        all_hunts.extend(parsed)
-
-    stats_text = pdf_text(RAW / "stats_2025.pdf")
-    stats = parse_stats(stats_text)
-    print(f"Parsed historical stats entries: {len(stats)}")
-
-    cabin_data = load_cabin_locations()
-    scored = [attach_distance(score_hunt(h, stats), cabin_data) for h in all_hunts]
-    scored.sort(key=lambda h: h["decision_score"], reverse=True)
-
-    # Category CSVs
-    for category in PDF_MAP:
-        rows = [h for h in scored if h["category"] == category]
-        write_csv(OUT_DATA / f"deer_{category}_hunts_2026_27.csv", rows)
-
-    write_csv(OUT_DATA / "deer_all_hunts_2026_27_scored.csv", scored)
-
-    adult = [h for h in scored if h["category"] in {"archery", "gun", "primitive_weapon", "group"}]
-    strategy = build_strategy(adult, n=5)
-
-    by_category = {}
-    for cat in ["archery", "gun", "primitive_weapon", "group", "youth", "senior"]:
-        subset = [h for h in scored if h["category"] == cat]
-        by_category[cat] = [serialize_hunt(h) for h in subset[:8]]
-
-    peak = [h for h in adult if h["rut"]["period"] == "peak_rut"]
-    peak.sort(key=lambda h: h["decision_score"], reverse=True)
+    buf = io.StringIO(newline="")
+    writer = csv.DictWriter(buf, fieldnames=fields)
+    writer.writeheader()
+    for h in rows:
+        writer.writerow(
+            {
+                "hunt_name": h["hunt_name"],
+                "hunt_type": h["hunt_type"],
+                "wma_location": h["wma_location"],
+                "start_date": h["start_date_iso"],
+                "end_date": h["end_date_iso"],
+                "permits_available": h["permits_available"],
+                "duration_days": h["duration_days"],
+                "decision_score": h["decision_score"],
+                "quality_score": h["quality_score"],
+                "rut_label": h["rut"]["description"],
+                "moon_label": h["moon"]["description"],
+                "competition_label": h["competition_label"],
+                "apps_per_permit_2025": h["apps_per_permit_2025"],
+                "applications_2025": h["applications_2025"],
+                "apps_per_permit_forecast": h["apps_per_permit_forecast"],
+                "applications_forecast": h["applications_forecast"],
+            }
+        )
+    write_text_atomic(path, buf.getvalue(), newline="")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Score the 2026-27 draw hunts and write the decision data.")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_REPORT, type=Path, metavar="PATH",
+                        help="record wall/CPU time and peak memory per stage as JSON "
+                             f"(default {PROFILE_REPORT.relative_to(ROOT)})")
+    parser.add_argument("--profile-dump", type=Path, metavar="PATH",
+                        help="also write a cProfile of the slowest stage here")
+    args = parser.parse_args(argv)
+    profiler = StageProfiler(args.profile is not None, args.profile_dump)
+
+    with profiler.stage("discovery"):
+        OUT_DATA.mkdir(parents=True, exist_ok=True)
+        OUT_REPORTS.mkdir(parents=True, exist_ok=True)
+        WEB_DATA.mkdir(parents=True, exist_ok=True)
+
+        cabin_data = load_cabin_locations()
+        drive = cabin_drive_matrix(cabin_data)
+
+    # PDF text streams through: the pool extracts a few pages ahead while the
+    # parser consumes lines, and each hunt is scored as soon as it is parsed.
+    # Only the scored hunt records are kept, since the CSVs and the slate are
+    # ranked across all of them. Under --profile, pulling the next hunt (PDF
+    # text plus line parsing) counts as read and scoring it as scoring.
+    scored: list[dict] = []
+    with ProcessPoolExecutor() as pool:
+        with profiler.stage("stats"), DrawHistory() as history:
+            ingest_stats(history, pool)
+            season = history.latest_season()
+            trends = history.area_trends()
+            models = fit_areas(history.area_rows())
+            stats = {
+                key: stats_entry(apps, quota, forecast(
+                    apps, models.get(area_key(key)), TARGET_SEASON, season))
+                for key, (apps, quota) in history.hunt_stats(season).items()
+            }
+        print(f"Historical stats: {len(stats)} hunts from {season}, trends for {len(trends)} areas, "
+              f"forecast models for {len(models)}")
+        for category, (filename, hunt_type) in PDF_MAP.items():
+            before = len(scored)
+            hunts = parse_schedule_lines(pdf_lines(RAW / filename, pool), hunt_type, category)
+            for hunt in profiler.iterate("read", hunts):
+                with profiler.stage("scoring"):
+                    scored.append(attach_distance(score_hunt(hunt, stats, trends), drive))
+            print(f"Parsed {category}: {len(scored) - before} hunts")
+    print(f"Hunts without 2025 stats: {sum(h['applications_2025'] is None for h in scored)}")
+    with profiler.stage("scoring"):
+        scored.sort(key=lambda h: h["decision_score"], reverse=True)
+
+    with profiler.stage("write"):
+        # Category CSVs
+        for category in PDF_MAP:
+            rows = [h for h in scored if h["category"] == category]
+            write_csv(OUT_DATA / f"deer_{category}_hunts_2026_27.csv", rows)
+
+        write_csv(OUT_DATA / "deer_all_hunts_2026_27_scored.csv", scored)
+
+    with profiler.stage("conflicts"):
+        adult = [h for h in scored if h["category"] in ADULT_CATEGORIES]
+        strategy = build_strategy(adult, n=5)
+        ratios = sorted(h["apps_per_permit_2025"] for h in adult if h["apps_per_permit_2025"] is not None)
+
+    with profiler.stage("draw_odds"):
+        odds = simulate_slate(strategy, unmatched_ratio=ratios[len(ratios) // 2] if ratios else 5.0)
+
+    with profiler.stage("aggregation"):
+        by_category = {}
+        for cat in ["archery", "gun", "primitive_weapon", "group", "youth", "senior"]:
+            subset = [h for h in scored if h["category"] == cat]
+            by_category[cat] = [serialize_hunt(h) for h in subset[:8]]
+
+        peak = [h for h in adult if h["rut"]["period"] == "peak_rut"]
+        peak.sort(key=lambda h: h["decision_score"], reverse=True)
+
+        sleeper = [
+            h
+            for h in adult
+            if h["apps_per_permit_2025"] is not None
+            and h["apps_per_permit_2025"] <= 8
+            and h["rut"]["score"] >= 3
+            and h["decision_score"] >= 3.2
+        ]
+        sleeper.sort(key=lambda h: (h["apps_per_permit_2025"], -h["decision_score"]))
 
-    sleeper = [
-        h
-        for h in adult
-        if h["apps_per_permit_2025"] is not None
-        and h["apps_per_permit_2025"] <= 8
-        and h["rut"]["score"] >= 3
-        and h["decision_score"] >= 3.2
-    ]
-    sleeper.sort(key=lambda h: (h["apps_per_permit_2025"], -h["decision_score"]))
-
-    premium = [
-        h
-        for h in adult
-        if h["rut"]["score"] >= 4 and h["permits_available"] >= 12
-    ][:12]
-
-    locations = sorted({h["wma_location"] for h in scored})
-    home = cabin_data.get(
-        "home",
-        {
-            "name": "The Camp",
-            "address": "1149 Watertower Rd, Bentonia, MS",
-            "lat": 32.6505,
-            "lon": -90.3648,
-        },
-    )
-    summary = {
-        "brand": "Delta Draw Hunts",
-        "season": "2026-27",
-        "generated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "home_base": home,
-        "application_window": {
-            "opens": "2026-07-15",
-            "closes": "2026-08-15",
-            "note": "Apply online via MDWFP license system; up to 5 ranked hunt selections.",
-        },
-        "sources": {
-            "schedules": [
-                "WMA Archery Deer Draw Hunts (2026)",
-                "WMA Gun Deer Draw Hunts (2026)",
-                "WMA Primitive Weapon Deer Draw Hunts (2026)",
-                "WMA Group Deer Draw Hunts (2026)",
-                "WMA Youth Deer Draw Hunts (2026)",
-                "WMA Senior Deer Draw Hunts (2026)",
-            ],
-            "competition": "WMA Deer Draw Stats (2025)",
-            "rut_region": "Yazoo County / Mississippi Delta peak rut Dec 29 – Jan 4",
-            "distances": "Driving miles/minutes from The Camp via OSRM road network",
-        },
-        "totals": {
-            "hunts": len(scored),
-            "permits": sum(h["permits_available"] for h in scored),
-            "locations": len(locations),
-            "by_category": {
-                cat: len([h for h in scored if h["category"] == cat]) for cat in PDF_MAP
+        premium = [
+            h
+            for h in adult
+            if h["rut"]["score"] >= 4 and h["permits_available"] >= 12
+        ][:12]
+
+        locations = sorted({h["wma_location"] for h in scored})
+        home = cabin_data.get(
+            "home",
+            {
+                "name": "The Camp",
+                "address": "1149 Watertower Rd, Bentonia, MS",
+                "lat": 32.6505,
+                "lon": -90.3648,
             },
-        },
-        "nearby": {
-            "within_60": len([h for h in scored if (h.get("miles_drive") or 999) <= 60]),
-            "within_90": len([h for h in scored if (h.get("miles_drive") or 999) <= 90]),
-            "within_120": len([h for h in scored if (h.get("miles_drive") or 999) <= 120]),
-        },
-        "peak_rut": {
-            "window": "Dec 29, 2026 – Jan 4, 2027",
-            "hunt_count": len(peak),
-            "top": [serialize_hunt(h) for h in peak[:6]],
-        },
-        "key_moons": [
-            {"date": "2026-10-10", "phase": "New Moon"},
-            {"date": "2026-11-09", "phase": "New Moon"},
-            {"date": "2026-12-09", "phase": "New Moon"},
-            {"date": "2027-01-07", "phase": "New Moon"},
-        ],
-        "strategy": [serialize_hunt(h) for h in strategy],
-        "top_overall": [serialize_hunt(h) for h in adult[:15]],
-        "top_by_category": by_category,
-        "premium_window": [serialize_hunt(h) for h in premium],
-        "sleeper_picks": [serialize_hunt(h) for h in sleeper[:10]],
-        "locations": locations,
-        "hunts": [serialize_hunt(h) for h in scored],
-    }
-
-    decision_path = WEB_DATA / "decision_2026_27.json"
-    decision_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-    # Also mirror for GitHub Pages root convenience
-    (ROOT / "decision_2026_27.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
-
-    # Markdown report
-    lines = [
-        "# Mississippi WMA Deer Draw Analysis — 2026-27",
-        "",
-        f"**Generated:** {summary['generated_at']}",
-        f"**Application window:** July 15 – August 15, 2026",
-        f"**Hunts scored:** {summary['totals']['hunts']} across {summary['totals']['locations']} locations",
-        f"**Permit seats represented:** {summary['totals']['permits']}",
-        "",
-        "## Scoring model",
-        "",
-        "- **Rut timing (35%)** — Yazoo/Delta peak rut Dec 29 – Jan 4",
-        "- **Moon phase (20%)** — New moon preferred; full moon penalized",
-        "- **Duration (15%)** — Longer hunts score higher",
-        "- **Permit volume (10%)** — More seats help absolute access",
-        "- **Historical draw odds (30%)** — Inverse of 2025 apps-per-permit",
-        "",
-        "## Recommended 5-hunt application slate",
-        "",
-    ]
-    for i, h in enumerate(strategy, 1):
-        odds = (
-            f"{h['apps_per_permit_2025']} apps/permit in 2025"
-            if h["apps_per_permit_2025"] is not None
-            else "no 2025 match (new/unmatched)"
-        )
-        lines.append(
-            f"{i}. **{h['hunt_name']}** — {h['date_label']} · {h['permits_available']} permits · "
-            f"score {h['decision_score']} · {h['rut']['description']} · {h['competition_label']} competition ({odds})"
         )
+        summary = {
+            "brand": "Delta Draw Hunts",
+            "season": "2026-27",
+            "generated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "home_base": home,
+            "application_window": {
+                "opens": "2026-07-15",
+                "closes": "2026-08-15",
+                "note": "Apply online via MDWFP license system; up to 5 ranked hunt selections.",
+            },
+            "sources": {
+                "schedules": [
+                    "WMA Archery Deer Draw Hunts (2026)",
+                    "WMA Gun Deer Draw Hunts (2026)",
+                    "WMA Primitive Weapon Deer Draw Hunts (2026)",
+                    "WMA Group Deer Draw Hunts (2026)",
+                    "WMA Youth Deer Draw Hunts (2026)",
+                    "WMA Senior Deer Draw Hunts (2026)",
+                ],
+                "competition": "WMA Deer Draw Stats (2025); area trends and 2026 forecast "
+                               "from WMA Deer Draw Hunts (2024-25) and 2020-2024 applications",
+                "rut_region": "Yazoo County / Mississippi Delta peak rut Dec 29 – Jan 4",
+                "distances": "Driving miles/minutes from The Camp via OSRM road network",
+            },
+            "totals": {
+                "hunts": len(scored),
+                "permits": sum(h["permits_available"] for h in scored),
+                "locations": len(locations),
+                "by_category": {
+                    cat: len([h for h in scored if h["category"] == cat]) for cat in PDF_MAP
+                },
+            },
+            "nearby": {
+                "within_60": len([h for h in scored if (h.get("miles_drive") or 999) <= 60]),
+                "within_90": len([h for h in scored if (h.get("miles_drive") or 999) <= 90]),
+                "within_120": len([h for h in scored if (h.get("miles_drive") or 999) <= 120]),
+            },
+            "peak_rut": {
+                "window": "Dec 29, 2026 – Jan 4, 2027",
+                "hunt_count": len(peak),
+                "top": [serialize_hunt(h) for h in peak[:6]],
+            },
+            "key_moons": [
+                {"date": "2026-10-10", "phase": "New Moon"},
+                {"date": "2026-11-09", "phase": "New Moon"},
+                {"date": "2026-12-09", "phase": "New Moon"},
+                {"date": "2027-01-07", "phase": "New Moon"},
+            ],
+            "strategy": [
+                {**serialize_hunt(h), "draw_probability": o["probability"]}
+                for h, o in zip(strategy, odds["hunts"])
+            ],
+            "strategy_odds": {
+                "trials": odds["trials"],
+                "expected_drawn": odds["expected_drawn"],
+                "p_at_least_one": odds["p_at_least_one"],
+                "drawn_distribution": odds["drawn_distribution"],
+            },
+            "top_overall": [serialize_hunt(h) for h in adult[:15]],
+            "top_by_category": by_category,
+            "premium_window": [serialize_hunt(h) for h in premium],
+            "sleeper_picks": [serialize_hunt(h) for h in sleeper[:10]],
+            "locations": locations,
+            "hunts": [serialize_hunt(h) for h in scored],
+        }
 
-    lines += ["", "## Peak rut opportunities", ""]
-    for h in peak[:8]:
-        lines.append(
-            f"- {h['hunt_name']} ({h['date_label']}) — score {h['decision_score']}, "
-            f"{h['competition_label']} competition"
-        )
+    with profiler.stage("serialization"):
+        decision_text = json.dumps(summary, indent=2)
+
+        # Markdown report
+        lines = [
+            "# Mississippi WMA Deer Draw Analysis — 2026-27",
+            "",
+            f"**Generated:** {summary['generated_at']}",
+            f"**Application window:** July 15 – August 15, 2026",
+            f"**Hunts scored:** {summary['totals']['hunts']} across {summary['totals']['locations']} locations",
+            f"**Permit seats represented:** {summary['totals']['permits']}",
+            "",
+            "## Scoring model",
+            "",
+            "- **Rut timing (35%)** — Yazoo/Delta peak rut Dec 29 – Jan 4",
+            "- **Moon phase (20%)** — New moon preferred; full moon penalized",
+            "- **Duration (15%)** — Longer hunts score higher",
+            "- **Permit volume (10%)** — More seats help absolute access",
+            "- **Historical draw odds (30%)** — Inverse of forecast 2026 apps-per-permit "
+            "(2025 applications grown by each WMA/method's multi-season trend)",
+            "",
+            "## Recommended 5-hunt application slate",
+            "",
+        ]
+        for i, (h, o) in enumerate(zip(strategy, odds["hunts"]), 1):
+            history = (
+                f"{h['apps_per_permit_2025']} apps/permit in 2025, "
+                f"{h['apps_per_permit_forecast']} forecast for 2026"
+                if h["apps_per_permit_2025"] is not None
+                else "no 2025 match (new/unmatched)"
+            )
+            lines.append(
+                f"{i}. **{h['hunt_name']}** — {h['date_label']} · {h['permits_available']} permits · "
+                f"score {h['decision_score']} · {h['rut']['description']} · {h['competition_label']} competition ({history})"
+                f" · {o['probability']:.0%} draw odds"
+            )
+        lines += [
+            "",
+            f"Expected hunts drawn: **{odds['expected_drawn']:.2f}** · "
+            f"chance of drawing at least one: **{odds['p_at_least_one']:.0%}**"
+            + (f" ({odds['trials']:,} simulated draws)" if odds["trials"] else ""),
+        ]
+
+        lines += ["", "## Peak rut opportunities", ""]
+        for h in peak[:8]:
+            lines.append(
+                f"- {h['hunt_name']} ({h['date_label']}) — score {h['decision_score']}, "
+                f"{h['competition_label']} competition"
+            )
 
-    lines += ["", "## Notable changes vs prior curated set", ""]
-    lines.append("- **Alligator WMA** added with six primitive weapon draws (36 permits each).")
-    lines.append("- Statewide inventory expanded (Canemount, Natchez, Hell Creek, Charles Ray Nix, Yockanookany, etc.).")
-    lines.append("- December 9, 2026 new moon falls in pre-peak chasing window — strong mid-December quality.")
-    lines.append("- Peak rut sits between Dec 24 full moon and Jan 7 new moon (last-quarter conditions).")
+        lines += ["", "## Notable changes vs prior curated set", ""]
+        lines.append("- **Alligator WMA** added with six primitive weapon draws (36 permits each).")
+        lines.append("- Statewide inventory expanded (Canemount, Natchez, Hell Creek, Charles Ray Nix, Yockanookany, etc.).")
+        lines.append("- December 9, 2026 new moon falls in pre-peak chasing window — strong mid-December quality.")
+        lines.append("- Peak rut sits between Dec 24 full moon and Jan 7 new moon (last-quarter conditions).")
+        unmatched_text = unmatched_report(scored, stats)
 
+    decision_path = WEB_DATA / "decision_2026_27.json"
     report_path = OUT_REPORTS / "analysis_2026_27.md"
-    report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    unmatched_path = OUT_REPORTS / "unmatched_stats_2026_27.md"
+    with profiler.stage("write"):
+        write_text_atomic(decision_path, decision_text)
+        # Also mirror for GitHub Pages root convenience
+        write_text_atomic(ROOT / "decision_2026_27.json", decision_text)
+        write_text_atomic(report_path, "\n".join(lines) + "\n")
+        write_text_atomic(unmatched_path, unmatched_text)
 
     print("\n=== TOP 10 DECISION SCORES (adult) ===")
     for h in adult[:10]:
@@ -842,10 +1074,13 @@ def main() -> None:
             f"{h['decision_score']:4.2f} | {h['date_label']:28} | {h['competition_label']:12} | {h['hunt_name']}"
         )
     print("\n=== STRATEGY ===")
-    for i, h in enumerate(strategy, 1):
-        print(f"{i}. {h['hunt_name']} | {h['date_label']} | {h['decision_score']}")
+    for i, (h, o) in enumerate(zip(strategy, odds["hunts"]), 1):
+        print(f"{i}. {h['hunt_name']} | {h['date_label']} | {h['decision_score']} | {o['probability']:.1%} odds")
+    print(f"Expected drawn: {odds['expected_drawn']:.2f} | P(at least one): {odds['p_at_least_one']:.1%}")
     print(f"\nWrote {decision_path}")
     print(f"Wrote {report_path}")
+    print(f"Wrote {unmatched_path}")
+    profiler.finish(args.profile, "build_2026_decision_data")
 
 
 if __name__ == "__main__":
@@ -4,62 +4,19 @@ Balances hunt quality with location/method diversification
 """
 
 import csv
+import sys
 from datetime import datetime
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hunt_scoring import moon_score_for, rut_score_for
 
 def load_and_score_hunts():
     """Load all hunts and calculate scores."""
     all_hunts = []
     
-    # Moon phases
-    moon_phases = {
-        'Oct_6_2025': {'date': datetime(2025, 10, 6), 'phase': 'Full', 'impact': -1},
-        'Oct_13_2025': {'date': datetime(2025, 10, 13), 'phase': 'Third Quarter', 'impact': 1},
-        'Oct_21_2025': {'date': datetime(2025, 10, 21), 'phase': 'New', 'impact': 3},
-        'Oct_29_2025': {'date': datetime(2025, 10, 29), 'phase': 'First Quarter', 'impact': 1},
-        'Nov_5_2025': {'date': datetime(2025, 11, 5), 'phase': 'Full', 'impact': -1},
-        'Nov_11_2025': {'date': datetime(2025, 11, 11), 'phase': 'Third Quarter', 'impact': 1},
-        'Nov_20_2025': {'date': datetime(2025, 11, 20), 'phase': 'New', 'impact': 3},
-        'Nov_28_2025': {'date': datetime(2025, 11, 28), 'phase': 'First Quarter', 'impact': 1},
-        'Dec_4_2025': {'date': datetime(2025, 12, 4), 'phase': 'Full', 'impact': -1},
-        'Dec_11_2025': {'date': datetime(2025, 12, 11), 'phase': 'Third Quarter', 'impact': 1},
-        'Dec_19_2025': {'date': datetime(2025, 12, 19), 'phase': 'New', 'impact': 3},
-        'Dec_27_2025': {'date': datetime(2025, 12, 27), 'phase': 'First Quarter', 'impact': 1},
-        'Jan_13_2026': {'date': datetime(2026, 1, 13), 'phase': 'Full', 'impact': -1},
-        'Jan_20_2026': {'date': datetime(2026, 1, 20), 'phase': 'New', 'impact': 3},
-    }
-    
-    # Rut periods
-    rut_periods = {
-        'pre_rut': {'start': datetime(2025, 10, 1), 'end': datetime(2025, 12, 15), 'score': 3},
-        'pre_peak_rut': {'start': datetime(2025, 12, 16), 'end': datetime(2025, 12, 28), 'score': 4},
-        'peak_rut': {'start': datetime(2025, 12, 29), 'end': datetime(2026, 1, 4), 'score': 5},
-        'post_rut': {'start': datetime(2026, 1, 5), 'end': datetime(2026, 1, 20), 'score': 3}
-    }
-    
-    def calculate_moon_score(start_date, end_date):
-        hunt_midpoint = start_date + (end_date - start_date) / 2
-        best_score = -2
-        for phase_data in moon_phases.values():
-            days_diff = abs((hunt_midpoint - phase_data['date']).days)
-            if days_diff <= 2:
-                phase_score = phase_data['impact']
-            elif days_diff <= 4:
-                phase_score = phase_data['impact'] * 0.7
-            elif days_diff <= 7:
-                phase_score = phase_data['impact'] * 0.4
-            else:
-                phase_score = 0
-            best_score = max(best_score, phase_score)
-        return max(0, best_score)
-    
-    def calculate_rut_score(start_date, end_date):
-        hunt_midpoint = start_date + (end_date - start_date) / 2
-        for period_data in rut_periods.values():
-            if period_data['start'] <= hunt_midpoint <= period_data['end']:
-                return period_data['score']
-        return 1
-    
     def calculate_combined_score(hunt):
         permit_score = min(hunt['permits_available'] / 5, 5)
         duration_score = min(hunt['duration_days'], 4)
@@ -87,8 +44,8 @@ def load_and_score_hunts():
                     row['duration_days'] = int(row['duration_days'])
                     row['hunt_method'] = hunt_type
                     
-                    row['moon_score'] = calculate_moon_score(row['start_date'], row['end_date'])
-                    row['rut_score'] = calculate_rut_score(row['start_date'], row['end_date'])
+                    row['moon_score'] = max(0, moon_score_for(row['start_date'], row['end_date'])['score'])
+                    row['rut_score'] = rut_score_for(row['start_date'], row['end_date'])['score']
                     row['combined_score'] = calculate_combined_score(row)
                     
                     all_hunts.append(row)
@@ -6,80 +6,23 @@ deer rut timing, and traditional metrics for Yazoo County, Mississippi region.
 """
 
 import csv
+import sys
 from datetime import datetime
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hunt_scoring import moon_score_for, rut_score_for
 
 class EnhancedDrawHuntAnalyzer:
     def __init__(self, data_file=None):
         """Initialize the analyzer with hunt data."""
         self.data_file = data_file
         self.hunts = []
-        self.moon_phases = self._load_moon_phases()
-        self.rut_periods = self._load_rut_periods()
         if data_file:
             self.load_data(data_file)
     
-    def _load_moon_phases(self):
-        """Load 2025-2026 moon phase data for analysis."""
-        return {
-            # October 2025
-            'Oct_6_2025': {'date': datetime(2025, 10, 6), 'phase': 'Full', 'impact': -1},
-            'Oct_13_2025': {'date': datetime(2025, 10, 13), 'phase': 'Third Quarter', 'impact': 1},
-            'Oct_21_2025': {'date': datetime(2025, 10, 21), 'phase': 'New', 'impact': 3},
-            'Oct_29_2025': {'date': datetime(2025, 10, 29), 'phase': 'First Quarter', 'impact': 1},
-            
-            # November 2025
-            'Nov_5_2025': {'date': datetime(2025, 11, 5), 'phase': 'Full', 'impact': -1},
-            'Nov_11_2025': {'date': datetime(2025, 11, 11), 'phase': 'Third Quarter', 'impact': 1},
-            'Nov_20_2025': {'date': datetime(2025, 11, 20), 'phase': 'New', 'impact': 3},
-            'Nov_28_2025': {'date': datetime(2025, 11, 28), 'phase': 'First Quarter', 'impact': 1},
-            
-            # December 2025
-            'Dec_4_2025': {'date': datetime(2025, 12, 4), 'phase': 'Full', 'impact': -1},
-            'Dec_11_2025': {'date': datetime(2025, 12, 11), 'phase': 'Third Quarter', 'impact': 1},
-            'Dec_19_2025': {'date': datetime(2025, 12, 19), 'phase': 'New', 'impact': 3},
-            'Dec_27_2025': {'date': datetime(2025, 12, 27), 'phase': 'First Quarter', 'impact': 1},
-            
-            # January 2026
-            'Jan_13_2026': {'date': datetime(2026, 1, 13), 'phase': 'Full', 'impact': -1},
-            'Jan_20_2026': {'date': datetime(2026, 1, 20), 'phase': 'New', 'impact': 3},
-        }
-    
-    def _load_rut_periods(self):
-        """Load Yazoo County, Mississippi deer rut timing data."""
-        return {
-            'pre_rut': {
-                'start': datetime(2025, 10, 1),
-                'end': datetime(2025, 12, 15),
-                'score': 3,
-                'description': 'Pre-Rut (Building Activity)'
-            },
-            'pre_peak_rut': {
-                'start': datetime(2025, 12, 16),
-                'end': datetime(2025, 12, 28),
-                'score': 4,
-                'description': 'Pre-Peak Rut (Chasing Activity)'
-            },
-            'peak_rut': {
-                'start': datetime(2025, 12, 29),
-                'end': datetime(2026, 1, 4),
-                'score': 5,
-                'description': 'Peak Rut (Prime Time)'
-            },
-            'post_rut': {
-                'start': datetime(2026, 1, 5),
-                'end': datetime(2026, 1, 20),
-                'score': 3,
-                'description': 'Post-Rut (Recovery Period)'
-            },
-            'late_season': {
-                'start': datetime(2026, 1, 21),
-                'end': datetime(2026, 1, 31),
-                'score': 2,
-                'description': 'Late Season (Food Focus)'
-            }
-        }
-    
     def load_data(self, file_path):
         """Load hunt data from CSV file."""
         try:
@@ -92,8 +35,8 @@ class EnhancedDrawHuntAnalyzer:
                     row['duration_days'] = int(row['duration_days'])
                     
                     # Add enhanced scoring
-                    row['moon_score'] = self._calculate_moon_score(row['start_date'], row['end_date'])
-                    row['rut_score'] = self._calculate_rut_score(row['start_date'], row['end_date'])
+                    row['moon_score'] = moon_score_for(row['start_date'], row['end_date'])
+                    row['rut_score'] = rut_score_for(row['start_date'], row['end_date'])
                     row['combined_score'] = self._calculate_combined_score(row)
                     
                     self.hunts.append(row)
@@ -101,56 +44,6 @@ class EnhancedDrawHuntAnalyzer:
         except Exception as e:
             print(f"Error loading data: {e}")
     
-    def _calculate_moon_score(self, start_date, end_date):
-        """Calculate moon phase impact score for hunt dates."""
-        hunt_midpoint = start_date + (end_date - start_date) / 2
-        
-        best_score = -2  # Worst case (full moon)
-        closest_phase = None
-        
-        for phase_key, phase_data in self.moon_phases.items():
-            moon_date = phase_data['date']
-            days_diff = abs((hunt_midpoint - moon_date).days)
-            
-            # Moon phase impact decreases with distance
-            if days_diff <= 2:
-                phase_score = phase_data['impact']
-            elif days_diff <= 4:
-                phase_score = phase_data['impact'] * 0.7
-            elif days_diff <= 7:
-                phase_score = phase_data['impact'] * 0.4
-            else:
-                phase_score = 0
-            
-            if phase_score > best_score:
-                best_score = phase_score
-                closest_phase = phase_data['phase']
-        
-        return {
-            'score': round(best_score, 1),
-            'closest_phase': closest_phase,
-            'description': self._get_moon_description(best_score)
-        }
-    
-    def _calculate_rut_score(self, start_date, end_date):
-        """Calculate rut timing score for hunt dates."""
-        hunt_midpoint = start_date + (end_date - start_date) / 2
-        
-        for period_name, period_data in self.rut_periods.items():
-            if period_data['start'] <= hunt_midpoint <= period_data['end']:
-                return {
-                    'score': period_data['score'],
-                    'period': period_name,
-                    'description': period_data['description']
-                }
-        
-        # Default if no period matches
-        return {
-            'score': 1,
-            'period': 'transition',
-            'description': 'Transition Period'
-        }
-    
     def _calculate_combined_score(self, hunt):
         """Calculate overall hunt quality score."""
         # Base factors
@@ -171,17 +64,6 @@ class EnhancedDrawHuntAnalyzer:
         
         return round(total_score, 2)
     
-    def _get_moon_description(self, score):
-        """Get description for moon score."""
-        if score >= 2.5:
-            return "Excellent (New Moon Period)"
-        elif score >= 1:
-            return "Good (Quarter Moon)"
-        elif score >= 0:
-            return "Fair (Neutral)"
-        else:
-            return "Poor (Full Moon Period)"
-    
     def get_top_hunts_by_combined_score(self, top_n=15):
         """Get best hunts based on combined moon/rut/permit scoring."""
         if not self.hunts:
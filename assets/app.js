@@ -3,6 +3,271 @@
   "use strict";
 
   const DATA = window.HUNT_DATA;
+
+  /* ── Data ──────────────────────────────────────────────────────────── */
+  // data.js ships hunts as columns (interned strings are indexes into dicts);
+  // the drawer-only fields sit in assets/detail/ shards loaded on first open.
+  // An older data.js with a plain array of full rows still works as-is.
+  function hydrate(core) {
+    if (Array.isArray(core)) return core.map((h, row) => ({ ...h, row, detailLoaded: true }));
+    const fields = Object.entries(core.columns);
+    return Array.from({ length: core.count }, (_, row) => {
+      const h = { row, detailLoaded: false };
+      for (const [f, col] of fields) h[f] = core.dicts[f] ? core.dicts[f][col[row]] : col[row];
+      return h;
+    });
+  }
+
+  DATA.hunts = hydrate(DATA.hunts);
+  // The plan layer rides on DATA.planned rather than on every hunt row.
+  const PLANNED_BY_NAME = new Map((DATA.planned || []).map((p) => [p.name, p]));
+  DATA.hunts.forEach((h) => {
+    const p = PLANNED_BY_NAME.get(h.name);
+    if (p) { h.planned = true; h.conflictsWith = p.conflictsWith; }
+  });
+
+  // Sort and filter keys as typed arrays; entry i belongs to DATA.hunts[i].
+  // Decoded from assets/packed.js when its digest matches this data.js, else
+  // built from the rows. Uint16 0xFFFF is an unpublished permit count.
+  const TYPED = { f32: Float32Array, u16: Uint16Array, u8: Uint8Array };
+  const NO_VALUE = 0xFFFF;
+
+  function unpack(p) {
+    const bin = atob(p.data);
+    const bytes = new Uint8Array(bin.length);
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    const cols = { count: p.count, baseDay: p.baseDay, dicts: p.dicts };
+    for (const [f, [type, offset]] of Object.entries(p.columns)) {
+      cols[f] = new TYPED[type](bytes.buffer, offset, p.count);
+    }
+    return cols;
+  }
+
+  function packRows(hunts) {
+    const n = hunts.length;
+    const dayOf = (iso) => Date.UTC(+iso.slice(0, 4), +iso.slice(5, 7) - 1, +iso.slice(8, 10)) / 86400000;
+    const baseDay = hunts.reduce((m, h) => Math.min(m, dayOf(h.start)), n ? Infinity : 0);
+    const cols = {
+      count: n, baseDay, dicts: { type: [], wma: [], month: [] },
+      score: new Float32Array(n), start: new Uint16Array(n), end: new Uint16Array(n),
+      driveMinutes: new Uint16Array(n), permits: new Uint16Array(n),
+      type: new Uint16Array(n), wma: new Uint16Array(n), month: new Uint16Array(n)
+    };
+    const codes = { type: new Map(), wma: new Map(), month: new Map() };
+    const code = (f, v) => {
+      if (!codes[f].has(v)) { codes[f].set(v, cols.dicts[f].length); cols.dicts[f].push(v); }
+      return codes[f].get(v);
+    };
+    hunts.forEach((h, i) => {
+      cols.score[i] = h.score ?? NaN;
+      cols.start[i] = dayOf(h.start) - baseDay;
+      cols.end[i] = dayOf(h.end) - baseDay;
+      cols.driveMinutes[i] = h.driveMinutes;
+      cols.permits[i] = h.permits ?? NO_VALUE;
+      cols.type[i] = code("type", h.type);
+      cols.wma[i] = code("wma", h.wma);
+      cols.month[i] = code("month", h.start.slice(0, 7));
+    });
+    return cols;
+  }
+
+  const PACKED = window.HUNT_PACKED;
+  const COLS = PACKED && DATA.packed && PACKED.digest === DATA.packed && PACKED.count === DATA.hunts.length
+    ? unpack(PACKED) : packRows(DATA.hunts);
+
+  // Peak-rut flags for the stat strip, alongside the packed columns.
+  COLS.peak = Uint8Array.from(DATA.hunts, (h) => (h.rutPhase === "Peak Rut" ? 1 : 0));
+
+  // The search box runs on the inverted index in DATA.search (see search_index
+  // in build_app_data.py); an older data.js gets the same index built here.
+  function buildIndex(hunts) {
+    const fields = ["name", "wma", "county", "type", "restriction", "notes", "rutPhase", "moonPhase"];
+    const byToken = new Map();
+    hunts.forEach((h, row) => {
+      const text = fields.map((f) => h[f] ?? "").join(" ").toLowerCase();
+      for (const token of new Set(text.match(/[a-z0-9]+/g))) {
+        if (!byToken.has(token)) byToken.set(token, []);
+        byToken.get(token).push(row);
+      }
+    });
+    const tokens = [...byToken.keys()].sort();
+    const trigrams = {};
+    tokens.forEach((token, t) => {
+      for (let i = 0; i + 3 <= token.length; i++) {
+        const gram = token.slice(i, i + 3);
+        const list = (trigrams[gram] ||= []);
+        if (list[list.length - 1] !== t) list.push(t);
+      }
+    });
+    return { tokens, postings: tokens.map((t) => byToken.get(t)), trigrams };
+  }
+
+  const SEARCH = DATA.search || buildIndex(DATA.hunts);
+
+  /* ── Query engine ──────────────────────────────────────────────────── */
+  // Filter, sort and count over the typed columns and the search index. It
+  // closes over nothing outside itself, so the filter worker runs this same
+  // source. Row sets are bitsets, one bit per DATA.hunts row, so filters
+  // combine a word at a time.
+  function createEngine(cols, search) {
+    const n = cols.count;
+    const NONE = 0xFFFF;
+    const TOKEN = /[a-z0-9]+/g;
+    const bitset = () => new Uint32Array((n + 31) >>> 5);
+    const fullSet = () => {
+      const b = bitset().fill(0xFFFFFFFF);
+      if (n & 31) b[b.length - 1] = (1 << (n & 31)) - 1;
+      return b;
+    };
+    const addRow = (b, i) => { b[i >>> 5] |= 1 << (i & 31); };
+    const andInto = (a, b) => { for (let w = 0; w < a.length; w++) a[w] &= b[w]; return a; };
+    const orInto = (a, b) => { for (let w = 0; w < a.length; w++) a[w] |= b[w]; return a; };
+
+    function rowsOf(b) {
+      const rows = [];
+      for (let w = 0; w < b.length; w++) {
+        for (let bits = b[w]; bits; bits &= bits - 1) rows.push((w << 5) + (31 - Math.clz32(bits & -bits)));
+      }
+      return rows;
+    }
+
+    // Rows holding each code of an enum column (type, wma, month), built on first use.
+    const codeSets = new Map();
+    function codeSet(field, code) {
+      const key = `${field}:${code}`;
+      if (!codeSets.has(key)) {
+        const b = bitset(), col = cols[field];
+        for (let i = 0; i < n; i++) if (col[i] === code) addRow(b, i);
+        codeSets.set(key, b);
+      }
+      return codeSets.get(key);
+    }
+
+    // Tokens containing word: the shortest trigram posting narrows the
+    // vocabulary, then a substring check confirms. Under three characters a
+    // word matches token prefixes, found by binary search.
+    function tokensFor(word) {
+      const { tokens, trigrams } = search;
+      if (word.length < 3) {
+        let lo = 0, hi = tokens.length;
+        while (lo < hi) { const mid = (lo + hi) >>> 1; if (tokens[mid] < word) lo = mid + 1; else hi = mid; }
+        const out = [];
+        for (let t = lo; t < tokens.length && tokens[t].startsWith(word); t++) out.push(t);
+        return out;
+      }
+      let shortest = null;
+      for (let i = 0; i + 3 <= word.length; i++) {
+        const list = trigrams[word.slice(i, i + 3)];
+        if (!list) return [];
+        if (!shortest || list.length < shortest.length) shortest = list;
+      }
+      return shortest.filter((t) => tokens[t].includes(word));
+    }
+
+    // Rows matching every word of the query, or null for an empty query.
+    const wordSets = new Map();
+    function searchSet(text) {
+      const words = text.toLowerCase().match(TOKEN);
+      if (!words) return null;
+      let out = null;
+      for (const word of words) {
+        if (!wordSets.has(word)) {
+          const b = bitset();
+          tokensFor(word).forEach((t) => search.postings[t].forEach((i) => addRow(b, i)));
+          if (wordSets.size > 256) wordSets.clear();
+          wordSets.set(word, b);
+        }
+        out = out ? andInto(out, wordSets.get(word)) : wordSets.get(word).slice();
+      }
+      return out;
+    }
+
+    // q.minutes[wmaCode] is the drive under the radius mode (-1: use the
+    // hunt's own camp drive), held against q.radiusMin when q.radiusOn.
+    // q.types lists type codes; q.wma and q.month are a code or null for "all".
+    function radiusSet(q) {
+      if (!q.radiusOn) return fullSet();
+      const b = bitset();
+      for (let i = 0; i < n; i++) {
+        const m = q.minutes[cols.wma[i]];
+        if ((m < 0 ? cols.driveMinutes[i] : m) <= q.radiusMin) addRow(b, i);
+      }
+      return b;
+    }
+
+    // Everything the list, stat strip and chips need for one filter state:
+    // the visible rows in order, and counts over the hunts inside the radius.
+    function query(q) {
+      const inRadius = radiusSet(q);
+      const counts = { inRadius: 0, areas: 0, permits: 0, peak: 0, best: -1,
+                       types: new Array(cols.dicts.type.length).fill(0) };
+      const areas = new Set();
+      for (const i of rowsOf(inRadius)) {
+        counts.inRadius++;
+        areas.add(cols.wma[i]);
+        if (cols.permits[i] !== NONE) counts.permits += cols.permits[i];
+        counts.peak += cols.peak[i];
+        counts.types[cols.type[i]]++;
+        if (!Number.isNaN(cols.score[i]) && (counts.best < 0 || cols.score[i] > cols.score[counts.best])) counts.best = i;
+      }
+      counts.areas = areas.size;
+
+      const set = inRadius.slice();
+      if (q.types.length) {
+        const types = bitset();
+        q.types.forEach((code) => orInto(types, codeSet("type", code)));
+        andInto(set, types);
+      }
+      if (q.wma !== null) andInto(set, codeSet("wma", q.wma));
+      if (q.month !== null) andInto(set, codeSet("month", q.month));
+      const matches = searchSet(q.search);
+      if (matches) andInto(set, matches);
+
+      const { score, start, driveMinutes, permits } = cols;
+      const sc = (i) => (Number.isNaN(score[i]) ? -1 : score[i]);
+      const mins = (i) => (q.minutes[cols.wma[i]] < 0 ? driveMinutes[i] : q.minutes[cols.wma[i]]);
+      const pm = (i) => (permits[i] === NONE ? 0 : permits[i]);
+      const sorters = {
+        score:   (a, b) => sc(b) - sc(a) || start[a] - start[b],
+        date:    (a, b) => start[a] - start[b] || sc(b) - sc(a),
+        drive:   (a, b) => mins(a) - mins(b) || sc(b) - sc(a),
+        permits: (a, b) => pm(b) - pm(a) || sc(b) - sc(a)
+      };
+      return { rows: Int32Array.from(rowsOf(set).sort(sorters[q.sort])), counts };
+    }
+
+    return { query };
+  }
+
+  const shardLoads = new Map();
+  const shardWaiters = new Map();
+
+  window.HUNT_DETAIL = (shard, rows) => {
+    const base = shard * DATA.detail.shardSize;
+    rows.forEach((d, i) => {
+      const h = DATA.hunts[base + i];
+      if (h) Object.assign(h, d, { detailLoaded: true });
+    });
+    shardWaiters.get(shard)?.();
+  };
+
+  // Resolves once h's shard has run — or failed to load, in which case the
+  // drawer renders without the detail fields rather than not at all.
+  function loadDetail(h) {
+    if (h.detailLoaded || !DATA.detail) return Promise.resolve();
+    const shard = Math.floor(h.row / DATA.detail.shardSize);
+    if (!shardLoads.has(shard)) {
+      shardLoads.set(shard, new Promise((resolve) => {
+        shardWaiters.set(shard, resolve);
+        const s = document.createElement("script");
+        s.src = DATA.detail.shards[shard];
+        s.onerror = () => { shardLoads.delete(shard); resolve(); };
+        document.head.appendChild(s);
+      }));
+    }
+    return shardLoads.get(shard);
+  }
+
   const $ = (sel, root = document) => root.querySelector(sel);
   const $$ = (sel, root = document) => [...root.querySelectorAll(sel)];
 
@@ -18,7 +283,8 @@
     shortlist: "sds.shortlist",
     theme: "sds.theme",
     radiusOn: "sds.radiusOn",
-    radiusMin: "sds.radiusMin"
+    radiusMin: "sds.radiusMin",
+    radiusMode: "sds.radiusMode"
   };
 
   const read = (k, fallback) => {
@@ -36,6 +302,7 @@
     sort: "score",
     radiusOn: read(STORE.radiusOn, true),
     radiusMin: read(STORE.radiusMin, 90),
+    radiusMode: read(STORE.radiusMode, "camp"),
     shortlist: new Set(read(STORE.shortlist, []))
   };
 
@@ -94,43 +361,126 @@
   };
 
   /* ── Filtering ─────────────────────────────────────────────────────── */
-  function inRadius(h) {
-    return !state.radiusOn || h.driveMinutes <= state.radiusMin;
-  }
-
-  function visibleHunts() {
-    const q = state.search.trim().toLowerCase();
-    let out = DATA.hunts.filter((h) => {
-      if (!inRadius(h)) return false;
-      if (state.types.size && !state.types.has(h.type)) return false;
-      if (state.wma && h.wma !== state.wma) return false;
-      if (state.month && monthKey(h.start) !== state.month) return false;
-      if (q && !(`${h.name} ${h.wma} ${h.rutPhase} ${h.moonPhase}`.toLowerCase().includes(q))) return false;
-      return true;
+  // originMinutes[i] is the drive from DATA.origins[i]; index 0 is camp. With
+  // several origins the radius can mean "everyone gets there in time" (the
+  // longest drive) or "someone is close" (the shortest).
+  const WMA_BY_NAME = new Map(DATA.wmas.map((w) => [w.name, w]));
+  const MULTI_ORIGIN = (DATA.origins || []).length > 1;
+
+  function wmaMinutes(w) {
+    const all = w.originMinutes;
+    if (!MULTI_ORIGIN || !all || state.radiusMode === "camp") return w.driveMinutes;
+    return state.radiusMode === "party" ? Math.max(...all) : Math.min(...all);
+  }
+
+  function huntMinutes(h) {
+    const w = WMA_BY_NAME.get(h.wma);
+    return w ? wmaMinutes(w) : h.driveMinutes;
+  }
+
+  // Minutes to each WMA code under the current radius mode; -1 for a WMA not
+  // in DATA.wmas, where the hunt's own camp drive applies.
+  function minutesByWma() {
+    return COLS.dicts.wma.map((name) => {
+      const w = WMA_BY_NAME.get(name);
+      return w ? wmaMinutes(w) : -1;
     });
+  }
 
-    const sorters = {
-      score:   (a, b) => (b.score ?? -1) - (a.score ?? -1) || a.start.localeCompare(b.start),
-      date:    (a, b) => a.start.localeCompare(b.start) || (b.score ?? -1) - (a.score ?? -1),
-      drive:   (a, b) => a.driveMinutes - b.driveMinutes || (b.score ?? -1) - (a.score ?? -1),
-      permits: (a, b) => (b.permits ?? 0) - (a.permits ?? 0) || (b.score ?? -1) - (a.score ?? -1)
+  function currentQuery() {
+    const { dicts } = COLS;
+    return {
+      radiusOn: state.radiusOn,
+      radiusMin: state.radiusMin,
+      minutes: minutesByWma(),
+      types: dicts.type.flatMap((t, code) => (state.types.has(t) ? [code] : [])),
+      wma: state.wma ? dicts.wma.indexOf(state.wma) : null,
+      month: state.month ? dicts.month.indexOf(state.month) : null,
+      search: state.search,
+      sort: state.sort
     };
-    return out.sort(sorters[state.sort]);
+  }
+
+  // The last answered query: the visible hunts in order, plus counts over the
+  // hunts inside the radius.
+  const view = { list: [], counts: null };
+
+  /* ── Filter pipeline ───────────────────────────────────────────────── */
+  // Input events only mark the view dirty; one animation frame later the
+  // current state goes to the filter worker, so a slider drag costs one query
+  // per frame, not per event. With a query in flight, the next one waits for
+  // its answer and carries whatever state is newest by then. Where no worker
+  // can start (or it fails) the same engine answers on the main thread.
+  const ENGINE = createEngine(COLS, SEARCH);
+  const pipeline = { frame: 0, busy: false, again: false, full: false, worker: null };
+
+  function startWorker() {
+    if (typeof Worker === "undefined" || typeof Blob === "undefined") return null;
+    try {
+      // A Blob URL works from file://, where a worker script URL would not.
+      const src = `const createEngine = ${createEngine};
+        let engine = null;
+        onmessage = ({ data }) => {
+          if (data.cols) { engine = createEngine(data.cols, data.search); return; }
+          const out = engine.query(data.query);
+          postMessage(out, [out.rows.buffer]);
+        };`;
+      const url = URL.createObjectURL(new Blob([src], { type: "text/javascript" }));
+      const worker = new Worker(url);
+      URL.revokeObjectURL(url);
+      worker.postMessage({ cols: COLS, search: SEARCH });
+      worker.onmessage = ({ data }) => {
+        pipeline.busy = false;
+        apply(data);
+        if (pipeline.again) { pipeline.again = false; update(); }
+      };
+      worker.onerror = () => {
+        pipeline.worker = null;
+        pipeline.busy = false;
+        update();
+      };
+      return worker;
+    } catch {
+      return null;
+    }
+  }
+
+  // Re-run the query on the next frame; full also redraws the panels that
+  // depend on the radius but not on the query (plan, shortlist, areas).
+  function update(full = false) {
+    pipeline.full ||= full;
+    if (!pipeline.frame) pipeline.frame = requestAnimationFrame(flush);
+  }
+
+  function flush() {
+    pipeline.frame = 0;
+    if (pipeline.full) { pipeline.full = false; renderRadiusPanels(); }
+    if (!pipeline.worker) { apply(ENGINE.query(currentQuery())); return; }
+    if (pipeline.busy) { pipeline.again = true; return; }
+    pipeline.busy = true;
+    pipeline.worker.postMessage({ query: currentQuery() });
+  }
+
+  function apply({ rows, counts }) {
+    view.list = Array.from(rows, (i) => DATA.hunts[i]);
+    view.counts = counts;
+    renderStats();
+    renderChips();
+    renderHunts();
+    renderCalendar();
+    renderRadiusSummary();
   }
 
   /* ── Rendering: stats ──────────────────────────────────────────────── */
   function renderStats() {
-    const inR = DATA.hunts.filter(inRadius);
-    const areas = new Set(inR.map((h) => h.wma));
-    const permits = inR.reduce((s, h) => s + (h.permits || 0), 0);
-    const peak = inR.filter((h) => h.rutPhase === "Peak Rut").length;
-    const best = inR.reduce((b, h) => (h.score != null && (!b || h.score > b.score) ? h : b), null);
+    const c = view.counts;
+    const best = c.best < 0 ? null : DATA.hunts[c.best];
 
     $("#stats").innerHTML = [
-      { v: inR.length, l: "Hunts available" },
-      { v: areas.size, l: "WMAs in range" },
-      { v: permits.toLocaleString(), l: "Total permits" },
-      { v: peak, l: "Peak-rut hunts" },
+      { v: c.inRadius, l: "Hunts available" },
+      { v: c.areas, l: "WMAs in range" },
+      { v: c.permits.toLocaleString(), l: "Total permits" },
+      { v: c.peak, l: "Peak-rut hunts" },
       { v: best ? best.score.toFixed(2) : "—", l: "Top score", accent: true }
     ].map((s) => `
       <div class="stat${s.accent ? " accent" : ""}"><b>${s.v}</b><span>${s.l}</span></div>
@@ -143,7 +493,7 @@
     const scored = h.score !== null && h.score !== undefined;
     const tier = !scored ? "tier-none" : h.score >= 8 ? "tier-1" : h.score >= 7 ? "tier-2" : "";
     const starred = state.shortlist.has(h.id);
-    const far = h.driveMinutes > state.radiusMin;
+    const far = huntMinutes(h) > state.radiusMin;
 
     return `
       <article class="hunt" style="--type-color:${meta.color}" data-id="${h.id}"
@@ -168,7 +518,7 @@
           ${h.restriction ? `<span class="tag">⚠️ ${h.restriction}</span>` : ""}
         </div>
         <div class="hunt-foot">
-          <span class="tag${far ? " far" : ""}">🚗 ${fmtDrive(h.driveMinutes)}</span>
+          <span class="tag${far ? " far" : ""}">🚗 ${fmtDrive(huntMinutes(h))}</span>
           <span class="stats-inline">
             <span>${h.agency === "USFWS" ? "USFWS" : `${h.permits} permits`}</span>
             <span>${h.driveMiles} mi</span>
@@ -177,9 +527,83 @@
       </article>`;
   }
 
+  // Make parent's children exactly nodes, in order, moving only the ones that
+  // are out of place so unchanged cards keep their DOM (and focus, hover).
+  function reconcile(parent, nodes) {
+    const keep = new Set(nodes);
+    [...parent.children].forEach((c) => { if (!keep.has(c)) c.remove(); });
+    let ref = parent.firstElementChild;
+    for (const node of nodes) {
+      if (node === ref) ref = ref.nextElementSibling;
+      else parent.insertBefore(node, ref);
+    }
+  }
+
+  // Cards are keyed by hunt id and reused across renders. A card is rebuilt
+  // only when something it shows besides the hunt itself changes: the star,
+  // or its drive and far flag under the current radius.
+  const cardCache = new Map();
+  const cardTemplate = document.createElement("template");
+
+  function cardNode(h) {
+    const minutes = huntMinutes(h);
+    const sig = `${state.shortlist.has(h.id)}|${minutes}|${minutes > state.radiusMin}`;
+    let entry = cardCache.get(h.id);
+    if (!entry || entry.sig !== sig) {
+      cardTemplate.innerHTML = huntCard(h).trim();
+      entry = { node: cardTemplate.content.firstElementChild, sig };
+      cardCache.set(h.id, entry);
+    }
+    return entry.node;
+  }
+
+  // Past VIRTUAL_MIN cards only the rows near the viewport are in the grid,
+  // between two full-width spacers standing in for the rows above and below.
+  const VIRTUAL_MIN = 200;
+  const OVERSCAN_ROWS = 4;
+  const grid = { list: [], rowHeight: 260, frame: 0 };
+  const spacer = (cls) => {
+    const el = document.createElement("div");
+    el.className = `grid-spacer ${cls}`;
+    el.setAttribute("aria-hidden", "true");
+    return el;
+  };
+  const spacerAbove = spacer("above"), spacerBelow = spacer("below");
+
+  function renderWindow() {
+    grid.frame = 0;
+    const el = $("#hunt-grid");
+    const list = grid.list;
+    if (list.length <= VIRTUAL_MIN) { reconcile(el, list.map(cardNode)); return; }
+
+    const css = getComputedStyle(el);
+    const cols = css.gridTemplateColumns === "none" ? 1 : css.gridTemplateColumns.split(" ").length;
+    const gap = parseFloat(css.rowGap) || 0;
+    const rows = Math.ceil(list.length / cols);
+    const top = el.getBoundingClientRect().top;
+    // Row heights are estimated, so clamp the window to always hold a
+    // screenful of real rows, even scrolled past where the estimate ends.
+    const span = Math.ceil(innerHeight / grid.rowHeight) + 2 * OVERSCAN_ROWS;
+    const first = Math.max(0, Math.min(rows - span, Math.floor(-top / grid.rowHeight) - OVERSCAN_ROWS));
+    const last = Math.min(rows, first + span);
+
+    const cards = list.slice(first * cols, last * cols).map(cardNode);
+    // A spacer takes a grid row of its own, gap included.
+    spacerAbove.style.height = `${first * grid.rowHeight - gap}px`;
+    spacerBelow.style.height = `${(rows - last) * grid.rowHeight - gap}px`;
+    reconcile(el, [...(first ? [spacerAbove] : []), ...cards, ...(last < rows ? [spacerBelow] : [])]);
+    if (cards[0]?.offsetHeight) grid.rowHeight = cards[0].offsetHeight + gap;
+  }
+
+  function scheduleWindow() {
+    if (!grid.frame && grid.list.length > VIRTUAL_MIN) grid.frame = requestAnimationFrame(renderWindow);
+  }
+
   function renderHunts() {
-    const list = visibleHunts();
-    $("#hunt-grid").innerHTML = list.map(huntCard).join("");
+    const list = view.list;
+    grid.list = list;
+    if (grid.frame) { cancelAnimationFrame(grid.frame); grid.frame = 0; }
+    renderWindow();
     $("#hunts-empty").hidden = list.length > 0;
     $("#result-count").textContent =
       `${list.length} hunt${list.length === 1 ? "" : "s"} · ${list.reduce((s, h) => s + (h.permits || 0), 0)} permits`;
@@ -187,7 +611,7 @@
 
   function renderChips() {
     const counts = {};
-    DATA.hunts.filter(inRadius).forEach((h) => { counts[h.type] = (counts[h.type] || 0) + 1; });
+    COLS.dicts.type.forEach((type, code) => { counts[type] = view.counts.types[code]; });
     $("#type-chips").innerHTML = Object.keys(TYPE_META).map((type) => `
       <button class="chip${state.types.has(type) ? " is-on" : ""}" data-type="${type}">
         <i class="dot" style="background:${TYPE_META[type].color}"></i>${TYPE_META[type].short}
@@ -196,8 +620,10 @@
   }
 
   /* ── Rendering: calendar ───────────────────────────────────────────── */
+  const monthCache = new Map();
+
   function renderCalendar() {
-    const list = visibleHunts();
+    const list = view.list;
     const byDay = new Map();
     list.forEach((h) => {
       const start = parseDay(h.start), end = parseDay(h.end);
@@ -214,7 +640,9 @@
     const plannedDays = new Set((DATA.planned || []).flatMap((p) => eachDay(p.start, p.end)));
     const conflicts = conflictDays();
 
-    $("#cal-months").innerHTML = months.map((key) => {
+    // One node per month, kept across renders; only months whose markup
+    // changed are redrawn.
+    const nodes = months.map((key) => {
       const [y, m] = key.split("-").map(Number);
       const first = new Date(y, m - 1, 1);
       const total = new Date(y, m, 0).getDate();
@@ -235,10 +663,20 @@
         const title = types ? `${iso} — ${[...types].map((t) => TYPE_META[t].short).join(", ")}` : iso;
         cells.push(`<div class="${cls.join(" ")}" title="${title}">${day}<span class="dots">${dots}</span></div>`);
       }
-      return `<div class="cal-month"><h3>${monthLabel(key)}</h3>
-        <div class="cal-grid">${dow.map((d) => `<div class="cal-dow">${d}</div>`).join("")}${cells.join("")}</div>
-      </div>`;
-    }).join("");
+      const html = `<h3>${monthLabel(key)}</h3>
+        <div class="cal-grid">${dow.map((d) => `<div class="cal-dow">${d}</div>`).join("")}${cells.join("")}</div>`;
+
+      let entry = monthCache.get(key);
+      if (!entry) {
+        const node = document.createElement("div");
+        node.className = "cal-month";
+        entry = { node, html: null };
+        monthCache.set(key, entry);
+      }
+      if (entry.html !== html) { entry.node.innerHTML = html; entry.html = html; }
+      return entry.node;
+    });
+    reconcile($("#cal-months"), nodes);
   }
 
   /* ── Rendering: the plan ───────────────────────────────────────────── */
@@ -254,13 +692,54 @@
     return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}-${String(d.getDate()).padStart(2, "0")}`;
   }
 
+  // Positions in DATA.planIndex whose ranges share a day with start..end (day
+  // numbers). Same implicit-tree walk as interval_index.py.
+  function overlapping(index, start, end) {
+    const { start: st, end: en, maxEnd, maxLevel } = index;
+    const n = st.length, out = [];
+    if (!n) return out;
+    const stack = [[maxLevel, (1 << maxLevel) - 1, false]];
+    while (stack.length) {
+      const [k, x, leftDone] = stack.pop();
+      if (k <= 3) {
+        const i0 = x >> k << k;
+        for (let i = i0; i < Math.min(i0 + (1 << (k + 1)) - 1, n) && st[i] <= end; i++) {
+          if (en[i] >= start) out.push(i);
+        }
+      } else if (!leftDone) {
+        stack.push([k, x, true]);
+        const y = x - (1 << (k - 1));
+        if (y >= n || maxEnd[y] >= start) stack.push([k - 1, y, false]);
+      } else if (x < n && st[x] <= end) {
+        if (en[x] >= start) out.push(x);
+        stack.push([k - 1, x + (1 << (k - 1)), false]);
+      }
+    }
+    return out.sort((a, b) => a - b);
+  }
+
   // Days covered by more than one planned hunt — the ones you can't be at both of.
+  // Only the days each overlapping pair shares get expanded.
   function conflictDays() {
-    const seen = new Map();
-    (DATA.planned || []).forEach((p) => {
-      eachDay(p.start, p.end).forEach((iso) => seen.set(iso, (seen.get(iso) || 0) + 1));
+    const plan = DATA.planned || [];
+    const index = DATA.planIndex;
+    if (!index) {   // data.js from before the index was exported
+      const seen = new Map();
+      plan.forEach((p) => {
+        eachDay(p.start, p.end).forEach((iso) => seen.set(iso, (seen.get(iso) || 0) + 1));
+      });
+      return new Set([...seen].filter(([, n]) => n > 1).map(([iso]) => iso));
+    }
+    const days = new Set();
+    plan.forEach((p, i) => {
+      overlapping(index, index.start[i], index.end[i]).forEach((j) => {
+        if (j <= i) return;
+        const q = plan[j];
+        eachDay(p.start > q.start ? p.start : q.start, p.end < q.end ? p.end : q.end)
+          .forEach((iso) => days.add(iso));
+      });
     });
-    return new Set([...seen].filter(([, n]) => n > 1).map(([iso]) => iso));
+    return days;
   }
 
   function renderPlan() {
@@ -403,11 +882,11 @@
       `plus ${DATA.driveModel.accessMinutes} min on WMA access roads.`;
 
     $("#area-list").innerHTML = DATA.wmas.map((w) => {
-      const far = w.driveMinutes > state.radiusMin;
+      const far = wmaMinutes(w) > state.radiusMin;
       return `<div class="area${far ? " is-far" : ""}">
         <h4>${w.name}</h4>
         <p class="access">${countyLabel(w.county)} — ${w.access}</p>
-        <div class="drive"><b>${fmtDrive(w.driveMinutes)}</b><small>${w.driveMiles} mi · ${w.hunts} hunts</small></div>
+        <div class="drive"><b>${fmtDrive(wmaMinutes(w))}</b><small>${w.driveMiles} mi · ${w.hunts} hunts</small></div>
       </div>`;
     }).join("");
 
@@ -421,28 +900,38 @@
   }
 
   /* ── Drawer ────────────────────────────────────────────────────────── */
-  function openDrawer(id) {
+  function openDrawer(id, waited = false) {
     const h = DATA.hunts.find((x) => x.id === id);
     if (!h) return;
+    if (!h.detailLoaded && !waited) {
+      loadDetail(h).then(() => openDrawer(id, true));
+      return;
+    }
     const wma = DATA.wmas.find((w) => w.name === h.wma) || {};
     const starred = state.shortlist.has(h.id);
     const rows = [
       ["Area", h.wma],
-      ["County", countyLabel(h.county)],
+      ["County", h.county ? countyLabel(h.county) : "—"],
       ["Dates", `${fmtRange(h.start, h.end)}, ${parseDay(h.start).getFullYear()}`],
       ["Days of week", fmtDows(h.start, h.end)],
       ["Length", `${h.days} day${h.days > 1 ? "s" : ""}`],
       ["Permits", (h.permits ?? "not published") + (h.groupSize ? ` (${h.groupSize} hunters each)` : "")],
       ["Drive from camp", `${fmtDrive(h.driveMinutes)} · ${h.driveMiles} mi`],
-      ["Best day", parseDay(h.bestDay).toLocaleDateString("en-US", { weekday: "long", month: "short", day: "numeric" })],
-      ["Moon", `${h.moonPhase} · ${Math.round(h.moonIllum * 100)}% lit`]
+      ...(MULTI_ORIGIN && wma.originMinutes
+        ? [["Drive from", DATA.origins.slice(1)
+            .map((o, i) => `${o.name} ${fmtDrive(wma.originMinutes[i + 1])}`).join(" · ")]]
+        : []),
+      ["Best day", h.bestDay
+        ? parseDay(h.bestDay).toLocaleDateString("en-US", { weekday: "long", month: "short", day: "numeric" })
+        : "—"],
+      ["Moon", h.moonIllum != null ? `${h.moonPhase} · ${Math.round(h.moonIllum * 100)}% lit` : h.moonPhase]
     ];
 
     $("#drawer-body").innerHTML = `
       <h2>${h.name}</h2>
       <p class="sub">${TYPE_META[h.type]?.short || h.type} · ${h.score != null
           ? `Score ${h.score.toFixed(2)} / 10` : `${h.species} — not scored on deer movement`}</p>
-      ${h.rutPhase ? `<div class="callout"><strong>${h.rutPhase}.</strong> ${h.rutNote}</div>` : ""}
+      ${h.rutPhase ? `<div class="callout"><strong>${h.rutPhase}.</strong> ${h.rutNote || ""}</div>` : ""}
       <dl class="dl">${rows.map(([k, v]) => `<dt>${k}</dt><dd>${v}</dd>`).join("")}</dl>
       ${h.scores ? `<h3>Score breakdown</h3>
       <div class="weights">${Object.entries(h.scores).map(([k, v]) => `
@@ -492,7 +981,7 @@
   function exportCsv() {
     const cols = ["name", "type", "wma", "start", "end", "days", "permits", "driveMinutes", "driveMiles", "rutPhase", "moonPhase", "score"];
     const esc = (v) => (/[",\n]/.test(String(v)) ? `"${String(v).replace(/"/g, '""')}"` : v);
-    const rows = visibleHunts().map((h) => cols.map((c) => esc(h[c])).join(","));
+    const rows = view.list.map((h) => cols.map((c) => esc(h[c])).join(","));
     download("delta-hunts-filtered.csv", [cols.join(","), ...rows].join("\n"), "text/csv");
   }
 
@@ -529,20 +1018,23 @@
   }
 
   /* ── Wiring ────────────────────────────────────────────────────────── */
-  function refresh() {
-    renderStats();
-    renderChips();
-    renderHunts();
+  // Radius changes redraw everything; the query-driven parts go through the
+  // filter pipeline, these do not depend on the query.
+  const refresh = () => update(true);
+
+  function renderRadiusPanels() {
     renderPlan();
-    renderCalendar();
     renderShortlist();
     renderAreas();
+  }
 
-    const inR = DATA.hunts.filter(inRadius).length;
+  function renderRadiusSummary() {
+    const inR = view.counts.inRadius;
     const excluded = DATA.hunts.length - inR;
     // Statewide there can be a dozen excluded areas — name the nearest few,
     // which are the ones actually worth reconsidering, and count the rest.
-    const farAreas = DATA.wmas.filter((w) => w.driveMinutes > state.radiusMin).map((w) => w.name);
+    const farAreas = DATA.wmas.filter((w) => wmaMinutes(w) > state.radiusMin)
+      .sort((a, b) => wmaMinutes(a) - wmaMinutes(b)).map((w) => w.name);
     const named = farAreas.slice(0, 3).join(", ");
     const rest = farAreas.length - 3;
     $("#radius-summary").textContent = state.radiusOn
@@ -564,6 +1056,8 @@
     // The stat strip counts hunts in radius — it says nothing about the shortlist or areas views.
     $("#stats").hidden = view !== "hunts" && view !== "calendar";
     window.scrollTo({ top: 0, behavior: "smooth" });
+    // The grid had no layout while hidden; size the window to it now.
+    if (view === "hunts") scheduleWindow();
   }
 
   function toggleStar(id) {
@@ -608,9 +1102,16 @@
     radiusToggle.checked = state.radiusOn;
     radiusRange.value = state.radiusMin;
 
+    const radiusMode = $("#radius-mode");
+    radiusMode.hidden = !MULTI_ORIGIN;
+    radiusMode.value = state.radiusMode;
+
     const syncRadiusLabels = () => {
       $("#radius-out").textContent = fmtDrive(state.radiusMin);
       $("#radius-label").textContent = fmtDrive(state.radiusMin);
+      $("#radius-from").textContent = !MULTI_ORIGIN || state.radiusMode === "camp"
+        ? "of camp"
+        : state.radiusMode === "party" ? "for the whole party" : "of someone's home";
     };
     syncRadiusLabels();
 
@@ -625,6 +1126,12 @@
       syncRadiusLabels();
       refresh();
     });
+    radiusMode.addEventListener("change", () => {
+      state.radiusMode = radiusMode.value;
+      write(STORE.radiusMode, state.radiusMode);
+      syncRadiusLabels();
+      refresh();
+    });
 
     // Tabs
     $("#tabs").addEventListener("click", (e) => {
@@ -640,17 +1147,17 @@
     $("#filter-month").innerHTML = '<option value="">All months</option>' +
       months.map((m) => `<option value="${m}">${monthLabel(m)}</option>`).join("");
 
-    $("#search").addEventListener("input", (e) => { state.search = e.target.value; renderHunts(); });
-    $("#filter-wma").addEventListener("change", (e) => { state.wma = e.target.value; renderHunts(); renderCalendar(); });
-    $("#filter-month").addEventListener("change", (e) => { state.month = e.target.value; renderHunts(); renderCalendar(); });
-    $("#sort").addEventListener("change", (e) => { state.sort = e.target.value; renderHunts(); });
+    $("#search").addEventListener("input", (e) => { state.search = e.target.value; update(); });
+    $("#filter-wma").addEventListener("change", (e) => { state.wma = e.target.value; update(); });
+    $("#filter-month").addEventListener("change", (e) => { state.month = e.target.value; update(); });
+    $("#sort").addEventListener("change", (e) => { state.sort = e.target.value; update(); });
 
     $("#type-chips").addEventListener("click", (e) => {
       const chip = e.target.closest(".chip");
       if (!chip) return;
       const type = chip.dataset.type;
       if (state.types.has(type)) state.types.delete(type); else state.types.add(type);
-      renderChips(); renderHunts(); renderCalendar();
+      update();
     });
 
     // Cards: star vs. open
@@ -673,6 +1180,10 @@
     $("#drawer-close").addEventListener("click", closeDrawer);
     $("#drawer-backdrop").addEventListener("click", closeDrawer);
 
+    // Virtualized hunt grid: move the window of rendered rows with the page.
+    window.addEventListener("scroll", scheduleWindow, { passive: true });
+    window.addEventListener("resize", scheduleWindow);
+
     // Export / clear
     $("#export-csv").addEventListener("click", exportCsv);
     $("#export-ics").addEventListener("click", exportIcs);
@@ -684,7 +1195,10 @@
     });
 
     renderHunters();
-    refresh();
+    // First paint answers on the main thread; later queries go to the worker.
+    renderRadiusPanels();
+    apply(ENGINE.query(currentQuery()));
+    pipeline.worker = startWorker();
   }
 
   document.addEventListener("DOMContentLoaded", init);
@@ -0,0 +1,36 @@
+"""Replace files whole, so a reader never sees a partial write.
+
+The browser loading data.js, the query service and the file watcher all read
+files the builders write. Each write goes to a temporary file in the same
+directory and is then renamed over the target with os.replace, which is
+atomic on one filesystem: a reader opens either the old file or the new one.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8",
+                      newline: str | None = None) -> None:
+    """Path.write_text, but the target is swapped in only once fully written.
+
+    An existing file keeps its permission bits; a new one gets 0644.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline=newline) as fh:
+            fh.write(text)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Time every pipeline stage at 1x, 10x, 100x and 1000x the real catalog.
+
+A catalog at Nx comes from synthetic_catalog.py with N times the hunts and
+applications of the real 2026-27 season (about 300 hunts, 5 applications)
+and N times its WMAs, up to MAX_WMAS. Stages:
+
+  parse_table           parse_mdwfp_draws.parse_table over the season's tables
+  parse_schedule_lines  build_2026_decision_data, over the schedule text
+  parse_stats           build_2026_decision_data, over the last season's stats
+  score_hunt            build_2026_decision_data, every parsed hunt
+  build_strategy        build_2026_decision_data, the 5-hunt slate
+  build_hunt            build_app_data, every CSV row
+  build_app_data.main   the whole data.js build with the catalog's WMAs and
+                        applications, into a temp directory
+
+Each stage reports the best of --repeat runs. A run longer than --budget
+seconds is stopped (where SIGALRM exists) and recorded as timed out, and that
+stage's larger sizes are skipped (recorded as null). Results go to benchmarks/results/<timestamp>-<commit>.json, and are
+compared with the previous results file (or --compare) so a regression
+between commits shows up as a ratio.
+
+Run:  python benchmarks/run_benchmarks.py
+      python benchmarks/run_benchmarks.py --sizes 1,10 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import platform
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "analysis"))
+
+import build_2026_decision_data as decision  # noqa: E402
+import build_app_data  # noqa: E402
+import drive_matrix  # noqa: E402
+import parse_mdwfp_draws  # noqa: E402
+import synthetic_catalog  # noqa: E402
+from draw_forecast import forecast  # noqa: E402
+from drive_matrix import DriveMatrix, load_pins  # noqa: E402
+from hunt_scoring import season_calendar  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SEASON = 2026
+# A 1x catalog, about the size of the real 2026-27 season.
+BASE = {"wmas": 40, "hunts": 300, "applications": 5}
+MAX_WMAS = 2000
+# Slower than this against the previous results is flagged.
+REGRESSION_RATIO = 1.25
+
+
+def text_lines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def stages(n: int, tmp: Path):
+    """(name, setup) pairs over a size-n catalog; setup returns the timed call.
+
+    The catalog is generated by the first setup called, so sizes whose
+    stages are all filtered out or over budget never pay for it.
+    """
+    catalog = tmp / f"catalog_{n}"
+    label = f"{SEASON}_{str(SEASON + 1)[-2:]}"
+    loaded: dict = {}
+
+    def load() -> dict:
+        if not loaded:
+            synthetic_catalog.generate(
+                catalog, wmas=min(BASE["wmas"] * n, MAX_WMAS), hunts=BASE["hunts"] * n,
+                season=SEASON, applications=BASE["applications"] * n,
+            )
+            loaded["wmas"] = json.loads((catalog / "wmas.json").read_text(encoding="utf-8"))
+            loaded["applications"] = json.loads(
+                (catalog / "applications.json").read_text(encoding="utf-8"))
+            loaded["schedules"] = {
+                category: (hunt_type, text_lines(catalog / "schedules" / f"{category}_{SEASON}.txt"))
+                for category, (_, hunt_type) in decision.PDF_MAP.items()
+                if (catalog / "schedules" / f"{category}_{SEASON}.txt").exists()
+            }
+            loaded["stats_lines"] = text_lines(catalog / "stats" / f"stats_{SEASON - 1}.txt")
+        return loaded
+
+    @contextlib.contextmanager
+    def patched(module=build_app_data, **values):
+        # Set module globals for the timed call, then put them back.
+        saved = {name: getattr(module, name) for name in values}
+        for name, value in values.items():
+            setattr(module, name, value)
+        try:
+            yield
+        finally:
+            for name, value in saved.items():
+                setattr(module, name, value)
+
+    def parse_table():
+        load()
+        paths = [(catalog / "raw" / f"{key}_{label}.md", hunt_type)
+                 for key, (hunt_type, _) in parse_mdwfp_draws.CATEGORIES.items()]
+        return lambda: sum(len(parse_mdwfp_draws.parse_table(p, t, SEASON)) for p, t in paths)
+
+    def parse_schedule_lines():
+        schedules = load()["schedules"]
+        return lambda: sum(
+            sum(1 for _ in decision.parse_schedule_lines(lines, t, cat))
+            for cat, (t, lines) in schedules.items()
+        )
+
+    def parse_stats():
+        stats_lines = load()["stats_lines"]
+        return lambda: len(decision.parse_stats(stats_lines))
+
+    def hunts_and_stats():
+        schedules, stats_lines = load()["schedules"], load()["stats_lines"]
+        hunts = [
+            h
+            for cat, (t, lines) in schedules.items()
+            for h in decision.parse_schedule_lines(lines, t, cat)
+        ]
+        stats = {
+            key: decision.stats_entry(apps, quota, forecast(apps, None, SEASON, SEASON - 1))
+            for key, (apps, quota) in decision.parse_stats(stats_lines).items()
+        }
+        return hunts, stats
+
+    def score_hunt():
+        hunts, stats = hunts_and_stats()
+        return lambda: len([decision.score_hunt(h, stats, {}) for h in hunts])
+
+    def build_strategy():
+        hunts, stats = hunts_and_stats()
+        adult = [decision.score_hunt(h, stats, {}) for h in hunts
+                 if h["category"] in decision.ADULT_CATEGORIES]
+        adult.sort(key=lambda h: h["decision_score"], reverse=True)
+        return lambda: len(decision.build_strategy(adult, n=5))
+
+    def build_hunt():
+        wmas = load()["wmas"]
+        rows = []
+        for path in sorted(catalog.glob(f"deer_*_{label}.csv")):
+            with path.open(newline="", encoding="utf-8") as fh:
+                rows.extend(csv.DictReader(fh))
+        calendar = season_calendar(SEASON, build_app_data.WEIGHTS)
+        drive = DriveMatrix({"camp": build_app_data.CAMP, **wmas}, load_pins(),
+                            origins=["camp"], cache_dir=tmp / "drive_matrix")
+
+        def run():
+            with patched(WMAS=wmas, _calendar=calendar, _drive=drive):
+                return len([build_app_data.build_hunt(r) for r in rows])
+        return run
+
+    def app_main():
+        data = load()
+
+        def run():
+            # main() sets _calendar and _drive itself; they are restored too.
+            # Drive matrices are cached in tmp, not the working tree's .cache/.
+            with patched(DATA_DIR=catalog, OUT=tmp / f"assets_{n}" / "data.js",
+                         APPLICATIONS=data["applications"], WMAS=data["wmas"],
+                         _calendar=build_app_data._calendar, _drive=build_app_data._drive), \
+                    patched(drive_matrix, CACHE_DIR=tmp / "drive_matrix"), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                build_app_data.main([])
+            return BASE["hunts"] * n
+        return run
+
+    return [
+        ("parse_table", parse_table),
+        ("parse_schedule_lines", parse_schedule_lines),
+        ("parse_stats", parse_stats),
+        ("score_hunt", score_hunt),
+        ("build_strategy", build_strategy),
+        ("build_hunt", build_hunt),
+        ("build_app_data.main", app_main),
+    ]
+
+
+class OverBudget(Exception):
+    pass
+
+
+def _over_budget(signum, frame):
+    raise OverBudget
+
+
+def best_of(fn, repeat: int, budget: float) -> tuple[float, int]:
+    """Fastest of repeat runs; OverBudget once a run passes budget seconds."""
+    best, items = float("inf"), 0
+    timed = hasattr(signal, "setitimer")
+    if timed:
+        signal.signal(signal.SIGALRM, _over_budget)
+    for _ in range(repeat):
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, budget)
+        try:
+            t0 = time.perf_counter()
+            items = fn()
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            if timed:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    return best, items
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict) -> list[str]:
+    """Lines comparing results with baseline, stage by size, slower ones flagged."""
+    out = []
+    for stage, sizes in results["stages"].items():
+        for size, row in sizes.items():
+            old = baseline.get("stages", {}).get(stage, {}).get(size)
+            if not row or not old or "seconds" not in row or "seconds" not in old:
+                continue
+            ratio = row["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+            flag = "  <-- slower" if ratio > REGRESSION_RATIO else ""
+            out.append(f"  {stage:<22} {size:>6}  {ratio:6.2f}x{flag}")
+    return out
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Time every pipeline stage at several catalog sizes.")
+    parser.add_argument("--sizes", default="1,10,100,1000",
+                        help="comma-separated catalog multiples (default 1,10,100,1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; best kept")
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="stop a run after this many seconds and skip the stage's larger sizes")
+    parser.add_argument("--stage", action="append", default=[],
+                        help="only this stage (repeatable)")
+    parser.add_argument("--out", type=Path, help="results file (default benchmarks/results/...)")
+    parser.add_argument("--compare", type=Path,
+                        help="results file to compare with (default: the newest one before this run)")
+    args = parser.parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    results = {
+        "commit": git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "sizes": sizes,
+        "repeat": args.repeat,
+        "catalog": {**BASE, "max_wmas": MAX_WMAS},
+        "stages": {},
+    }
+    over_budget: set[str] = set()
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        for n in sizes:
+            for name, setup in stages(n, tmp):
+                if args.stage and name not in args.stage:
+                    continue
+                row = results["stages"].setdefault(name, {})
+                if name in over_budget:
+                    row[f"{n}x"] = None
+                    continue
+                try:
+                    seconds, items = best_of(setup(), args.repeat, args.budget)
+                except OverBudget:
+                    row[f"{n}x"] = {"timed_out": args.budget}
+                    over_budget.add(name)
+                    print(f"{name:<22} {n:>5}x  over the {args.budget:g} s budget")
+                    continue
+                row[f"{n}x"] = {"seconds": round(seconds, 6), "items": items,
+                                "per_second": round(items / seconds) if seconds else None}
+                print(f"{name:<22} {n:>5}x  {seconds * 1000:>10.1f} ms  {items:>9} items")
+                if seconds > args.budget:
+                    over_budget.add(name)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    previous = sorted(RESULTS_DIR.glob("*.json"))
+    out = args.out or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{results['commit']}.json"
+    out.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {out}")
+
+    baseline_path = args.compare or (previous[-1] if previous else None)
+    if baseline_path:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        print(f"Compared with {baseline_path.name} ({baseline.get('commit')}), time now / before:")
+        print("\n".join(compare(results, baseline)) or "  nothing in common")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Write a synthetic MDWFP-style catalog for scale and stress testing.
+
+The real inputs are a few hundred hunts over two seasons, too few to show how
+the pipeline grows. This writes the same files at any size, laid out like
+data/ so each stage can be pointed at it:
+
+  raw/<category>_<YYYY>_<YY>.md         Hunt | Dates | Quota tables (parse_table)
+  deer_<category>_hunts_<YYYY>_<YY>.csv parse_mdwfp_draws' CSVs (discover_csvs)
+  schedules/<category>_<YYYY>.txt       schedule PDF text (parse_schedule_lines)
+  stats/stats_<YYYY>.txt                per-hunt stats PDF text (parse_stats)
+  wmas.json                             coordinates for every WMA, as in WMAS
+  applications.json                     a party's APPLICATIONS entries
+
+Hunts keep their WMA, category, number, dates and quota from season to
+season, so a hunt's stats line up with its later schedules. Applications per
+permit vary by WMA and method and drift by season, so the trend and forecast
+code has something to fit. WMAs come from build_app_data.WMAS first, so a
+small catalog needs no extra coordinates; past that, names are made up and
+placed around the Delta. The same --seed always writes the same files.
+
+Run:  python benchmarks/synthetic_catalog.py out/
+      python benchmarks/synthetic_catalog.py out/ --wmas 200 --hunts 30000 --seasons 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import build_app_data  # noqa: E402
+import parse_mdwfp_draws  # noqa: E402
+
+# Per category: hunt name label, (month, day) window start and end, duration
+# range and quota range. Group hunts take their label from GROUP_WEAPONS and
+# their quota from GROUP_QUOTAS.
+PLANS = {
+    "archery": ("Archery", (10, 1), (1, 31), (2, 5), (4, 24)),
+    "primitive_weapon": ("PW", (11, 15), (1, 15), (2, 7), (10, 50)),
+    "gun": ("Gun", (11, 5), (1, 20), (2, 4), (6, 20)),
+    "group": (None, (10, 1), (1, 31), (4, 5), None),
+}
+GROUP_WEAPONS = ["Archery", "Primitive Weapon", "Limited Weapon"]
+# (md quota cell, stats quota cell, permits) in the schedules' own wording.
+GROUP_QUOTAS = [
+    ("1 group(up to3 hunters)for each hunt", "1 group (up to 3 hunters)", 3),
+    ("4 groups(up to4 hunters/group)", "4 groups (up to 4 hunters/group)", 16),
+]
+# Share of hunts per category, roughly the 2026-27 mix.
+CATEGORY_WEIGHTS = {"archery": 0.45, "primitive_weapon": 0.25, "gun": 0.22, "group": 0.08}
+
+NAME_WORDS = (
+    ["Big", "Little", "Upper", "Lower", "Old", "Black", "Red", "White", "Cane", "Cypress",
+     "Tupelo", "Oak", "Bear", "Panther", "Turkey", "Sunflower", "Deer", "Muddy", "Long", "Horseshoe"],
+    ["Creek", "Bayou", "Ridge", "Bottom", "Lake", "Brake", "Hollow", "Bend", "Slough", "Prairie",
+     "Swamp", "Bluff", "Island", "Point", "Landing", "Flats", "Woods", "Springs", "Fork", "Chute"],
+)
+UNITS = ["North Unit", "South Unit", "East Unit", "West Unit", "Upper Unit", "Lower Unit"]
+# Where made-up WMAs are placed: the Delta and the hills east of it.
+LAT_RANGE, LON_RANGE = (31.3, 34.8), (-91.3, -88.3)
+
+RATIO_MEDIAN = 6.0          # applications per permit, across areas
+RATIO_AREA_SD = 0.8         # log spread between areas
+RATIO_HUNT_SD = 0.3         # log spread between hunts of one area
+GROWTH_SD = 0.08            # log change per season, per area
+SEASON_NOISE_SD = 0.1       # log noise per hunt and season
+STATUSES = ["applied", "applied", "planned"]
+
+
+def wma_names(count: int, rng: random.Random) -> list[str]:
+    """The real WMAs first, then made-up ones ("Cane Bayou", "Cane Bayou (North Unit)")."""
+    names = list(build_app_data.WMAS)[:count]
+    made_up = [f"{a} {b}" for a in NAME_WORDS[0] for b in NAME_WORDS[1]
+               if f"{a} {b}" not in build_app_data.WMAS]
+    rng.shuffle(made_up)
+    made_up += [f"{name} ({unit})" for unit in UNITS for name in made_up]
+    if count - len(names) > len(made_up):
+        raise SystemExit(f"--wmas tops out at {len(build_app_data.WMAS) + len(made_up)}")
+    return names + made_up[:count - len(names)]
+
+
+def wma_entries(names: list[str], rng: random.Random) -> dict[str, dict]:
+    """WMAS-style entries; real WMAs keep their own."""
+    out = {}
+    for name in names:
+        if name in build_app_data.WMAS:
+            out[name] = build_app_data.WMAS[name]
+            continue
+        out[name] = {
+            "lat": round(rng.uniform(*LAT_RANGE), 4),
+            "lon": round(rng.uniform(*LON_RANGE), 4),
+            "county": "Synthetic",
+            "access": f"Synthetic access point for {name}",
+        }
+    return out
+
+
+def season_date(season: int, month_day: tuple[int, int]) -> date:
+    """A month/day in the season opening in season (Jan-Jun fall in the next year)."""
+    month, day = month_day
+    return date(season + 1 if month <= 6 else season, month, day)
+
+
+def plan_hunts(wmas: list[str], count: int, rng: random.Random) -> list[dict]:
+    """count hunts spread over wmas; dates are offsets into their category window."""
+    areas = {}                  # (wma, category) -> [group weapon, ratio, growth]
+    numbers: dict[tuple, int] = {}
+    hunts = []
+    categories, weights = zip(*CATEGORY_WEIGHTS.items())
+    for _ in range(count):
+        category = rng.choices(categories, weights)[0]
+        wma = rng.choice(wmas)
+        area = (wma, category)
+        if area not in areas:
+            areas[area] = [
+                rng.choice(GROUP_WEAPONS),
+                RATIO_MEDIAN * math.exp(rng.gauss(0, RATIO_AREA_SD)),
+                rng.gauss(0, GROWTH_SD),
+            ]
+        weapon, ratio, growth = areas[area]
+        number = numbers[area] = numbers.get(area, 0) + 1
+        label, first, last, days, quota = PLANS[category]
+        window = (season_date(2000, last) - season_date(2000, first)).days
+        length = rng.randint(*days)
+        # Weekly slots from the window's start, wrapping once they run out.
+        slot = ((number - 1) * 7 + rng.randint(0, 2)) % max(window - length, 1)
+        hunt = {
+            "wma": wma,
+            "category": category,
+            "number": number,
+            "offset": slot,
+            "days": length,
+            "ratio": ratio * math.exp(rng.gauss(0, RATIO_HUNT_SD)),
+            "growth": growth,
+        }
+        if category == "group":
+            hunt["label"] = weapon
+            hunt["md_quota"], hunt["stats_quota"], hunt["permits"] = rng.choice(GROUP_QUOTAS)
+        else:
+            hunt["label"] = label
+            hunt["permits"] = rng.randint(*quota)
+            hunt["md_quota"] = hunt["stats_quota"] = str(hunt["permits"])
+        hunts.append(hunt)
+    return hunts
+
+
+def hunt_dates(hunt: dict, season: int) -> tuple[date, date]:
+    start = season_date(season, PLANS[hunt["category"]][1]) + timedelta(days=hunt["offset"])
+    return start, start + timedelta(days=hunt["days"] - 1)
+
+
+def md_dates(start: date, end: date) -> str:
+    """"Oct.1-4" / "Nov.30-Dec.6", as the extracted tables read."""
+    tail = f"{end:%b}.{end.day}" if end.month != start.month else str(end.day)
+    return f"{start:%b}.{start.day}-{tail}"
+
+
+def pdf_dates(start: date, end: date) -> str:
+    """"Oct. 1 - 4" / "Nov. 30 - Dec. 6", as the PDF text reads."""
+    tail = f"{end:%b}. {end.day}" if end.month != start.month else str(end.day)
+    return f"{start:%b}. {start.day} - {tail}"
+
+
+def hunt_name(hunt: dict, stats: bool = False) -> str:
+    """The schedule name; the stats PDF prefixes group hunts with "Group"."""
+    label = f"Group {hunt['label']}" if stats and hunt["category"] == "group" else hunt["label"]
+    return f"{hunt['wma']} - {label} Hunt {hunt['number']}"
+
+
+def selections(hunt: dict, season: int, last: int, rng: random.Random) -> int:
+    """Applications (selections) for hunt in season; demand drifts by the area growth."""
+    ratio = hunt["ratio"] * math.exp(hunt["growth"] * (season - last) + rng.gauss(0, SEASON_NOISE_SD))
+    quota = 4 if hunt["md_quota"].startswith("4 groups") else 1 if hunt["category"] == "group" \
+        else hunt["permits"]
+    return max(1, round(quota * ratio))
+
+
+def write_season(out: Path, hunts: list[dict], season: int) -> int:
+    """Tables, CSVs and schedule text for one season; returns the CSV rows written."""
+    label = f"{season}_{str(season + 1)[-2:]}"
+    (out / "raw").mkdir(parents=True, exist_ok=True)
+    (out / "schedules").mkdir(parents=True, exist_ok=True)
+    rows = 0
+    for category, (hunt_type, csv_name) in parse_mdwfp_draws.CATEGORIES.items():
+        mine = [h for h in hunts if h["category"] == category]
+        table = ["| Hunt | Dates | Quota |", "|---|---|---|"]
+        schedule = ["Hunt Dates Quota"]
+        for h in mine:
+            start, end = hunt_dates(h, season)
+            table.append(f"| {hunt_name(h)} | {md_dates(start, end)} | {h['md_quota']} |")
+            # The group schedule prints no quota column.
+            quota = "" if category == "group" else f" {h['permits']}"
+            schedule.append(f"{hunt_name(h)} {pdf_dates(start, end)}{quota}")
+        md = out / "raw" / f"{category}_{label}.md"
+        md.write_text("\n".join(table) + "\n", encoding="utf-8")
+        (out / "schedules" / f"{category}_{season}.txt").write_text(
+            "\n".join(schedule) + "\n", encoding="utf-8")
+        parsed = parse_mdwfp_draws.parse_table(md, hunt_type, season)
+        parse_mdwfp_draws.write_csv(parsed, out / csv_name.format(season=label))
+        rows += len(parsed)
+    return rows
+
+
+def write_stats(out: Path, hunts: list[dict], season: int, last: int, rng: random.Random) -> None:
+    (out / "stats").mkdir(parents=True, exist_ok=True)
+    lines = [f"WMA Deer Draw Hunt Stats – {season}", "Hunt Dates Quota App. Selections"]
+    for h in hunts:
+        start, end = hunt_dates(h, season)
+        lines.append(f"{hunt_name(h, stats=True)} {pdf_dates(start, end)} {h['stats_quota']} "
+                     f"{selections(h, season, last, rng)}")
+    (out / "stats" / f"stats_{season}.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def party_applications(hunts: list[dict], party: int, count: int,
+                       rng: random.Random) -> list[dict]:
+    """count APPLICATIONS entries over distinct hunts, each with up to its party cap."""
+    hunters = [f"Hunter {i + 1}" for i in range(party)]
+    out = []
+    for i, h in enumerate(rng.sample(hunts, min(count, len(hunts)))):
+        cap = 4 if h["md_quota"].startswith("4 groups") else 3 if h["category"] == "group" else 2
+        app = {
+            "hunt": hunt_name(h),
+            "status": rng.choice(STATUSES),
+            "hunters": sorted(rng.sample(hunters, rng.randint(1, min(cap, party)))),
+            "ref": f"Choice {i % 5 + 1}",
+        }
+        if h["category"] == "group":
+            app["groupId"] = f"G{i + 1:05d}"
+        out.append(app)
+    return out
+
+
+def generate(out: Path, wmas: int = 40, hunts: int = 300, seasons: int = 2, season: int = 2026,
+             party: int = 4, applications: int = 5, seed: int = 0) -> dict:
+    """Write a catalog under out; returns counts of what was written.
+
+    seasons schedules end at season; stats cover the seasons before each of
+    them. applications entries are spread over party hunters in the last season.
+    """
+    rng = random.Random(seed)
+    out.mkdir(parents=True, exist_ok=True)
+    names = wma_names(wmas, rng)
+    plan = plan_hunts(names, hunts, rng)
+    first = season - seasons + 1
+    rows = 0
+    for year in range(first, season + 1):
+        rows += write_season(out, plan, year)
+    for year in range(first - 1, season):
+        write_stats(out, plan, year, season - 1, rng)
+    (out / "wmas.json").write_text(
+        json.dumps(wma_entries(names, rng), indent=2) + "\n", encoding="utf-8")
+    (out / "applications.json").write_text(
+        json.dumps(party_applications(plan, party, applications, rng), indent=2) + "\n",
+        encoding="utf-8")
+    return {"wmas": len(names), "hunts": len(plan), "seasons": seasons, "csv_rows": rows,
+            "applications": min(applications, len(plan))}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic MDWFP-style catalog.")
+    parser.add_argument("out", type=Path, help="directory to write (laid out like data/)")
+    parser.add_argument("--wmas", type=int, default=40, help="WMAs (default 40)")
+    parser.add_argument("--hunts", type=int, default=300, help="hunts per season (default 300)")
+    parser.add_argument("--seasons", type=int, default=2,
+                        help="seasons of schedules, each with the season before's stats (default 2)")
+    parser.add_argument("--season", type=int, default=2026, help="opening year of the last season")
+    parser.add_argument("--party", type=int, default=4, help="hunters in the party (default 4)")
+    parser.add_argument("--applications", type=int, default=5,
+                        help="APPLICATIONS entries in the last season (default 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    counts = generate(args.out, args.wmas, args.hunts, args.seasons, args.season,
+                      args.party, args.applications, args.seed)
+    print(f"Wrote {args.out}: {counts['hunts']} hunts across {counts['wmas']} WMAs, "
+          f"{counts['seasons']} seasons ({counts['csv_rows']} CSV rows), "
+          f"{counts['applications']} applications")
+
+
+if __name__ == "__main__":
+    main()
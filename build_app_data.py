@@ -6,21 +6,56 @@ JavaScript module the static site loads directly (no fetch, so it works from
 file:// as well as GitHub Pages).
 
 Run:  python build_app_data.py
+      python build_app_data.py --incremental   (reuse unchanged hunts from the
+                                                last build; see MANIFEST)
+      python build_app_data.py --profile       (per-stage timings; see
+                                                stage_profile.py)
 """
 
 from __future__ import annotations
 
+import argparse
+import base64
 import csv
+import hashlib
+import io
 import json
 import os
-import math
 import re
-from datetime import date, datetime, timedelta
+import sys
+from array import array
+from collections import Counter
+from datetime import date, datetime
 from pathlib import Path
 
+import drive_matrix
+import hunt_scoring
+from drive_matrix import ACCESS_MINUTES, AVG_MPH, ROAD_FACTOR, DriveMatrix, load_pins
+from hunt_scoring import (
+    RUT_WINDOW_TEMPLATE,
+    SeasonCalendar,
+    best_day,
+    best_days,
+    season_calendar,
+)
+from atomic_write import write_text_atomic
+from interval_index import IntervalIndex, day_number
+from stage_profile import StageProfiler
+
 ROOT = Path(__file__).parent
 DATA_DIR = ROOT / "data"
 OUT = ROOT / "assets" / "data.js"
+# Per-hunt drawer detail, one script per shard, next to data.js.
+DETAIL_DIR_NAME = "detail"
+SHARD_SIZE = 32
+# Sort/filter columns as typed-array bytes, next to data.js.
+PACKED_NAME = "packed.js"
+PACKED_VERSION = 1
+# Input fingerprints and per-hunt outputs from the last --incremental build.
+MANIFEST = ROOT / ".cache" / "build_app_data.json"
+MANIFEST_VERSION = 2
+# --profile writes its stage timings here unless given a path.
+PROFILE_REPORT = ROOT / ".cache" / "profile" / "build_app_data.json"
 
 # --------------------------------------------------------------------------
 # Camp + WMA geography
@@ -162,122 +197,51 @@ if not os.environ.get("PUBLIC_BUILD"):
     except ImportError:
         pass
 
-# Delta backroads wander; straight-line distance badly understates the drive.
-ROAD_FACTOR = 1.45      # driven miles per straight-line mile
-AVG_MPH = 47.0          # blended highway + county road speed
-ACCESS_MINUTES = 10     # gravel WMA access road / permit station
-
+# Where the party leaves from. The camp is always the first origin; hunters'
+# homes go in origins_local.py (gitignored, like the application log) as
+# ORIGINS = [{"name": "Yazoo City", "lat": 32.855, "lon": -90.405}, ...] or on
+# the command line with --origin. PUBLIC_BUILD=1 leaves them out.
+ORIGINS = []
+if not os.environ.get("PUBLIC_BUILD"):
+    try:
+        from origins_local import ORIGINS
+    except ImportError:
+        pass
 
-def haversine_miles(lat1, lon1, lat2, lon2):
-    r = 3958.8
-    p1, p2 = math.radians(lat1), math.radians(lat2)
-    dp = math.radians(lat2 - lat1)
-    dl = math.radians(lon2 - lon1)
-    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
-    return 2 * r * math.asin(math.sqrt(a))
+# Camp, every WMA and every origin, routed once per build by main(); see
+# drive_matrix.py. Origins are keyed "origin:<name>" so they never shadow a WMA.
+_drive: DriveMatrix | None = None
 
 
-def drive_estimate(geo):
-    """Estimated (miles, minutes) from camp.
+def drive_estimate(wma, geo):
+    """(miles, minutes) from camp, looked up in the drive matrix.
 
-    The model is tuned for Delta county roads and overestimates routes that run
-    mostly on interstate. Measure a route in Maps and set `drive_minutes` on the
-    WMA entry to pin the real number; the estimate is then ignored.
+    The road model (ROAD_FACTOR, AVG_MPH, ACCESS_MINUTES) is tuned for Delta
+    county roads and overestimates routes that run mostly on interstate. The
+    OSRM routes in data/locations_from_cabin.json replace it where they were
+    measured to the same access point. To pin a number by hand, measure the
+    route in Maps and set `drive_minutes` on the WMA entry.
     """
-    straight = haversine_miles(CAMP["lat"], CAMP["lon"], geo["lat"], geo["lon"])
-    miles = straight * ROAD_FACTOR
-    minutes = miles / AVG_MPH * 60 + ACCESS_MINUTES
+    miles, minutes = _drive.route("camp", wma)
     return round(miles, 1), int(round(geo.get("drive_minutes", minutes)))
 
 
-# --------------------------------------------------------------------------
-# Moon
-# --------------------------------------------------------------------------
-SYNODIC = 29.530588853
-NEW_MOON_EPOCH = datetime(2000, 1, 6, 18, 14)
-
-
-def moon_age(d: date) -> float:
-    """Days since the most recent new moon (0 = new, ~14.8 = full)."""
-    delta = datetime(d.year, d.month, d.day, 12) - NEW_MOON_EPOCH
-    return (delta.total_seconds() / 86400.0) % SYNODIC
-
-
-def moon_phase_name(age: float) -> str:
-    if age < 1.85 or age >= 27.68:
-        return "New Moon"
-    if age < 5.54:
-        return "Waxing Crescent"
-    if age < 9.23:
-        return "First Quarter"
-    if age < 12.91:
-        return "Waxing Gibbous"
-    if age < 16.61:
-        return "Full Moon"
-    if age < 20.30:
-        return "Waning Gibbous"
-    if age < 23.99:
-        return "Last Quarter"
-    return "Waning Crescent"
-
-
-def moon_illumination(age: float) -> float:
-    return round((1 - math.cos(2 * math.pi * age / SYNODIC)) / 2, 3)
-
-
-def moon_score(age: float) -> float:
-    """0-10. Deer move best around the new moon (dark nights push daylight
-    feeding) and secondarily around the full moon (midday movement)."""
-    dist_new = min(age, SYNODIC - age)
-    dist_full = abs(age - SYNODIC / 2)
-    if dist_new <= 3:
-        return 10.0 - (dist_new / 3) * 1.5      # 10.0 -> 8.5
-    if dist_full <= 3:
-        return 8.0 - (dist_full / 3) * 1.5      # 8.0 -> 6.5
-    return 5.5
-
-
-# --------------------------------------------------------------------------
-# Rut (South Delta / Mississippi Delta region timing)
-# --------------------------------------------------------------------------
-# Windows are (month, day) pairs anchored to the season's opening calendar year,
-# so the same model applies to whichever season's CSVs are dropped into data/.
-# `+1` marks a date that falls in the following calendar year.
-RUT_WINDOW_TEMPLATE = [
-    ((12, 26), (1, 8, "+1"), 10.0, "Peak Rut",
-     "Peak breeding — bucks on their feet all day"),
-    ((12, 10), (12, 25), 8.5, "Pre-Rut Chase",
-     "Chase phase ramping up, scrapes hot"),
-    ((1, 9, "+1"), (1, 22, "+1"), 7.5, "Post-Rut",
-     "Second estrus and hungry, recovering bucks"),
-    ((11, 15), (12, 9), 7.0, "Early Rut Build",
-     "Rubs and scrapes appearing, movement climbing"),
-    ((11, 1), (11, 14), 6.0, "Pre-Rut",
-     "Bachelor groups breaking up"),
-    ((10, 1), (10, 31), 5.0, "Early Season",
-     "Food-source pattern hunting"),
-]
-
-_rut_windows: list = []
-
+def origin_minutes(origins, wma, geo):
+    """Drive minutes to a WMA from each origin, camp first (matches driveMinutes)."""
+    camp = drive_estimate(wma, geo)[1]
+    return [camp] + [int(round(_drive.route(f"origin:{o['name']}", wma)[1])) for o in origins]
 
-def build_rut_windows(season_year: int):
-    """Materialize RUT_WINDOW_TEMPLATE against the season's opening year."""
-    out = []
-    for start, end, score, label, note in RUT_WINDOW_TEMPLATE:
-        def resolve(spec):
-            month, day = spec[0], spec[1]
-            year = season_year + 1 if len(spec) > 2 else season_year
-            return date(year, month, day)
-        out.append((resolve(start), resolve(end), score, label, note))
-    return out
 
-
-def rut_info(d: date):
-    for start, end, score, label, note in _rut_windows:
-        if start <= d <= end:
-            return score, label, note
-    return 4.5, "Late Season", "Food-driven movement, pressured deer"
+def parse_origin(text):
+    """--origin "Yazoo City=32.855,-90.405" -> {"name", "lat", "lon"}."""
+    name, _, coords = text.partition("=")
+    try:
+        lat, lon = (float(v) for v in coords.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=LAT,LON, got {text!r}") from None
+    if not name.strip():
+        raise argparse.ArgumentTypeError(f"expected NAME=LAT,LON, got {text!r}")
+    return {"name": name.strip(), "lat": lat, "lon": lon}
 
 
 # --------------------------------------------------------------------------
@@ -286,11 +250,6 @@ def rut_info(d: date):
 WEIGHTS = {"rut": 0.40, "moon": 0.25, "season": 0.15, "permits": 0.10, "duration": 0.10}
 
 
-def season_score(d: date) -> float:
-    """Cold-front probability / weather quality by month."""
-    return {12: 10.0, 1: 9.0, 11: 7.5, 10: 5.0, 2: 6.5}.get(d.month, 5.0)
-
-
 def permit_score(permits: int | None) -> float:
     # More permits = better draw odds. 24 is the largest offering in the data.
     # Refuge lotteries don't publish quotas — score those neutrally rather than
@@ -304,7 +263,12 @@ def duration_score(days: int) -> float:
     return min(10.0, 4.0 + (days - 1) * 1.5)
 
 
-def build_hunt(row: dict) -> dict:
+_calendar: SeasonCalendar | None = None
+
+
+def build_hunt(row: dict, best: int | None = None) -> dict:
+    """One hunt's app record. `best` is its best_day index when the caller has
+    already scored a batch with best_days."""
     start = datetime.strptime(row["start_date"], "%Y-%m-%d").date()
     end = datetime.strptime(row["end_date"], "%Y-%m-%d").date()
     permits = int(row["permits_available"]) if row.get("permits_available") else None
@@ -321,19 +285,11 @@ def build_hunt(row: dict) -> dict:
     else:
         max_party = 2
 
-    # Score the hunt on its best single day rather than only the opener.
-    best = None
-    for i in range(days):
-        d = start + timedelta(days=i)
-        age = moon_age(d)
-        r_score, r_label, r_note = rut_info(d)
-        combined = r_score * WEIGHTS["rut"] + moon_score(age) * WEIGHTS["moon"]
-        if best is None or combined > best[0]:
-            best = (combined, d, age, r_score, r_label, r_note)
-    _, best_day, age, r_score, r_label, r_note = best
-
-    m_score = moon_score(age)
-    s_score = season_score(best_day)
+    cal = _calendar
+    i = best_day(cal, start, days) if best is None else best
+    r_score, r_label, r_note = cal.rut_score[i], cal.rut_label[i], cal.rut_note[i]
+    m_score = cal.moon_score[i]
+    s_score = cal.season_score[i]
     p_score = permit_score(permits)
     d_score = duration_score(days)
     total = (
@@ -356,7 +312,7 @@ def build_hunt(row: dict) -> dict:
     geo = WMAS.get(wma)
     if geo is None:
         raise SystemExit(f"No coordinates recorded for WMA: {wma!r}")
-    miles, minutes = drive_estimate(geo)
+    miles, minutes = drive_estimate(wma, geo)
 
     return {
         "id": row["hunt_name"].lower().replace(" ", "-").replace("(", "").replace(")", ""),
@@ -376,9 +332,9 @@ def build_hunt(row: dict) -> dict:
         "notes": row.get("notes") or "",
         "driveMinutes": minutes,
         "driveMiles": miles,
-        "bestDay": best_day.isoformat(),
-        "moonPhase": moon_phase_name(age),
-        "moonIllum": moon_illumination(age),
+        "bestDay": cal.days[i].isoformat(),
+        "moonPhase": cal.moon_phase[i],
+        "moonIllum": cal.moon_illum[i],
         "rutPhase": r_label,
         "rutNote": r_note,
         "scores": None if total is None else {
@@ -392,6 +348,62 @@ def build_hunt(row: dict) -> dict:
     }
 
 
+def season_year_of(rows) -> int:
+    """Opening year of the season rows belong to. A season opens in the
+    summer, so anything before July belongs to the season that started the
+    previous calendar year."""
+    earliest = min(datetime.strptime(r["start_date"], "%Y-%m-%d").date() for r in rows)
+    return earliest.year if earliest.month >= 7 else earliest.year - 1
+
+
+def prepare_scoring(season_year: int, origins=()) -> None:
+    """Build the season calendar and drive matrix that build_hunt reads."""
+    global _calendar, _drive
+    _calendar = season_calendar(season_year, WEIGHTS)
+    _drive = DriveMatrix(
+        {"camp": CAMP, **WMAS, **{f"origin:{o['name']}": o for o in origins}},
+        load_pins(),
+        origins=["camp", *(f"origin:{o['name']}" for o in origins)],
+        cache_dir=drive_matrix.CACHE_DIR,
+    )
+
+
+def score_rows(rows) -> list[dict]:
+    """build_hunt for every row, with best days scored as one batch."""
+    best = best_days(
+        _calendar,
+        [datetime.strptime(r["start_date"], "%Y-%m-%d").date() for r in rows],
+        [int(r["duration_days"]) for r in rows],
+    )
+    return [build_hunt(r, b) for r, b in zip(rows, best)]
+
+
+def wma_list(hunts, origins=None) -> list[dict]:
+    """Every WMA with its drive from camp and hunt count, nearest first.
+
+    With origins, each entry also carries originMinutes (see origin_minutes).
+    """
+    counts = Counter(h["wma"] for h in hunts)
+    wmas = []
+    for name, geo in WMAS.items():
+        miles, minutes = drive_estimate(name, geo)
+        wma = {
+            "name": name,
+            "county": geo["county"],
+            "access": geo["access"],
+            "lat": geo["lat"],
+            "lon": geo["lon"],
+            "driveMiles": miles,
+            "driveMinutes": minutes,
+        }
+        if origins is not None:
+            wma["originMinutes"] = origin_minutes(origins, name, geo)
+        wma["hunts"] = counts[name]
+        wmas.append(wma)
+    wmas.sort(key=lambda w: w["driveMinutes"])
+    return wmas
+
+
 def discover_csvs():
     """Use the newest season present in data/, so last year's CSVs can stay on
     disk for reference without being picked up."""
@@ -407,124 +419,482 @@ def discover_csvs():
     return [p for p in found if p.name.endswith(f"_{newest}.csv")]
 
 
-def main():
-    global _rut_windows
+# --------------------------------------------------------------------------
+# Incremental builds
+# --------------------------------------------------------------------------
+def fingerprint(obj) -> str:
+    """Stable hash of any JSON-able value (dict key order does not matter)."""
+    blob = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def scoring_fingerprint(season_year: int) -> str:
+    """Everything build_hunt reads besides the row and its WMA entry.
+
+    The source of this module, hunt_scoring and drive_matrix is included so an
+    edit to the scoring code itself invalidates every cached hunt. Hunts only
+    carry the drive from camp, so that row of the matrix stands in for the
+    coordinates, road model and pinned routes (extra origins don't matter).
+    """
+    return fingerprint({
+        "season": season_year,
+        "weights": WEIGHTS,
+        "rutWindows": RUT_WINDOW_TEMPLATE,
+        "drive": [_drive.route("camp", wma) for wma in sorted(WMAS)],
+        "code": [hashlib.sha256(Path(m.__file__).read_bytes()).hexdigest()
+                 for m in (sys.modules[__name__], hunt_scoring, drive_matrix)],
+    })
 
-    paths = discover_csvs()
-    if not paths:
-        raise SystemExit(f"No hunt CSVs found in {DATA_DIR}")
 
-    rows = []
+def load_manifest() -> dict:
+    try:
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def up_to_date(manifest: dict, build_key: str) -> bool:
+    """Whether the last build had these inputs and its outputs are still on disk as written."""
+    outputs = manifest.get("outputs")
+    if manifest.get("inputs", {}).get("build") != build_key or not outputs:
+        return False
+    for path, digest in ((OUT, outputs["data"]), (OUT.parent / PACKED_NAME, outputs["packed"])):
+        try:
+            if hashlib.sha256(path.read_bytes()).hexdigest() != digest:
+                return False
+        except FileNotFoundError:
+            return False
+    shard_dir = OUT.parent / DETAIL_DIR_NAME
+    return all((shard_dir / name).exists() for name in outputs["shards"])
+
+
+def read_rows(paths, manifest: dict) -> tuple[list[dict], dict, dict]:
+    """Rows from every CSV, reusing the manifest's copy of any unchanged file.
+
+    Returns (rows, csv_hashes, rows_by_file) — the last two go into the next
+    manifest.
+    """
+    cached_hashes = manifest.get("inputs", {}).get("csvs", {})
+    cached_rows = manifest.get("rows", {})
+    rows, hashes, by_file = [], {}, {}
     for path in paths:
-        with path.open(newline="", encoding="utf-8-sig") as fh:
-            rows.extend(r for r in csv.DictReader(fh) if r.get("hunt_name"))
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if cached_hashes.get(path.name) == digest and path.name in cached_rows:
+            file_rows = cached_rows[path.name]
+        else:
+            fh = io.StringIO(raw.decode("utf-8-sig"), newline="")
+            file_rows = [r for r in csv.DictReader(fh) if r.get("hunt_name")]
+        hashes[path.name] = digest
+        by_file[path.name] = file_rows
+        rows.extend(file_rows)
+    return rows, hashes, by_file
 
-    # A season opens in the summer, so anything before July belongs to the
-    # season that started the previous calendar year.
-    earliest = min(datetime.strptime(r["start_date"], "%Y-%m-%d").date() for r in rows)
-    season_year = earliest.year if earliest.month >= 7 else earliest.year - 1
-    _rut_windows = build_rut_windows(season_year)
-    season_label = f"{season_year}-{str(season_year + 1)[-2:]}"
-
-    hunts = [build_hunt(r) for r in rows]
-
-    by_name = {h["name"]: h for h in hunts}
-    missing = [a["hunt"] for a in APPLICATIONS if a["hunt"] not in by_name]
-    if missing:
-        raise SystemExit("APPLICATIONS names not found in the data: " + ", ".join(missing))
-
-    planned = []
-    for app in APPLICATIONS:
-        h = by_name[app["hunt"]]
-        h["planned"] = True
-        h["status"] = app["status"]
-        h["hunters"] = app["hunters"]
-        h["ref"] = app["ref"]
-        h["todo"] = app.get("todo", "")
-        h["groupId"] = app.get("groupId", "")
-        h["transaction"] = app.get("transaction", "")
-        planned.append(h)
-
-    # Hunts you cannot physically attend both of. A shared hunter makes it worse:
-    # the same person is committed to two places at once.
-    for a in planned:
-        clashes = []
-        for b in planned:
-            if b is a or not (a["start"] <= b["end"] and b["start"] <= a["end"]):
-                continue
-            shared = sorted(set(a["hunters"]) & set(b["hunters"]))
-            clashes.append({"name": b["name"], "sharedHunters": shared})
-        a["conflictsWith"] = clashes
-
-    # TR Complex rule: "Applicants may apply for only one limited draw deer
-    # hunt." Count each hunter's refuge applications so a violation is obvious.
-    refuge_load = {}
-    for h in planned:
-        if h["agency"] != "USFWS":
-            continue
-        for who in h["hunters"]:
-            refuge_load.setdefault(who, []).append(h["name"])
-    over_limit = [
-        {"hunter": who, "hunts": names}
-        for who, names in sorted(refuge_load.items()) if len(names) > 1
-    ]
 
-    hunts.sort(key=lambda h: (h["score"] is None, -(h["score"] or 0), h["start"]))
+# --------------------------------------------------------------------------
+# Output
+# --------------------------------------------------------------------------
+# What app.js needs to filter, sort and draw cards and the calendar. Strings
+# with few distinct values are interned: the column holds an index into
+# dicts[field].
+CORE_FIELDS = [
+    "id", "name", "type", "species", "wma", "start", "end", "days", "permits",
+    "groupSize", "agency", "maxParty", "restriction", "driveMinutes", "driveMiles",
+    "moonPhase", "rutPhase", "score",
+]
+INTERNED = {"type", "species", "wma", "agency", "restriction", "moonPhase", "rutPhase"}
+# Only the detail drawer reads these; they load from a shard when it opens.
+DETAIL_FIELDS = ["county", "notes", "bestDay", "moonIllum", "rutNote", "scores"]
+
+
+def columnar(hunts):
+    """Hunts as one array per CORE_FIELDS entry, in the order given."""
+    dicts = {f: [] for f in CORE_FIELDS if f in INTERNED}
+    codes = {f: {} for f in dicts}
+    columns = {f: [] for f in CORE_FIELDS}
+    for h in hunts:
+        for f in CORE_FIELDS:
+            value = h.get(f)
+            if f in codes:
+                if value not in codes[f]:
+                    codes[f][value] = len(dicts[f])
+                    dicts[f].append(value)
+                value = codes[f][value]
+            columns[f].append(value)
+    return {"count": len(hunts), "dicts": dicts, "columns": columns}
+
+
+def write_detail_shards(hunts, out_dir):
+    """Write DETAIL_FIELDS in SHARD_SIZE slices, as scripts app.js can load from file://.
+
+    Shard n covers hunts[n * SHARD_SIZE:] and calls window.HUNT_DETAIL(n, rows).
+    Names are content hashes, so a cached shard can never go stale under a new
+    data.js. Old shards are left for prune_detail_shards, once data.js is in.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    names = []
+    for n, start in enumerate(range(0, len(hunts), SHARD_SIZE)):
+        rows = [{f: h.get(f) for f in DETAIL_FIELDS} for h in hunts[start:start + SHARD_SIZE]]
+        text = f"window.HUNT_DETAIL({n},{json.dumps(rows, separators=(',', ':'))});\n"
+        name = f"{hashlib.sha256(text.encode()).hexdigest()[:16]}.js"
+        if not (out_dir / name).exists():
+            write_text_atomic(out_dir / name, text)
+        names.append(name)
+    # Scripts resolve against index.html, which sits next to assets/.
+    prefix = f"{out_dir.parent.name}/{out_dir.name}"
+    return {"shardSize": SHARD_SIZE, "shards": [f"{prefix}/{n}" for n in names]}
 
-    wmas = []
-    for name, geo in WMAS.items():
-        miles, minutes = drive_estimate(geo)
-        wmas.append({
-            "name": name,
-            "county": geo["county"],
-            "access": geo["access"],
-            "lat": geo["lat"],
-            "lon": geo["lon"],
-            "driveMiles": miles,
-            "driveMinutes": minutes,
-            "hunts": sum(1 for h in hunts if h["wma"] == name),
-        })
-    wmas.sort(key=lambda w: w["driveMinutes"])
 
-    peak = next(w for w in _rut_windows if w[3] == "Peak Rut")
-    payload = {
-        "season": season_label,
-        "seasonYear": season_year,
-        "generated": date.today().isoformat(),
-        "sourceFiles": [p.name for p in paths],
-        "peakRut": {"start": peak[0].isoformat(), "end": peak[1].isoformat()},
-        "planned": [
-            {"name": h["name"], "start": h["start"], "end": h["end"],
-             "status": h["status"], "hunters": h["hunters"], "ref": h["ref"],
-             "todo": h["todo"], "groupId": h["groupId"],
-             "transaction": h["transaction"],
-             "wma": h["wma"], "driveMinutes": h["driveMinutes"],
-             "conflictsWith": h["conflictsWith"]}
-            for h in sorted(planned, key=lambda h: h["start"])
-        ],
-        "refugeOverLimit": over_limit,
-        "camp": CAMP,
-        "driveModel": {
-            "roadFactor": ROAD_FACTOR,
-            "avgMph": AVG_MPH,
-            "accessMinutes": ACCESS_MINUTES,
-        },
-        "weights": WEIGHTS,
-        "wmas": wmas,
-        "hunts": hunts,
+SHARD_RE = re.compile(r"[0-9a-f]{16}\.js")
+
+
+def shard_names(data_js: Path) -> set[str]:
+    """Detail shards an existing data.js refers to."""
+    try:
+        text = data_js.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return set()
+    m = re.search(r'"shards":\[([^\]]*)\]', text)
+    return set(SHARD_RE.findall(m.group(1))) if m else set()
+
+
+def prune_detail_shards(out_dir, keep) -> None:
+    """Remove shards outside keep, the current and the previous data.js's.
+
+    A page that loaded the previous data.js, before or during this build,
+    still finds its shards; they go one build later.
+    """
+    for old in out_dir.glob("*.js"):
+        if old.name not in keep and SHARD_RE.fullmatch(old.name):
+            old.unlink()
+
+
+# What the search box matches against. county and notes live in the detail
+# shards, so without the index a search could not see them before a drawer
+# opened.
+SEARCH_FIELDS = ["name", "wma", "county", "type", "restriction", "notes", "rutPhase", "moonPhase"]
+# app.js splits the query with the same pattern.
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def search_index(hunts):
+    """Inverted index over SEARCH_FIELDS for the search box.
+
+    tokens is the sorted vocabulary and postings[t] the rows (hunt order)
+    whose text has tokens[t]. trigrams maps every three-character run to the
+    tokens containing it, so app.js finds a word inside a token without
+    scanning the vocabulary; words shorter than three match token prefixes.
+    """
+    rows_by_token = {}
+    for row, h in enumerate(hunts):
+        text = " ".join(str(h.get(f) or "") for f in SEARCH_FIELDS).lower()
+        for token in set(TOKEN_RE.findall(text)):
+            rows_by_token.setdefault(token, []).append(row)
+    tokens = sorted(rows_by_token)
+    trigrams = {}
+    for t, token in enumerate(tokens):
+        for gram in sorted({token[i:i + 3] for i in range(len(token) - 2)}):
+            trigrams.setdefault(gram, []).append(t)
+    return {
+        "fields": SEARCH_FIELDS,
+        "tokens": tokens,
+        "postings": [rows_by_token[t] for t in tokens],
+        "trigrams": dict(sorted(trigrams.items())),
     }
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(
+
+# array typecode -> typed-array name in app.js. Uint16 0xFFFF means "not published".
+TYPED_ARRAYS = {"f": "f32", "H": "u16", "B": "u8"}
+NO_VALUE = 0xFFFF
+
+
+def pack_hunts(hunts):
+    """The columns app.js sorts and filters on, as one little-endian buffer.
+
+    score is Float32 (NaN when unscored); start and end are Uint16 days after
+    baseDay; driveMinutes and permits are Uint16; type, wma and month are
+    codes into dicts, Uint8 unless a dictionary outgrows it. Columns are laid
+    out widest first so every typed array starts on its own alignment.
+    """
+    base = min((day_number(h["start"]) for h in hunts), default=0)
+    dicts, columns = {}, [
+        ("score", "f", [float("nan") if h["score"] is None else h["score"] for h in hunts]),
+        ("start", "H", [day_number(h["start"]) - base for h in hunts]),
+        ("end", "H", [day_number(h["end"]) - base for h in hunts]),
+        ("driveMinutes", "H", [h["driveMinutes"] for h in hunts]),
+        ("permits", "H", [NO_VALUE if h["permits"] is None else h["permits"] for h in hunts]),
+    ]
+    for field, values in (("type", [h["type"] for h in hunts]),
+                          ("wma", [h["wma"] for h in hunts]),
+                          ("month", [h["start"][:7] for h in hunts])):
+        codes = {}
+        column = [codes.setdefault(v, len(codes)) for v in values]
+        dicts[field] = list(codes)
+        columns.append((field, "B" if len(codes) <= 0x100 else "H", column))
+
+    buf, layout = bytearray(), {}
+    for field, code, values in sorted(columns, key=lambda c: -array(c[1]).itemsize):
+        arr = array(code, values)
+        if sys.byteorder == "big":
+            arr.byteswap()
+        layout[field] = [TYPED_ARRAYS[code], len(buf)]
+        buf += arr.tobytes()
+    packed = {
+        "version": PACKED_VERSION,
+        "count": len(hunts),
+        "baseDay": base,
+        "columns": layout,
+        "dicts": dicts,
+        "data": base64.b64encode(bytes(buf)).decode("ascii"),
+    }
+    packed["digest"] = fingerprint(packed)[:16]
+    return packed
+
+
+def render_data(payload: dict) -> str:
+    return (
         "// Generated by build_app_data.py — do not edit by hand.\n"
-        "window.HUNT_DATA = " + json.dumps(payload, indent=2) + ";\n",
-        encoding="utf-8",
+        "window.HUNT_DATA = " + json.dumps(payload, separators=(",", ":")) + ";\n"
     )
-    print(f"Wrote {OUT} — season {season_label}, {len(hunts)} hunts across {len(wmas)} WMAs")
-    print(f"  sources: {', '.join(p.name for p in paths)}")
-    for w in wmas:
-        flag = "within 1.5h" if w["driveMinutes"] <= 90 else "beyond 1.5h"
-        print(f"  {w['name']:<32} {w['driveMinutes']:>4} min  ({flag})")
+
+
+def built_on(path: Path) -> str | None:
+    """The "generated" date in an existing data.js, if there is one."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    m = re.search(r'"generated":"(\d{4}-\d{2}-\d{2})"', text)
+    return m.group(1) if m else None
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text unless path already holds it; True when it was written.
+
+    Leaving an unchanged file (and its mtime) alone means a watcher or the
+    browser cache does not see a rebuild that isn't one.
+    """
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    write_text_atomic(path, text)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build assets/data.js from the season CSVs.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="rescore only hunts whose inputs changed since the last build "
+                             "(state kept in .cache/build_app_data.json)")
+    parser.add_argument("--origin", action="append", default=[], type=parse_origin,
+                        metavar="NAME=LAT,LON",
+                        help="another place the party drives from (repeatable; adds to "
+                             "ORIGINS from origins_local.py)")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_REPORT, type=Path, metavar="PATH",
+                        help="record wall/CPU time and peak memory per stage as JSON "
+                             f"(default {PROFILE_REPORT.relative_to(ROOT)})")
+    parser.add_argument("--profile-dump", type=Path, metavar="PATH",
+                        help="also write a cProfile of the slowest stage here")
+    args = parser.parse_args(argv)
+    profiler = StageProfiler(args.profile is not None, args.profile_dump)
+
+    with profiler.stage("discovery"):
+        paths = discover_csvs()
+        if not paths:
+            raise SystemExit(f"No hunt CSVs found in {DATA_DIR}")
+        manifest = load_manifest() if args.incremental else {}
+
+    with profiler.stage("read"):
+        rows, csv_hashes, rows_by_file = read_rows(paths, manifest)
+
+    with profiler.stage("scoring"):
+        season_year = season_year_of(rows)
+        origins = list(ORIGINS) + args.origin
+        prepare_scoring(season_year, origins)
+        season_label = f"{season_year}-{str(season_year + 1)[-2:]}"
+
+        scoring = scoring_fingerprint(season_year)
+        build_key = fingerprint([scoring, csv_hashes, WMAS, APPLICATIONS, origins, CAMP])
+
+    if args.incremental and up_to_date(manifest, build_key):
+        print(f"Unchanged {OUT} — inputs match the last build")
+        profiler.finish(args.profile, "build_app_data")
+        return
+
+    with profiler.stage("scoring"):
+        # A hunt's output depends only on its row, its WMA entry and the scoring
+        # model. The row is its file's hash and its place in the file, and the
+        # cache only holds hunts scored under the current model.
+        inputs = manifest.get("inputs", {})
+        cached_hunts = manifest.get("hunts", {}) if inputs.get("scoring") == scoring else {}
+        wma_keys = {name: fingerprint(geo)[:16] for name, geo in WMAS.items()}
+        keys = [
+            f"{csv_hashes[name][:16]}:{i}:{wma_keys.get(r['wma_location'], '-')}"
+            for name, file_rows in rows_by_file.items()
+            for i, r in enumerate(file_rows)
+        ]
+        stale = [r for k, r in zip(keys, rows) if k not in cached_hunts]
+        fresh = iter(score_rows(stale))
+
+        hunt_cache, hunts = {}, []
+        for key in keys:
+            hunt = cached_hunts[key] if key in cached_hunts else next(fresh)
+            hunt_cache[key] = dict(hunt)     # snapshot before the plan layer is added
+            hunts.append(dict(hunt))
+        rescored = len(stale)
+
+    with profiler.stage("conflicts"):
+        by_name = {h["name"]: h for h in hunts}
+        missing = [a["hunt"] for a in APPLICATIONS if a["hunt"] not in by_name]
+        if missing:
+            raise SystemExit("APPLICATIONS names not found in the data: " + ", ".join(missing))
+
+        planned = []
+        for app in APPLICATIONS:
+            h = by_name[app["hunt"]]
+            h["planned"] = True
+            h["status"] = app["status"]
+            h["hunters"] = app["hunters"]
+            h["ref"] = app["ref"]
+            h["todo"] = app.get("todo", "")
+            h["groupId"] = app.get("groupId", "")
+            h["transaction"] = app.get("transaction", "")
+            planned.append(h)
+
+        # Hunts you cannot physically attend both of. A shared hunter makes it worse:
+        # the same person is committed to two places at once. The index is kept in
+        # start order, the same order "planned" is written in below.
+        plan_index = IntervalIndex(
+            [(day_number(h["start"]), day_number(h["end"])) for h in planned],
+            range(len(planned)),
+        )
+        for n, a in enumerate(planned):
+            clashes = []
+            for m in sorted(plan_index.overlapping(day_number(a["start"]), day_number(a["end"]))):
+                b = planned[m]
+                if m == n:
+                    continue
+                shared = sorted(set(a["hunters"]) & set(b["hunters"]))
+                clashes.append({"name": b["name"], "sharedHunters": shared})
+            a["conflictsWith"] = clashes
+
+        # TR Complex rule: "Applicants may apply for only one limited draw deer
+        # hunt." Count each hunter's refuge applications so a violation is obvious.
+        refuge_load = {}
+        for h in planned:
+            if h["agency"] != "USFWS":
+                continue
+            for who in h["hunters"]:
+                refuge_load.setdefault(who, []).append(h["name"])
+        over_limit = [
+            {"hunter": who, "hunts": names}
+            for who, names in sorted(refuge_load.items()) if len(names) > 1
+        ]
+
+    with profiler.stage("aggregation"):
+        hunts.sort(key=lambda h: (h["score"] is None, -(h["score"] or 0), h["start"]))
+
+    # Shard names are content hashes, so data.js can only list them once written.
+    with profiler.stage("write"):
+        previous_shards = shard_names(OUT)
+        detail = write_detail_shards(hunts, OUT.parent / DETAIL_DIR_NAME)
+
+    with profiler.stage("aggregation"):
+        wmas = wma_list(hunts, origins)
+
+        peak = next(w for w in _calendar.rut_windows if w[3] == "Peak Rut")
+        packed = pack_hunts(hunts)
+        payload = {
+            "season": season_label,
+            "seasonYear": season_year,
+            "generated": date.today().isoformat(),
+            "sourceFiles": [p.name for p in paths],
+            "peakRut": {"start": peak[0].isoformat(), "end": peak[1].isoformat()},
+            "planned": [
+                {"name": h["name"], "start": h["start"], "end": h["end"],
+                 "status": h["status"], "hunters": h["hunters"], "ref": h["ref"],
+                 "todo": h["todo"], "groupId": h["groupId"],
+                 "transaction": h["transaction"],
+                 "wma": h["wma"], "driveMinutes": h["driveMinutes"],
+                 "conflictsWith": h["conflictsWith"]}
+                for h in sorted(planned, key=lambda h: h["start"])
+            ],
+            # Entry i of each array is planned[i]; see interval_index.py.
+            "planIndex": plan_index.to_json(),
+            "refugeOverLimit": over_limit,
+            "camp": CAMP,
+            # originMinutes on each WMA lines up with this list.
+            "origins": [{"name": "Camp", "lat": CAMP["lat"], "lon": CAMP["lon"]}]
+                       + [{"name": o["name"], "lat": o["lat"], "lon": o["lon"]} for o in origins],
+            "driveModel": {
+                "roadFactor": ROAD_FACTOR,
+                "avgMph": AVG_MPH,
+                "accessMinutes": ACCESS_MINUTES,
+            },
+            "weights": WEIGHTS,
+            "wmas": wmas,
+            "hunts": columnar(hunts),
+            "detail": detail,
+            "search": search_index(hunts),
+            # app.js only trusts packed.js when its digest matches this one.
+            "packed": packed["digest"],
+        }
+
+    with profiler.stage("serialization"):
+        packed_text = (
+            "// Generated by build_app_data.py — do not edit by hand.\n"
+            "window.HUNT_PACKED = " + json.dumps(packed, separators=(",", ":")) + ";\n"
+        )
+        # The build date moves only with the content: first render with the
+        # date data.js already carries, and restamp only if that differs.
+        previous = built_on(OUT)
+        if previous:
+            payload["generated"] = previous
+        data_text = render_data(payload)
+        if previous and not (OUT.exists() and OUT.read_text(encoding="utf-8") == data_text):
+            payload["generated"] = date.today().isoformat()
+            data_text = render_data(payload)
+        manifest_text = json.dumps({
+            "version": MANIFEST_VERSION,
+            "inputs": {
+                "build": build_key,
+                "scoring": scoring,
+                "csvs": csv_hashes,
+                "wmas": fingerprint(WMAS),
+                "weights": fingerprint(WEIGHTS),
+                "rutWindows": fingerprint(RUT_WINDOW_TEMPLATE),
+                "applications": fingerprint(APPLICATIONS),
+            },
+            "outputs": {
+                "data": hashlib.sha256(data_text.encode("utf-8")).hexdigest(),
+                "packed": hashlib.sha256(packed_text.encode("utf-8")).hexdigest(),
+                "shards": [Path(s).name for s in detail["shards"]],
+            },
+            "rows": rows_by_file,
+            "hunts": hunt_cache,
+        }) if args.incremental else None
+
+    with profiler.stage("write"):
+        write_if_changed(OUT.parent / PACKED_NAME, packed_text)
+        changed = write_if_changed(OUT, data_text)
+        prune_detail_shards(OUT.parent / DETAIL_DIR_NAME,
+                            previous_shards | {Path(s).name for s in detail["shards"]})
+        if manifest_text is not None:
+            write_text_atomic(MANIFEST, manifest_text)
+
+    if args.incremental:
+        print(f"{'Wrote' if changed else 'Unchanged'} {OUT} — rescored {rescored} of "
+              f"{len(hunts)} hunts")
+    else:
+        print(f"{'Wrote' if changed else 'Unchanged'} {OUT} — season {season_label}, "
+              f"{len(hunts)} hunts across {len(wmas)} WMAs")
+        print(f"  sources: {', '.join(p.name for p in paths)}")
+        print(f"  drive: {len(_drive.pinned)} measured routes pinned, {len(_drive.stale_pins)} ignored "
+              f"(measured to a point more than {drive_matrix.PIN_TOLERANCE_MILES:g} mi away)")
+        for w in wmas:
+            flag = "within 1.5h" if w["driveMinutes"] <= 90 else "beyond 1.5h"
+            print(f"  {w['name']:<32} {w['driveMinutes']:>4} min  ({flag})")
+    profiler.finish(args.profile, "build_app_data")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+"""Forecast next season's draw applications per WMA and method.
+
+Every area (a "location|method" key from draw_history) gets one log-linear
+model over all of its stored seasons:
+
+    log(applications) = a + b * (season - last) + c * per_hunt
+
+b is the yearly growth. c absorbs the level gap between seasons summed from
+per-hunt selections and seasons taken from area summaries, so mixing the two
+kinds of source does not read as growth. b and c carry Gaussian priors
+centred on zero (GROWTH_PRIOR_SD, LEVEL_PRIOR_SD), so an area with one or two
+seasons stays near flat instead of extrapolating noise, and the residual
+spread is shrunk toward SIGMA_PRIOR the same way.
+
+A hunt's forecast scales its own latest applications by the area growth; the
+spread is the area's residual noise plus the uncertainty in b. All areas are
+fitted together as one batch of 3x3 normal equations in NumPy; without NumPy
+each area is solved in turn.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:         # fit_areas solves each area's 3x3 system in a loop
+    np = None
+
+GROWTH_PRIOR_SD = 0.15      # log applications per season
+LEVEL_PRIOR_SD = 1.0        # per-hunt vs summary counts, log units
+SIGMA_PRIOR = 0.15          # season-to-season noise before any residuals
+SIGMA_PRIOR_DF = 2.0        # weight of SIGMA_PRIOR, in seasons
+INTERVAL_Z = 1.2816         # low/high bound an 80% interval
+
+
+def _priors(sigma2: float) -> list[float]:
+    return [0.0, sigma2 / GROWTH_PRIOR_SD ** 2, sigma2 / LEVEL_PRIOR_SD ** 2]
+
+
+def _solve(m: list[list[float]], v: list[float]) -> list[float]:
+    """Gauss-Jordan solve of a small dense system (fallback path)."""
+    n = len(v)
+    a = [row[:] + [v[i]] for i, row in enumerate(m)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        a[col], a[pivot] = a[pivot], a[col]
+        for r in range(n):
+            if r != col:
+                f = a[r][col] / a[col][col]
+                a[r] = [x - f * y for x, y in zip(a[r], a[col])]
+    return [a[i][n] / a[i][i] for i in range(n)]
+
+
+def _fit_one(xs: list[list[float]], ys: list[float]) -> tuple[list[float], float, float]:
+    """(coefficients, sigma^2, var of growth) for one area without NumPy."""
+    xtx = [[sum(x[i] * x[j] for x in xs) for j in range(3)] for i in range(3)]
+    xty = [sum(x[i] * y for x, y in zip(xs, ys)) for i in range(3)]
+    sigma2 = SIGMA_PRIOR ** 2
+    for _ in range(2):
+        lam = _priors(sigma2)
+        m = [[xtx[i][j] + (lam[i] if i == j else 0.0) for j in range(3)] for i in range(3)]
+        beta = _solve(m, xty)
+        rss = sum((y - sum(b * xi for b, xi in zip(beta, x))) ** 2 for x, y in zip(xs, ys))
+        sigma2 = (rss + SIGMA_PRIOR_DF * SIGMA_PRIOR ** 2) / (max(len(ys) - 2, 0) + SIGMA_PRIOR_DF)
+    lam = _priors(sigma2)
+    m = [[xtx[i][j] + (lam[i] if i == j else 0.0) for j in range(3)] for i in range(3)]
+    var_b = sigma2 * _solve(m, [0.0, 1.0, 0.0])[1]
+    return beta, sigma2, var_b
+
+
+def fit_areas(rows) -> dict[str, dict]:
+    """Growth model for every area in rows of (area_key, season, applications, per_hunt).
+
+    Each area gets growth (b, log per season), sigma (residual log noise),
+    growth_sd (standard error of b), seasons and last (latest season seen).
+    """
+    by_area: dict[str, list] = defaultdict(list)
+    for key, season, apps, per_hunt in rows:
+        if apps and apps > 0:
+            by_area[key].append((season, math.log(apps), 1.0 if per_hunt else 0.0))
+    keys = sorted(by_area)
+    if not keys:
+        return {}
+    last = {k: max(s for s, _, _ in by_area[k]) for k in keys}
+
+    if np is None:
+        out = {}
+        for k in keys:
+            pts = by_area[k]
+            xs = [[1.0, float(s - last[k]), h] for s, _, h in pts]
+            beta, sigma2, var_b = _fit_one(xs, [y for _, y, _ in pts])
+            out[k] = _summary(len(pts), last[k], beta[1], sigma2, var_b)
+        return out
+
+    # Areas x seasons grids, zero-weighted where an area has no season.
+    seasons = sorted({s for pts in by_area.values() for s, _, _ in pts})
+    col = {s: j for j, s in enumerate(seasons)}
+    A, S = len(keys), len(seasons)
+    y = np.zeros((A, S))
+    w = np.zeros((A, S))
+    h = np.zeros((A, S))
+    for i, k in enumerate(keys):
+        for s, ly, ph in by_area[k]:
+            y[i, col[s]], w[i, col[s]], h[i, col[s]] = ly, 1.0, ph
+    offset = np.array(seasons, dtype=float)[None, :] - np.array([last[k] for k in keys])[:, None]
+    X = np.stack([np.ones((A, S)), offset, h], axis=2)          # A x S x 3
+    xtx = np.einsum("as,asi,asj->aij", w, X, X)
+    xty = np.einsum("as,asi,as->ai", w, X, y)
+    n = w.sum(axis=1)
+    sigma2 = np.full(A, SIGMA_PRIOR ** 2)
+    prior = np.array([0.0, 1 / GROWTH_PRIOR_SD ** 2, 1 / LEVEL_PRIOR_SD ** 2])
+    for _ in range(2):
+        m = xtx + sigma2[:, None, None] * np.diag(prior)[None]
+        beta = np.linalg.solve(m, xty[:, :, None])[:, :, 0]
+        resid = (y - np.einsum("asi,ai->as", X, beta)) * w
+        sigma2 = ((resid ** 2).sum(axis=1) + SIGMA_PRIOR_DF * SIGMA_PRIOR ** 2) / (
+            np.maximum(n - 2, 0) + SIGMA_PRIOR_DF)
+    m = xtx + sigma2[:, None, None] * np.diag(prior)[None]
+    var_b = sigma2 * np.linalg.inv(m)[:, 1, 1]
+    return {
+        k: _summary(int(n[i]), last[k], float(beta[i, 1]), float(sigma2[i]), float(var_b[i]))
+        for i, k in enumerate(keys)
+    }
+
+
+def _summary(n: int, last: int, growth: float, sigma2: float, var_b: float) -> dict:
+    return {
+        "seasons": n,
+        "last": last,
+        "growth": round(growth, 4),
+        "growth_sd": round(math.sqrt(var_b), 4),
+        "sigma": round(math.sqrt(sigma2), 4),
+    }
+
+
+def forecast(applications: int, model: dict | None, season: int, from_season: int) -> dict:
+    """Predicted applications for season from a hunt's count in from_season.
+
+    median scales applications by the area growth; log_sd is the spread on
+    the log scale, and low/high bound an 80% interval. With no model the
+    count carries forward with SIGMA_PRIOR noise.
+    """
+    steps = season - from_season
+    if model is None:
+        growth, log_sd = 0.0, SIGMA_PRIOR
+    else:
+        growth = model["growth"]
+        log_sd = math.sqrt(model["sigma"] ** 2 + (model["growth_sd"] * steps) ** 2)
+    median = applications * math.exp(growth * steps)
+    return {
+        "median": round(median, 1),
+        "low": round(median * math.exp(-INTERVAL_Z * log_sd), 1),
+        "high": round(median * math.exp(INTERVAL_Z * log_sd), 1),
+        "log_sd": round(log_sd, 4),
+    }
@@ -0,0 +1,215 @@
+"""Draw statistics by season in a local SQLite store, for multi-year trends.
+
+Stats PDFs come in two shapes. Recent ones list every hunt with its quota and
+applications; older ones summarize a WMA and hunt type for a season, and some
+only give applications. Both land here under canonical keys (see
+canonical_hunt_key in analysis/build_2026_decision_data.py): hunt_stats holds
+per-hunt rows, area_stats rows per "location|method" and season. A per-hunt
+source also fills area_stats with its totals (flagged per_hunt, since summed
+hunt selections count an applicant once per hunt chosen and so run higher
+than a summary's applications), so trends always read area_best.
+
+Rows remember the PDF they came from and its SHA-256, so re-ingesting a
+changed PDF replaces exactly its rows and an unchanged one is skipped.
+Every source's rows are kept. When two sources report the same season and
+hunt (or area and method), readers see one of them through the hunt_best and
+area_best views, so the answer never depends on the order PDFs were ingested
+in. A season summary beats per-hunt totals. Between equals, the source
+covering the later season wins, being the more recent publication, and then
+the source whose file name sorts first. The
+database (data/draw_history.sqlite) is rebuilt from the PDFs and is not
+committed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import sqlite3
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+DB_PATH = ROOT / "data" / "draw_history.sqlite"
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    newest INTEGER
+);
+CREATE TABLE IF NOT EXISTS hunt_stats (
+    season INTEGER NOT NULL,
+    hunt_key TEXT NOT NULL,
+    area_key TEXT NOT NULL,
+    applications INTEGER NOT NULL,
+    permits INTEGER,
+    source TEXT NOT NULL,
+    PRIMARY KEY (season, hunt_key, source)
+);
+CREATE TABLE IF NOT EXISTS area_stats (
+    season INTEGER NOT NULL,
+    area_key TEXT NOT NULL,
+    applications INTEGER NOT NULL,
+    permits INTEGER,
+    per_hunt INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (season, area_key, source)
+);
+CREATE INDEX IF NOT EXISTS hunt_stats_key ON hunt_stats (hunt_key);
+CREATE INDEX IF NOT EXISTS area_stats_key ON area_stats (area_key);
+CREATE INDEX IF NOT EXISTS hunt_stats_source ON hunt_stats (source);
+CREATE INDEX IF NOT EXISTS area_stats_source ON area_stats (source);
+CREATE VIEW IF NOT EXISTS hunt_best AS
+SELECT season, hunt_key, area_key, applications, permits, source FROM (
+    SELECT h.*, ROW_NUMBER() OVER (
+        PARTITION BY h.season, h.hunt_key ORDER BY s.newest DESC, h.source) AS rank
+    FROM hunt_stats h JOIN sources s ON s.path = h.source
+) WHERE rank = 1;
+CREATE VIEW IF NOT EXISTS area_best AS
+SELECT season, area_key, applications, permits, per_hunt, source FROM (
+    SELECT a.*, ROW_NUMBER() OVER (
+        PARTITION BY a.season, a.area_key ORDER BY a.per_hunt, s.newest DESC, a.source) AS rank
+    FROM area_stats a JOIN sources s ON s.path = a.source
+) WHERE rank = 1;
+"""
+
+# Per-area sums for a least-squares fit of apps per permit against season.
+TREND_SQL = """
+SELECT area_key, COUNT(*), MIN(season), MAX(season),
+       SUM(x), SUM(r), SUM(x * x), SUM(x * r), SUM(r * r)
+FROM (
+    SELECT area_key, season, season - ? AS x, CAST(applications AS REAL) / permits AS r
+    FROM area_best WHERE permits > 0
+)
+GROUP BY area_key
+"""
+
+
+def area_key(hunt_key: str) -> str:
+    """"location|method" of a "location|method|number" hunt key."""
+    return hunt_key.rsplit("|", 1)[0]
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class DrawHistory:
+    """Open (creating if needed) the store; use as a context manager to close it."""
+
+    def __init__(self, path: Path | str = DB_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Everything here is rebuilt from the PDFs, so an old layout is dropped.
+            self.conn.executescript(
+                "DROP VIEW IF EXISTS hunt_best; DROP VIEW IF EXISTS area_best;"
+                " DROP TABLE IF EXISTS sources; DROP TABLE IF EXISTS hunt_stats;"
+                " DROP TABLE IF EXISTS area_stats;"
+            )
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> DrawHistory:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def is_current(self, source: Path) -> bool:
+        """True when source was ingested and has not changed since."""
+        row = self.conn.execute(
+            "SELECT sha256 FROM sources WHERE path = ?", (source.name,)
+        ).fetchone()
+        return row is not None and row[0] == file_sha256(source)
+
+    def ingest(self, source: Path, hunts=(), areas=()) -> None:
+        """Replace every row from source in one transaction.
+
+        hunts are (season, hunt_key, applications, permits); their per-area
+        totals are added to area_stats. areas are (season, area_key,
+        applications, permits), with permits None where the source gives only
+        applications. A season-area given by both keeps the areas row.
+        Overlaps with other sources are left to the views (module docstring).
+        """
+        name = source.name
+        with self.conn:
+            self.conn.execute("DELETE FROM hunt_stats WHERE source = ?", (name,))
+            self.conn.execute("DELETE FROM area_stats WHERE source = ?", (name,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO hunt_stats VALUES (?, ?, ?, ?, ?, ?)",
+                [(season, key, area_key(key), apps, permits, name)
+                 for season, key, apps, permits in hunts],
+            )
+            self.conn.execute(
+                """INSERT OR REPLACE INTO area_stats
+                   SELECT season, area_key, SUM(applications), SUM(permits), 1, source
+                   FROM hunt_stats WHERE source = ? GROUP BY season, area_key""",
+                (name,),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO area_stats VALUES (?, ?, ?, ?, 0, ?)",
+                [(season, key, apps, permits, name) for season, key, apps, permits in areas],
+            )
+            newest = max([row[0] for row in (*hunts, *areas)], default=None)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?)",
+                (name, file_sha256(source), newest),
+            )
+
+    def latest_season(self) -> int | None:
+        return self.conn.execute("SELECT MAX(season) FROM hunt_best").fetchone()[0]
+
+    def hunt_stats(self, season: int | None = None) -> dict[str, tuple[int, int | None]]:
+        """(applications, permits) by hunt key for one season, the latest by default."""
+        if season is None:
+            season = self.latest_season()
+        return {
+            key: (apps, permits)
+            for key, apps, permits in self.conn.execute(
+                "SELECT hunt_key, applications, permits FROM hunt_best WHERE season = ?",
+                (season,),
+            )
+        }
+
+    def area_rows(self) -> list[tuple[str, int, int, bool]]:
+        """(area_key, season, applications, per_hunt) for every stored area season."""
+        return [
+            (key, season, apps, bool(per_hunt))
+            for key, season, apps, per_hunt in self.conn.execute(
+                "SELECT area_key, season, applications, per_hunt FROM area_best"
+                " ORDER BY area_key, season"
+            )
+        ]
+
+    def area_trends(self) -> dict[str, dict]:
+        """Apps-per-permit trend for every area, from one grouped query.
+
+        Each area gets seasons (how many had permits), first/last season,
+        mean, slope (change per season, least squares; 0 from one season)
+        and volatility (population standard deviation).
+        """
+        base = self.conn.execute("SELECT MIN(season) FROM area_best").fetchone()[0] or 0
+        out = {}
+        for key, n, first, last, sx, sr, sxx, sxr, srr in self.conn.execute(TREND_SQL, (base,)):
+            mean = sr / n
+            denom = n * sxx - sx * sx
+            out[key] = {
+                "seasons": n,
+                "first": first,
+                "last": last,
+                "mean": round(mean, 2),
+                "slope": round((n * sxr - sx * sr) / denom, 2) if denom else 0.0,
+                "volatility": round(math.sqrt(max(srr / n - mean * mean, 0.0)), 2),
+            }
+        return out
@@ -0,0 +1,109 @@
+"""Monte Carlo draw odds for a slate of WMA draw hunt applications.
+
+Each trial redraws every hunt's rival applications from a Poisson around its
+forecast application count (draw_forecast), itself drawn from the forecast's
+log-normal spread, and places our application at a uniformly random spot in
+that lottery order; it is drawn when the spot falls inside the quota. Hunts
+without a forecast use their 2025 count. Hunts are drawn independently, so a
+trial's hunts drawn is the sum across the slate. Trials run in NumPy batches
+of (trials x hunts) arrays.
+
+Hunts with no 2025 match assume unmatched_ratio applications per permit
+against their 2026 permits.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numpy as np
+except ImportError:         # simulate_slate falls back to closed-form odds
+    np = None
+
+DEFAULT_TRIALS = 100_000
+BATCH_TRIALS = 50_000       # bounds memory at BATCH_TRIALS x slate size
+UNMATCHED_RATIO = 5.0
+
+
+def demand(hunt: dict, unmatched_ratio: float = UNMATCHED_RATIO) -> tuple[float, float, int, bool]:
+    """(expected rival applications, log-scale spread, quota, matched) for one hunt."""
+    apps = hunt.get("applications_2025")
+    quota = hunt.get("quota_2025")
+    if apps is not None and quota:
+        if hunt.get("applications_forecast") is not None:
+            return (float(hunt["applications_forecast"]),
+                    float(hunt.get("applications_forecast_sd") or 0.0), int(quota), True)
+        return float(apps), 0.0, int(quota), True
+    permits = max(int(hunt.get("permits_available") or 1), 1)
+    return unmatched_ratio * permits, 0.0, permits, False
+
+
+def distribution(probabilities: list[float]) -> list[float]:
+    """P(exactly k hunts drawn) for independent per-hunt probabilities."""
+    dist = [1.0]
+    for p in probabilities:
+        nxt = [0.0] * (len(dist) + 1)
+        for k, q in enumerate(dist):
+            nxt[k] += q * (1 - p)
+            nxt[k + 1] += q * p
+        dist = nxt
+    return dist
+
+
+def simulate_slate(
+    hunts: list[dict],
+    trials: int = DEFAULT_TRIALS,
+    seed: int | None = 2026,
+    unmatched_ratio: float = UNMATCHED_RATIO,
+) -> dict:
+    """Simulate the lottery for a slate and summarize the draw odds.
+
+    Returns trials, expected_drawn, p_at_least_one, drawn_distribution
+    (P of drawing exactly 0..n hunts) and per-hunt rows with probability.
+    Without NumPy the odds are the closed-form min(1, quota / (apps + 1)).
+    """
+    rows = [demand(h, unmatched_ratio) for h in hunts]
+    if not rows:
+        return {"trials": 0, "expected_drawn": 0.0, "p_at_least_one": 0.0,
+                "drawn_distribution": [1.0], "hunts": []}
+
+    if np is None:
+        trials = 0
+        probs = [min(1.0, quota / (lam + 1)) for lam, _, quota, _ in rows]
+        dist = distribution(probs)
+    else:
+        rng = np.random.default_rng(seed)
+        lam = np.array([r[0] for r in rows])
+        spread = np.array([r[1] for r in rows])
+        quota = np.array([r[2] for r in rows])
+        hits = np.zeros(len(rows), dtype=np.int64)
+        counts = np.zeros(len(rows) + 1, dtype=np.int64)
+        done = 0
+        while done < trials:
+            size = min(BATCH_TRIALS, trials - done)
+            rate = lam * np.exp(spread * rng.standard_normal((size, len(rows))))
+            rivals = rng.poisson(rate)
+            drawn = rng.integers(0, rivals + 1) < quota
+            hits += drawn.sum(axis=0)
+            counts += np.bincount(drawn.sum(axis=1), minlength=len(rows) + 1)
+            done += size
+        probs = (hits / trials).tolist()
+        dist = (counts / trials).tolist()
+
+    return {
+        "trials": trials,
+        "expected_drawn": round(math.fsum(probs), 3),
+        "p_at_least_one": round(1 - dist[0], 4),
+        "drawn_distribution": [round(p, 4) for p in dist],
+        "hunts": [
+            {
+                "hunt_name": h["hunt_name"],
+                "probability": round(p, 4),
+                "expected_applications": round(lam, 1),
+                "quota": quota,
+                "matched": matched,
+            }
+            for h, p, (lam, _, quota, matched) in zip(hunts, probs, rows)
+        ],
+    }
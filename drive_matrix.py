@@ -0,0 +1,210 @@
+"""Drive miles and minutes between camps and WMAs, computed once per place set.
+
+DriveMatrix estimates every place-to-place pair from straight-line distance
+and a road model (ROAD_FACTOR, AVG_MPH, ACCESS_MINUTES). Measured routes —
+the OSRM results in data/locations_from_cabin.json — are pinned over the
+estimate for the place of the same name when both ends sit within
+PIN_TOLERANCE_MILES of the coordinates being routed. A pin measured to a
+different point (a bad geocode, a moved access gate) is stale; it is ignored
+and listed in DriveMatrix.stale_pins.
+
+Matrices are cached in .cache/drive_matrix/ keyed by places, origins,
+coordinates, model parameters and pins, so routes are table lookups after
+the first build. Only the CACHE_KEEP most recently used matrices are kept.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:         # haversine_grid falls back to a double loop
+    np = None
+
+ROOT = Path(__file__).parent
+PINS_FILE = ROOT / "data" / "locations_from_cabin.json"
+CACHE_DIR = ROOT / ".cache" / "drive_matrix"
+CACHE_VERSION = 2
+# Matrices kept in CACHE_DIR; the least recently used beyond this are removed.
+CACHE_KEEP = 8
+
+# Delta backroads wander; straight-line distance badly understates the drive.
+ROAD_FACTOR = 1.45      # driven miles per straight-line mile
+AVG_MPH = 47.0          # blended highway + county road speed
+ACCESS_MINUTES = 10     # gravel WMA access road / permit station
+
+# A measured route still describes a place whose coordinates moved this little.
+PIN_TOLERANCE_MILES = 3.0
+
+
+def haversine_miles(lat1, lon1, lat2, lon2):
+    r = 3958.8
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = math.radians(lat2 - lat1)
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * r * math.asin(math.sqrt(a))
+
+
+def haversine_grid(a: list, b: list) -> list[list[float]]:
+    """Straight-line miles from every [lat, lon] in a to every one in b, in one pass."""
+    if np is None or not a or not b:
+        return [[haversine_miles(*p, *q) for q in b] for p in a]
+    pa, pb = np.radians(np.asarray(a, dtype=float)), np.radians(np.asarray(b, dtype=float))
+    lat1, lon1 = pa[:, 0:1], pa[:, 1:2]
+    lat2, lon2 = pb[:, 0], pb[:, 1]
+    h = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return (2 * 3958.8 * np.arcsin(np.sqrt(h))).tolist()
+
+
+def load_pins(path: Path = PINS_FILE) -> list[dict]:
+    """Measured routes in locations_from_cabin.json, home to each location."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    home = data.get("home") or {}
+    if "lat" not in home:
+        return []
+    return [
+        {
+            "to_name": name,
+            "from": [home["lat"], home["lon"]],
+            "to": [loc["lat"], loc["lon"]],
+            "miles": loc["miles_drive"],
+            "minutes": loc["minutes_drive"],
+        }
+        for name, loc in sorted(data.get("locations", {}).items())
+        if loc.get("miles_drive") is not None and loc.get("minutes_drive") is not None
+    ]
+
+
+class DriveMatrix:
+    """Straight-line miles, drive miles and drive minutes from origins to every place.
+
+    places maps a name to anything with "lat" and "lon"; origins names the
+    places routes start from (default: all of them, a full square matrix).
+    The builders only ever ask camp or home, and any --origin, how far each
+    place is, so they route just those rows: a few per WMA instead of one per
+    pair of WMAs. Routes are treated as symmetric, so a pin measured
+    camp -> WMA also answers WMA -> camp, and route() takes either end as the
+    origin.
+    """
+
+    def __init__(
+        self,
+        places: dict[str, dict],
+        pins=(),
+        road_factor: float = ROAD_FACTOR,
+        avg_mph: float = AVG_MPH,
+        access_minutes: float = ACCESS_MINUTES,
+        cache_dir: Path | None = CACHE_DIR,
+        origins=None,
+    ):
+        self.names = list(places)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        origins = self.names if origins is None else [o for o in origins if o in self.index]
+        self.rows = {name: r for r, name in enumerate(origins)}
+        coords = [[float(places[n]["lat"]), float(places[n]["lon"])] for n in self.names]
+        pins = list(pins)
+        self.key = hashlib.sha256(json.dumps(
+            [CACHE_VERSION, self.names, origins, coords, pins, road_factor, avg_mph,
+             access_minutes, PIN_TOLERANCE_MILES],
+            sort_keys=True,
+        ).encode()).hexdigest()[:32]
+
+        cached = self._load(cache_dir)
+        if cached is None:
+            cached = self._compute(self.names, [self.index[o] for o in origins], coords, pins,
+                                   road_factor, avg_mph, access_minutes)
+            self._store(cache_dir, cached)
+        self.straight = cached["straight"]
+        self.miles = cached["miles"]
+        self.minutes = cached["minutes"]
+        self.pinned = {tuple(pair) for pair in cached["pinned"]}
+        self.stale_pins = cached["stalePins"]
+
+    @staticmethod
+    def _compute(names, sources, coords, pins, road_factor, avg_mph, access_minutes) -> dict:
+        """Row r of each matrix routes from place sources[r] to every place."""
+        n = len(coords)
+        straight = haversine_grid([coords[i] for i in sources], coords)
+        miles = [[s * road_factor for s in row] for row in straight]
+        minutes = [
+            [0.0 if i == j else m / avg_mph * 60 + access_minutes for j, m in enumerate(row)]
+            for i, row in zip(sources, miles)
+        ]
+        row_of = {i: r for r, i in enumerate(sources)}
+
+        def offset(i, point):
+            return haversine_miles(*coords[i], *point)
+
+        pinned, stale = [], []
+        for pin in pins:
+            if pin["to_name"] not in names:
+                continue            # a place this matrix does not route
+            j = names.index(pin["to_name"])
+            starts = [i for i in range(n) if i != j and offset(i, pin["from"]) <= PIN_TOLERANCE_MILES]
+            if not starts or offset(j, pin["to"]) > PIN_TOLERANCE_MILES:
+                stale.append(pin["to_name"])
+                continue
+            for i in starts:
+                for r, k in ((row_of.get(i), j), (row_of.get(j), i)):
+                    if r is not None:
+                        miles[r][k] = pin["miles"]
+                        minutes[r][k] = pin["minutes"]
+                pinned.append([i, j])
+        return {"straight": straight, "miles": miles, "minutes": minutes,
+                "pinned": pinned, "stalePins": stale}
+
+    def _load(self, cache_dir: Path | None) -> dict | None:
+        if cache_dir is None:
+            return None
+        path = cache_dir / f"{self.key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        os.utime(path)          # recently used, so _store's eviction keeps it
+        return data
+
+    def _store(self, cache_dir: Path | None, data: dict) -> None:
+        if cache_dir is None:
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / f"{self.key}.json.tmp"
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, cache_dir / f"{self.key}.json")
+        # Every edit to a WMA or a pin keys a new matrix; keep the newest few.
+        old = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in old[CACHE_KEEP:]:
+            path.unlink(missing_ok=True)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def _cell(self, origin: str, dest: str) -> tuple[int, int]:
+        if origin in self.rows:
+            return self.rows[origin], self.index[dest]
+        if dest in self.rows:
+            return self.rows[dest], self.index[origin]
+        raise KeyError(f"neither {origin!r} nor {dest!r} is an origin of this matrix")
+
+    def route(self, origin: str, dest: str) -> tuple[float, float]:
+        """(drive miles, drive minutes), unrounded."""
+        r, j = self._cell(origin, dest)
+        return self.miles[r][j], self.minutes[r][j]
+
+    def straight_miles(self, origin: str, dest: str) -> float:
+        r, j = self._cell(origin, dest)
+        return self.straight[r][j]
+
+    def is_pinned(self, origin: str, dest: str) -> bool:
+        i, j = self.index[origin], self.index[dest]
+        return (i, j) in self.pinned or (j, i) in self.pinned
@@ -0,0 +1,417 @@
+"""Moon, rut and season scoring shared by every builder and analyzer.
+
+Two models live here:
+
+* The daily model build_app_data.py uses. Moon age comes from the mean
+  synodic month, rut windows from RUT_WINDOW_TEMPLATE, and a hunt is scored on
+  its best day. SeasonCalendar holds every day of a season.
+* The phase-table model build_2026_decision_data.py and the analysis/ scripts
+  use. A hunt's midpoint is scored against the published major moon phases
+  (MOON_PHASES) and the Yazoo rut periods (RUT_PERIOD_TEMPLATE).
+  PhaseCalendar holds every possible midpoint of a season.
+
+Tables are built once per season and cached for the life of the process, so
+several analyzers in one run share them and score each date window once.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:         # best_days falls back to best_day without it
+    np = None
+
+
+# --------------------------------------------------------------------------
+# Daily model: moon
+# --------------------------------------------------------------------------
+SYNODIC = 29.530588853
+NEW_MOON_EPOCH = datetime(2000, 1, 6, 18, 14)
+
+
+def moon_age(d: date) -> float:
+    """Days since the most recent new moon (0 = new, ~14.8 = full)."""
+    delta = datetime(d.year, d.month, d.day, 12) - NEW_MOON_EPOCH
+    return (delta.total_seconds() / 86400.0) % SYNODIC
+
+
+def moon_phase_name(age: float) -> str:
+    if age < 1.85 or age >= 27.68:
+        return "New Moon"
+    if age < 5.54:
+        return "Waxing Crescent"
+    if age < 9.23:
+        return "First Quarter"
+    if age < 12.91:
+        return "Waxing Gibbous"
+    if age < 16.61:
+        return "Full Moon"
+    if age < 20.30:
+        return "Waning Gibbous"
+    if age < 23.99:
+        return "Last Quarter"
+    return "Waning Crescent"
+
+
+def moon_illumination(age: float) -> float:
+    return round((1 - math.cos(2 * math.pi * age / SYNODIC)) / 2, 3)
+
+
+def moon_score(age: float) -> float:
+    """0-10. Deer move best around the new moon (dark nights push daylight
+    feeding) and secondarily around the full moon (midday movement)."""
+    dist_new = min(age, SYNODIC - age)
+    dist_full = abs(age - SYNODIC / 2)
+    if dist_new <= 3:
+        return 10.0 - (dist_new / 3) * 1.5      # 10.0 -> 8.5
+    if dist_full <= 3:
+        return 8.0 - (dist_full / 3) * 1.5      # 8.0 -> 6.5
+    return 5.5
+
+
+# --------------------------------------------------------------------------
+# Daily model: rut (South Delta / Mississippi Delta region timing)
+# --------------------------------------------------------------------------
+# Windows are (month, day) pairs anchored to the season's opening calendar year,
+# so the same model applies to whichever season's CSVs are dropped into data/.
+# `+1` marks a date that falls in the following calendar year.
+RUT_WINDOW_TEMPLATE = [
+    ((12, 26), (1, 8, "+1"), 10.0, "Peak Rut",
+     "Peak breeding — bucks on their feet all day"),
+    ((12, 10), (12, 25), 8.5, "Pre-Rut Chase",
+     "Chase phase ramping up, scrapes hot"),
+    ((1, 9, "+1"), (1, 22, "+1"), 7.5, "Post-Rut",
+     "Second estrus and hungry, recovering bucks"),
+    ((11, 15), (12, 9), 7.0, "Early Rut Build",
+     "Rubs and scrapes appearing, movement climbing"),
+    ((11, 1), (11, 14), 6.0, "Pre-Rut",
+     "Bachelor groups breaking up"),
+    ((10, 1), (10, 31), 5.0, "Early Season",
+     "Food-source pattern hunting"),
+]
+
+
+def build_rut_windows(season_year: int):
+    """Materialize RUT_WINDOW_TEMPLATE against the season's opening year."""
+    out = []
+    for start, end, score, label, note in RUT_WINDOW_TEMPLATE:
+        def resolve(spec):
+            month, day = spec[0], spec[1]
+            year = season_year + 1 if len(spec) > 2 else season_year
+            return date(year, month, day)
+        out.append((resolve(start), resolve(end), score, label, note))
+    return out
+
+
+# Anything outside every window.
+RUT_FALLBACK = (4.5, "Late Season", "Food-driven movement, pressured deer")
+
+
+def rut_info(d: date, windows):
+    for start, end, score, label, note in windows:
+        if start <= d <= end:
+            return score, label, note
+    return RUT_FALLBACK
+
+
+def season_score(d: date) -> float:
+    """Cold-front probability / weather quality by month."""
+    return {12: 10.0, 1: 9.0, 11: 7.5, 10: 5.0, 2: 6.5}.get(d.month, 5.0)
+
+
+# --------------------------------------------------------------------------
+# Daily model: season calendar and best-day search
+# --------------------------------------------------------------------------
+class SeasonCalendar:
+    """Every per-day input to a hunt's score, computed once for one season.
+
+    Columns are plain lists indexed by day of season, July 1 of the opening
+    year through June 30 — the same boundary main() uses to assign a season.
+    """
+
+    def __init__(self, season_year: int, rut_weight: float, moon_weight: float):
+        self.season_year = season_year
+        self.rut_windows = build_rut_windows(season_year)
+        self.first = date(season_year, 7, 1)
+        self.days = [self.first + timedelta(days=i)
+                     for i in range((date(season_year + 1, 7, 1) - self.first).days)]
+
+        self.moon_age = [moon_age(d) for d in self.days]
+        self.moon_phase = [moon_phase_name(a) for a in self.moon_age]
+        self.moon_illum = [moon_illumination(a) for a in self.moon_age]
+        self.moon_score = [moon_score(a) for a in self.moon_age]
+        rut = [rut_info(d, self.rut_windows) for d in self.days]
+        self.rut_score = [r[0] for r in rut]
+        self.rut_label = [r[1] for r in rut]
+        self.rut_note = [r[2] for r in rut]
+        self.season_score = [season_score(d) for d in self.days]
+        # What a hunt's best day is chosen on.
+        self.day_score = [r * rut_weight + m * moon_weight
+                          for r, m in zip(self.rut_score, self.moon_score)]
+        self.day_score_array = None if np is None else np.asarray(self.day_score)
+
+    def index(self, d: date) -> int:
+        i = d.toordinal() - self.first.toordinal()
+        if not 0 <= i < len(self.days):
+            raise ValueError(f"{d} falls outside the {self.season_year} season calendar")
+        return i
+
+
+@lru_cache(maxsize=None)
+def _season_calendar(season_year: int, rut_weight: float, moon_weight: float) -> SeasonCalendar:
+    return SeasonCalendar(season_year, rut_weight, moon_weight)
+
+
+def season_calendar(season_year: int, weights: dict) -> SeasonCalendar:
+    """The shared SeasonCalendar for a season and a rut/moon weighting."""
+    return _season_calendar(season_year, weights["rut"], weights["moon"])
+
+
+def best_day(cal: SeasonCalendar, start: date, days: int) -> int:
+    """Calendar index of the hunt's best day (the first, on a tie).
+
+    A hunt is scored on its best single day rather than only the opener.
+    """
+    first = cal.index(start)
+    _check_end(cal, start, first, days)
+    scores = cal.day_score
+    return max(range(first, first + days), key=lambda i: (scores[i], -i))
+
+
+def _check_end(cal: SeasonCalendar, start: date, first: int, days: int) -> None:
+    if first + days > len(cal.days):
+        raise ValueError(f"{days}-day hunt from {start} runs past the "
+                         f"{cal.season_year} season calendar")
+
+
+def best_days(cal: SeasonCalendar, starts: list[date], durations: list[int]) -> list[int]:
+    """best_day for many hunts at once.
+
+    With NumPy each hunt's stretch of the calendar becomes one row of a
+    (hunts x longest-hunt) grid and the whole batch is reduced in one pass.
+    """
+    if np is None or not starts:
+        return [best_day(cal, s, n) for s, n in zip(starts, durations)]
+
+    first = np.asarray([cal.index(s) for s in starts], dtype=np.int64)
+    for s, i, n in zip(starts, first.tolist(), durations):
+        _check_end(cal, s, i, n)
+    dur = np.asarray(durations, dtype=np.int64)
+    offsets = np.arange(int(dur.max()), dtype=np.int64)
+    # Only the masked padding past a shorter hunt's end can leave the calendar.
+    grid = np.minimum(first[:, None] + offsets, len(cal.days) - 1)
+
+    combined = cal.day_score_array[grid]
+    combined[offsets >= dur[:, None]] = -np.inf
+    pick = np.argmax(combined, axis=1)          # first maximum, like best_day
+    return (first + pick).tolist()
+
+
+# --------------------------------------------------------------------------
+# Phase-table model: moon
+# --------------------------------------------------------------------------
+# Official major phases by season opening year (UTC-adjacent calendar dates).
+MOON_PHASES = {
+    2025: [
+        {"date": datetime(2025, 10, 6), "phase": "Full", "impact": -1},
+        {"date": datetime(2025, 10, 13), "phase": "Third Quarter", "impact": 1},
+        {"date": datetime(2025, 10, 21), "phase": "New", "impact": 3},
+        {"date": datetime(2025, 10, 29), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2025, 11, 5), "phase": "Full", "impact": -1},
+        {"date": datetime(2025, 11, 11), "phase": "Third Quarter", "impact": 1},
+        {"date": datetime(2025, 11, 20), "phase": "New", "impact": 3},
+        {"date": datetime(2025, 11, 28), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2025, 12, 4), "phase": "Full", "impact": -1},
+        {"date": datetime(2025, 12, 11), "phase": "Third Quarter", "impact": 1},
+        {"date": datetime(2025, 12, 19), "phase": "New", "impact": 3},
+        {"date": datetime(2025, 12, 27), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2026, 1, 13), "phase": "Full", "impact": -1},
+        {"date": datetime(2026, 1, 20), "phase": "New", "impact": 3},
+    ],
+    2026: [
+        {"date": datetime(2026, 10, 3), "phase": "Last Quarter", "impact": 1},
+        {"date": datetime(2026, 10, 10), "phase": "New", "impact": 3},
+        {"date": datetime(2026, 10, 18), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2026, 10, 26), "phase": "Full", "impact": -1},
+        {"date": datetime(2026, 11, 1), "phase": "Last Quarter", "impact": 1},
+        {"date": datetime(2026, 11, 9), "phase": "New", "impact": 3},
+        {"date": datetime(2026, 11, 17), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2026, 11, 24), "phase": "Full", "impact": -1},
+        {"date": datetime(2026, 12, 1), "phase": "Last Quarter", "impact": 1},
+        {"date": datetime(2026, 12, 9), "phase": "New", "impact": 3},
+        {"date": datetime(2026, 12, 17), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2026, 12, 24), "phase": "Full", "impact": -1},
+        {"date": datetime(2026, 12, 30), "phase": "Last Quarter", "impact": 1},
+        {"date": datetime(2027, 1, 7), "phase": "New", "impact": 3},
+        {"date": datetime(2027, 1, 15), "phase": "First Quarter", "impact": 1},
+        {"date": datetime(2027, 1, 22), "phase": "Full", "impact": -1},
+        {"date": datetime(2027, 1, 29), "phase": "Last Quarter", "impact": 1},
+    ],
+}
+
+
+def moon_description(score: float) -> str:
+    if score >= 2.5:
+        return "Excellent (New Moon Period)"
+    if score >= 1:
+        return "Good (Quarter Moon)"
+    if score >= 0:
+        return "Fair (Neutral)"
+    return "Poor (Full Moon Period)"
+
+
+def moon_at(midpoint: datetime, phases: list[dict]) -> dict:
+    """Best phase impact within a week of the midpoint, tapering with distance."""
+    best_score = -2
+    closest = None
+    for phase in phases:
+        days = abs((midpoint - phase["date"]).days)
+        if days <= 2:
+            score = phase["impact"]
+        elif days <= 4:
+            score = phase["impact"] * 0.7
+        elif days <= 7:
+            score = phase["impact"] * 0.4
+        else:
+            score = 0
+        if score > best_score:
+            best_score = score
+            closest = phase["phase"]
+    return {
+        "score": round(best_score, 2),
+        "closest_phase": closest,
+        "description": moon_description(best_score),
+    }
+
+
+# --------------------------------------------------------------------------
+# Phase-table model: rut (Yazoo County / Delta region biological window)
+# --------------------------------------------------------------------------
+# Same (month, day[, "+1"]) convention as RUT_WINDOW_TEMPLATE.
+RUT_PERIOD_TEMPLATE = [
+    ("pre_rut", (10, 1), (12, 15), 3, "Pre-Rut (Building Activity)"),
+    ("pre_peak_rut", (12, 16), (12, 28), 4, "Pre-Peak Rut (Chasing Activity)"),
+    ("peak_rut", (12, 29), (1, 4, "+1"), 5, "Peak Rut (Prime Time)"),
+    ("post_rut", (1, 5, "+1"), (1, 20, "+1"), 3, "Post-Rut (Recovery Period)"),
+    ("late_season", (1, 21, "+1"), (1, 31, "+1"), 2, "Late Season (Food Focus)"),
+]
+
+
+def build_rut_periods(season_year: int) -> list[dict]:
+    """Materialize RUT_PERIOD_TEMPLATE against the season's opening year."""
+    def resolve(spec):
+        year = season_year + 1 if len(spec) > 2 else season_year
+        return datetime(year, spec[0], spec[1])
+    return [
+        {"id": pid, "start": resolve(start), "end": resolve(end), "score": score, "label": label}
+        for pid, start, end, score, label in RUT_PERIOD_TEMPLATE
+    ]
+
+
+def rut_at(midpoint: datetime, periods: list[dict]) -> dict:
+    for period in periods:
+        if period["start"] <= midpoint <= period["end"]:
+            return {
+                "score": period["score"],
+                "period": period["id"],
+                "description": period["label"],
+            }
+    return {"score": 1, "period": "transition", "description": "Transition Period"}
+
+
+# Major phases in synodic order from the new moon, with their impact.
+PHASE_IMPACTS = [("New", 3), ("First Quarter", 1), ("Full", -1), ("Last Quarter", 1)]
+
+
+def estimated_phases(season_year: int) -> list[dict]:
+    """MOON_PHASES-style entries for a season, from the mean synodic month.
+
+    The daily model's moon (NEW_MOON_EPOCH, SYNODIC) stands in for a season
+    nobody has entered an official table for yet. Dates can be a day off the
+    published ones.
+    """
+    first = datetime(season_year, 7, 1) - timedelta(days=8)
+    last = datetime(season_year + 1, 7, 1) + timedelta(days=8)
+    k = math.floor((first - NEW_MOON_EPOCH).total_seconds() / 86400 / SYNODIC)
+    out = []
+    while True:
+        for quarter, (phase, impact) in enumerate(PHASE_IMPACTS):
+            when = NEW_MOON_EPOCH + timedelta(days=(k + quarter / 4) * SYNODIC)
+            day = datetime(when.year, when.month, when.day)
+            if day > last:
+                return out
+            if day >= first:
+                out.append({"date": day, "phase": phase, "impact": impact})
+        k += 1
+
+
+class PhaseCalendar:
+    """moon_at / rut_at for every possible hunt midpoint of one season.
+
+    A hunt's midpoint is start + (end - start) / 2, so it always lands on
+    midnight or noon; the table holds both halves of each day from July 1
+    through June 30. A season missing from MOON_PHASES is scored against
+    estimated_phases, with a warning.
+    """
+
+    def __init__(self, season_year: int):
+        self.season_year = season_year
+        self.phases = MOON_PHASES.get(season_year)
+        if self.phases is None:
+            warnings.warn(f"No MOON_PHASES table for the {season_year} season; "
+                          "scoring the moon from estimated phases", stacklevel=3)
+            self.phases = estimated_phases(season_year)
+        self.periods = build_rut_periods(season_year)
+        self.first = datetime(season_year, 7, 1)
+        slots = (datetime(season_year + 1, 7, 1) - self.first).days * 2
+        midpoints = [self.first + timedelta(hours=12 * i) for i in range(slots)]
+        self.moon = [moon_at(m, self.phases) for m in midpoints]
+        self.rut = [rut_at(m, self.periods) for m in midpoints]
+
+    def slot(self, midpoint: datetime) -> int | None:
+        half_days, rest = divmod(midpoint - self.first, timedelta(hours=12))
+        if rest or not 0 <= half_days < len(self.moon):
+            return None
+        return half_days
+
+
+def season_of(when: date) -> int:
+    """Opening year of the season a date belongs to (seasons open in July)."""
+    return when.year if when.month >= 7 else when.year - 1
+
+
+@lru_cache(maxsize=None)
+def phase_calendar(season_year: int) -> PhaseCalendar:
+    return PhaseCalendar(season_year)
+
+
+@lru_cache(maxsize=None)
+def score_window(start: datetime, end: datetime) -> tuple[dict, dict]:
+    """(moon, rut) for a hunt running start..end, computed once per window.
+
+    The dicts are shared between callers — copy before changing them.
+    """
+    midpoint = start + (end - start) / 2
+    cal = phase_calendar(season_of(midpoint))
+    i = cal.slot(midpoint)
+    if i is None:
+        return moon_at(midpoint, cal.phases), rut_at(midpoint, cal.periods)
+    return cal.moon[i], cal.rut[i]
+
+
+def score_windows(windows) -> list[tuple[dict, dict]]:
+    """score_window over an iterable of (start, end) pairs."""
+    return [score_window(start, end) for start, end in windows]
+
+
+def moon_score_for(start: datetime, end: datetime) -> dict:
+    return dict(score_window(start, end)[0])
+
+
+def rut_score_for(start: datetime, end: datetime) -> dict:
+    return dict(score_window(start, end)[1])
@@ -0,0 +1,115 @@
+"""Static index over inclusive date ranges for "what overlaps this range?".
+
+Same layout as Heng Li's cgranges: intervals sorted by start sit in a flat
+array that doubles as an implicit balanced binary tree (node i sits at level
+k when its low k bits are 1), and max_end[i] holds the largest end in i's
+subtree. A query walks that tree in O(log n + k) with no node objects, so the
+arrays serialize as-is into data.js and assets/app.js runs the same walk.
+
+Ranges are inclusive day numbers (day_number) so Python and the browser agree.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+EPOCH = date(1970, 1, 1)
+# Subtrees this shallow are scanned linearly instead of descended.
+SCAN_LEVEL = 3
+
+
+def day_number(d: date | str) -> int:
+    """Days since 1970-01-01 for a date or YYYY-MM-DD string."""
+    if isinstance(d, str):
+        d = date.fromisoformat(d[:10])
+    elif hasattr(d, "date"):
+        d = d.date()
+    return (d - EPOCH).days
+
+
+class IntervalIndex:
+    """Overlap queries over a fixed set of inclusive (start, end) ranges.
+
+    items are kept in start order (stable), and queries return positions
+    into that order — items[i] is the i-th entry of every exported array.
+    """
+
+    def __init__(self, ranges, items=None):
+        ranges = list(ranges)
+        items = list(range(len(ranges))) if items is None else list(items)
+        order = sorted(range(len(ranges)), key=lambda i: ranges[i][0])
+        self.starts = [int(ranges[i][0]) for i in order]
+        self.ends = [int(ranges[i][1]) for i in order]
+        self.items = [items[i] for i in order]
+        self.max_end = list(self.ends)
+        self.max_level = self._augment()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _augment(self) -> int:
+        n, ends, max_end = len(self.starts), self.ends, self.max_end
+        if n == 0:
+            return -1
+        last_i, last = 0, ends[0]
+        for i in range(0, n, 2):
+            last_i, last = i, ends[i]
+        k = 1
+        while 1 << k <= n:
+            x = 1 << (k - 1)
+            for i in range((x << 1) - 1, n, x << 2):
+                right = max_end[i + x] if i + x < n else last
+                max_end[i] = max(ends[i], max_end[i - x], right)
+            last_i = last_i - x if last_i >> k & 1 else last_i + x
+            if last_i < n and max_end[last_i] > last:
+                last = max_end[last_i]
+            k += 1
+        return k - 1
+
+    def positions(self, start: int, end: int) -> list[int]:
+        """Positions of every range sharing at least one day with start..end."""
+        n, starts, ends, max_end = len(self.starts), self.starts, self.ends, self.max_end
+        out: list[int] = []
+        if n == 0:
+            return out
+        stack = [(self.max_level, (1 << self.max_level) - 1, False)]
+        while stack:
+            k, x, left_done = stack.pop()
+            if k <= SCAN_LEVEL:
+                i0 = x >> k << k
+                for i in range(i0, min(i0 + (1 << (k + 1)) - 1, n)):
+                    if starts[i] > end:
+                        break
+                    if ends[i] >= start:
+                        out.append(i)
+            elif not left_done:
+                stack.append((k, x, True))
+                y = x - (1 << (k - 1))
+                if y >= n or max_end[y] >= start:
+                    stack.append((k - 1, y, False))
+            elif x < n and starts[x] <= end:
+                if ends[x] >= start:
+                    out.append(x)
+                stack.append((k - 1, x + (1 << (k - 1)), False))
+        out.sort()
+        return out
+
+    def overlapping(self, start: int, end: int) -> list:
+        return [self.items[i] for i in self.positions(start, end)]
+
+    def overlap_pairs(self) -> list[tuple[int, int]]:
+        """Every (i, j) with i < j whose ranges overlap, by position."""
+        return [
+            (i, j)
+            for i in range(len(self))
+            for j in self.positions(self.starts[i], self.ends[i])
+            if j > i
+        ]
+
+    def to_json(self) -> dict:
+        return {
+            "start": self.starts,
+            "end": self.ends,
+            "maxEnd": self.max_end,
+            "maxLevel": self.max_level,
+        }
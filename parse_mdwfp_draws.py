@@ -12,11 +12,14 @@ Run:  python parse_mdwfp_draws.py 2026
 from __future__ import annotations
 
 import csv
+import io
 import re
 import sys
 from datetime import date
 from pathlib import Path
 
+from atomic_write import write_text_atomic
+
 ROOT = Path(__file__).parent
 RAW_DIR = ROOT / "data" / "raw"
 OUT_DIR = ROOT / "data"
@@ -39,6 +42,10 @@ HUNT_RE = re.compile(
     r"^(?P<wma>.+?)\s*-\s*(?P<rest>(?:Archery|PW|Primitive Weapon|Limited Weapon|Gun)\b.*)$"
 )
 
+# Columns of the CSVs written here; group rows add group_size.
+CSV_COLUMNS = ["hunt_name", "hunt_type", "wma_location", "start_date", "end_date",
+               "permits_available", "duration_days"]
+
 # "4 groups(up to4 hunters/group)" / "1 group(up to3 hunters)"
 GROUP_RE = re.compile(r"(?P<groups>\d+)\s*groups?\s*\(\s*up\s*to\s*(?P<size>\d+)", re.I)
 
@@ -136,6 +143,17 @@ def parse_table(path: Path, hunt_type: str, season_year: int) -> list[dict]:
     return rows
 
 
+def write_csv(rows: list[dict], out: Path) -> None:
+    cols = list(CSV_COLUMNS)
+    if any("group_size" in r for r in rows):
+        cols.append("group_size")
+    buf = io.StringIO(newline="")
+    writer = csv.DictWriter(buf, fieldnames=cols)
+    writer.writeheader()
+    writer.writerows(rows)
+    write_text_atomic(out, buf.getvalue(), newline="")
+
+
 def main():
     if not RAW_DIR.exists():
         raise SystemExit(f"Missing {RAW_DIR}. Extract the MDWFP PDFs there first.")
@@ -161,16 +179,8 @@ def main():
             continue
 
         rows = parse_table(src, hunt_type, season_year)
-        cols = ["hunt_name", "hunt_type", "wma_location", "start_date", "end_date",
-                "permits_available", "duration_days"]
-        if any("group_size" in r for r in rows):
-            cols.append("group_size")
-
         out = OUT_DIR / out_name.format(season=season)
-        with out.open("w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=cols)
-            writer.writeheader()
-            writer.writerows(rows)
+        write_csv(rows, out)
 
         permits = sum(r["permits_available"] for r in rows)
         areas = len({r["wma_location"] for r in rows})
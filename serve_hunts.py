@@ -0,0 +1,384 @@
+"""Serve the scored hunt catalog from one warm local process.
+
+Loads the season CSVs in data/ once, scored exactly as build_app_data.py
+scores them, keeps them in memory with indexes and answers JSON queries, so a
+page or script fetches only what it shows instead of the whole data.js:
+
+  GET /meta            season, counts, source files, filters and sort keys
+  GET /hunts           filtered, sorted, paginated hunts
+  GET /hunts/<id>      one hunt
+  GET /wmas            WMAs with drive time from camp and hunt counts
+  GET /slate           best non-overlapping slate over the filtered hunts
+
+/hunts and /slate take the same filters: type, species, wma and agency
+(exact, repeatable; repeats are alternatives), q (every word must match, the
+way the app's search box matches), from and to (hunts overlapping that date
+range), min_score, max_drive (minutes from camp) and min_permits. /hunts
+sorts by sort=<field> or -<field> (default -score; unscored hunts last) and
+pages with offset and limit (at most MAX_LIMIT); fields=a,b keeps only those
+keys. /slate picks n hunts (default 5) with no two on overlapping dates or at
+one WMA and at least min_methods hunt types, maximizing total score; it
+searches the SLATE_POOL best-scored hunts that pass the filters.
+
+Every response carries an ETag (a hash of its body) and Cache-Control:
+no-cache, so a client revalidates and gets a 304 when nothing changed. Bodies
+of GZIP_MIN_BYTES or more are gzipped for clients that accept it. Encoded
+responses are cached per catalog version and canonical URL.
+
+A background thread checks data/*.csv every --poll seconds and, when one
+changes, loads and scores a new catalog and swaps it in whole; requests in
+flight finish on the catalog they started with, and a failed reload keeps
+the old one.
+
+Run:  python serve_hunts.py                 (http://127.0.0.1:8765)
+      python serve_hunts.py --port 9000 --poll 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, parse_qsl, unquote, urlencode, urlsplit
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT / "analysis"))
+
+import build_app_data  # noqa: E402
+from build_2026_decision_data import solve_slate  # noqa: E402
+from interval_index import IntervalIndex, day_number  # noqa: E402
+
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+# Query parameter -> hunt field, for the exact-match filters.
+EXACT_FILTERS = {"type": "type", "species": "species", "wma": "wma", "agency": "agency"}
+SORT_KEYS = ["score", "start", "end", "driveMinutes", "permits", "days", "name", "wma"]
+SLATE_POOL = 300
+MAX_SLATE = 10
+GZIP_MIN_BYTES = 1024
+RESPONSE_CACHE_SIZE = 512
+
+
+class Catalog:
+    """One loaded season: hunts in score order plus the indexes queries use."""
+
+    def __init__(self, hunts: list[dict], wmas: list[dict], season_year: int,
+                 sources: list[str], version: str):
+        self.hunts = sorted(
+            hunts, key=lambda h: (h["score"] is None, -(h["score"] or 0), h["start"]))
+        self.wmas = wmas
+        self.season_year = season_year
+        self.sources = sources
+        self.version = version
+        self.by_id = {h["id"]: h for h in self.hunts}
+        # field -> value -> rows, for each exact filter.
+        self.postings: dict[str, dict] = {}
+        for field in EXACT_FILTERS.values():
+            index = self.postings[field] = {}
+            for row, h in enumerate(self.hunts):
+                index.setdefault(h[field], []).append(row)
+        self.dates = IntervalIndex(
+            [(day_number(h["start"]), day_number(h["end"])) for h in self.hunts],
+            range(len(self.hunts)),
+        )
+        self.search = build_app_data.search_index(self.hunts)
+        # (field, descending) -> rows in that order, unset values last.
+        self.orders: dict[tuple[str, bool], list[int]] = {}
+        for field in SORT_KEYS:
+            rows = [i for i, h in enumerate(self.hunts) if h.get(field) is not None]
+            unset = [i for i, h in enumerate(self.hunts) if h.get(field) is None]
+            value = lambda i, f=field: self.hunts[i][f]  # noqa: E731
+            self.orders[field, False] = sorted(rows, key=value) + unset
+            self.orders[field, True] = sorted(rows, key=value, reverse=True) + unset
+
+    def tokens_for(self, word: str) -> list[int]:
+        """Vocabulary positions of tokens containing word (prefixes under three characters)."""
+        tokens, trigrams = self.search["tokens"], self.search["trigrams"]
+        if len(word) < 3:
+            out, t = [], bisect_left(tokens, word)
+            while t < len(tokens) and tokens[t].startswith(word):
+                out.append(t)
+                t += 1
+            return out
+        lists = [trigrams.get(word[i:i + 3]) for i in range(len(word) - 2)]
+        if not all(lists):
+            return []
+        return [t for t in min(lists, key=len) if word in tokens[t]]
+
+    def matching(self, params: dict[str, list[str]]) -> list[int]:
+        """Rows passing every filter in params, in score order."""
+        sets = []
+        for param, field in EXACT_FILTERS.items():
+            if params.get(param):
+                sets.append({r for v in params[param] for r in self.postings[field].get(v, ())})
+        for text in params.get("q", []):
+            for word in build_app_data.TOKEN_RE.findall(text.lower()):
+                postings = self.search["postings"]
+                sets.append({r for t in self.tokens_for(word) for r in postings[t]})
+        if params.get("from") or params.get("to"):
+            lo = day_number(one(params, "from", date.fromisoformat, date.min))
+            hi = day_number(one(params, "to", date.fromisoformat, date.max))
+            sets.append(set(self.dates.overlapping(lo, hi)))
+        sets.sort(key=len)
+        rows = range(len(self.hunts)) if not sets else sorted(set.intersection(*sets))
+
+        min_score = one(params, "min_score", float)
+        max_drive = one(params, "max_drive", float)
+        min_permits = one(params, "min_permits", int)
+        out = []
+        for row in rows:
+            h = self.hunts[row]
+            if min_score is not None and (h["score"] is None or h["score"] < min_score):
+                continue
+            if max_drive is not None and h["driveMinutes"] > max_drive:
+                continue
+            if min_permits is not None and (h["permits"] is None or h["permits"] < min_permits):
+                continue
+            out.append(row)
+        return out
+
+    def query(self, params: dict[str, list[str]]) -> dict:
+        rows = self.matching(params)
+        sort = one(params, "sort", str, "-score")
+        field = sort.lstrip("-")
+        if field not in SORT_KEYS:
+            raise ValueError(f"sort must be one of {', '.join(SORT_KEYS)} (optionally -field)")
+        if sort != "-score":
+            keep = set(rows)
+            rows = [r for r in self.orders[field, sort.startswith("-")] if r in keep]
+        offset = one(params, "offset", int, 0)
+        limit = min(one(params, "limit", int, DEFAULT_LIMIT), MAX_LIMIT)
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        fields = [f for text in params.get("fields", []) for f in text.split(",") if f]
+        page = [self.hunts[r] for r in rows[offset:offset + limit]]
+        if fields:
+            page = [{f: h.get(f) for f in fields} for h in page]
+        return {"total": len(rows), "offset": offset, "limit": limit, "sort": sort, "hunts": page}
+
+    def slate(self, params: dict[str, list[str]]) -> dict:
+        n = one(params, "n", int, 5)
+        if not 1 <= n <= MAX_SLATE:
+            raise ValueError(f"n must be between 1 and {MAX_SLATE}")
+        min_methods = one(params, "min_methods", int, 3)
+        scored = [self.hunts[r] for r in self.matching(params) if self.hunts[r]["score"] is not None]
+        # solve_slate's field names, with the hunt type as its category.
+        pool = [
+            {"decision_score": h["score"], "miles_drive": h["driveMiles"], "hunt_name": h["name"],
+             "start_date": h["start"], "end_date": h["end"], "wma_location": h["wma"],
+             "category": h["type"], "hunt": h}
+            for h in scored[:SLATE_POOL]
+        ]
+        picks = [p["hunt"] for p in solve_slate(pool, n, min_methods)]
+        return {
+            "n": n,
+            "minMethods": min_methods,
+            "pool": len(pool),
+            "totalScore": round(sum(h["score"] for h in picks), 2),
+            "hunts": picks,
+        }
+
+    def meta(self) -> dict:
+        return {
+            "season": f"{self.season_year}-{str(self.season_year + 1)[-2:]}",
+            "seasonYear": self.season_year,
+            "version": self.version,
+            "sourceFiles": self.sources,
+            "hunts": len(self.hunts),
+            "wmas": len(self.wmas),
+            "filters": {field: sorted(self.postings[field], key=str) for field in EXACT_FILTERS.values()},
+            "sortKeys": SORT_KEYS,
+        }
+
+
+def one(params: dict[str, list[str]], name: str, kind=str, default=None):
+    """The last value of a query parameter as kind, or default when absent."""
+    values = params.get(name)
+    if not values or values[-1] == "":
+        return default
+    try:
+        return kind(values[-1])
+    except ValueError:
+        raise ValueError(f"bad {name}: {values[-1]!r}") from None
+
+
+def input_state() -> tuple:
+    """What a reload watches: name, mtime and size of every CSV in data/."""
+    state = []
+    for p in sorted(build_app_data.DATA_DIR.glob("*.csv")):
+        st = p.stat()
+        state.append((p.name, st.st_mtime_ns, st.st_size))
+    return tuple(state)
+
+
+def load_catalog() -> Catalog:
+    """Read and score the newest season's CSVs, as build_app_data.main does."""
+    paths = build_app_data.discover_csvs()
+    if not paths:
+        raise ValueError(f"No hunt CSVs found in {build_app_data.DATA_DIR}")
+    rows, hashes, _ = build_app_data.read_rows(paths, {})
+    season_year = build_app_data.season_year_of(rows)
+    build_app_data.prepare_scoring(season_year)
+    hunts = build_app_data.score_rows(rows)
+    wmas = build_app_data.wma_list(hunts)
+    version = build_app_data.fingerprint(
+        [hashes, build_app_data.scoring_fingerprint(season_year)])[:16]
+    return Catalog(hunts, wmas, season_year, [p.name for p in paths], version)
+
+
+class Response:
+    __slots__ = ("status", "body", "gzipped", "etag")
+
+    def __init__(self, status: int, payload):
+        self.status = status
+        self.body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.gzipped = gzip.compress(self.body, 6) if len(self.body) >= GZIP_MIN_BYTES else None
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:20]}"'
+
+
+class HuntService:
+    """The current catalog, its response cache and the reload watcher."""
+
+    def __init__(self, catalog: Catalog):
+        self.catalog = catalog
+        self.cache: OrderedDict[tuple, Response] = OrderedDict()
+        self.lock = threading.Lock()
+        self.state = input_state()
+
+    def respond(self, path: str, query: str) -> Response:
+        catalog = self.catalog              # one catalog for the whole request
+        key = (catalog.version, path, urlencode(sorted(parse_qsl(query, keep_blank_values=True))))
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+        response = self.build(catalog, path, parse_qs(query, keep_blank_values=True))
+        with self.lock:
+            self.cache[key] = response
+            while len(self.cache) > RESPONSE_CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return response
+
+    def build(self, catalog: Catalog, path: str, params: dict[str, list[str]]) -> Response:
+        try:
+            if path == "/meta":
+                return Response(HTTPStatus.OK, catalog.meta())
+            if path == "/hunts":
+                return Response(HTTPStatus.OK, catalog.query(params))
+            if path.startswith("/hunts/"):
+                hunt = catalog.by_id.get(unquote(path[len("/hunts/"):]))
+                if hunt is None:
+                    return Response(HTTPStatus.NOT_FOUND, {"error": "no such hunt"})
+                return Response(HTTPStatus.OK, hunt)
+            if path == "/wmas":
+                return Response(HTTPStatus.OK, {"wmas": catalog.wmas})
+            if path == "/slate":
+                return Response(HTTPStatus.OK, catalog.slate(params))
+        except ValueError as exc:
+            return Response(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        return Response(HTTPStatus.NOT_FOUND, {"error": f"unknown path {path}"})
+
+    def reload_if_changed(self) -> bool:
+        """Swap in a fresh catalog when data/ changed; True when one was loaded."""
+        state = input_state()
+        if state == self.state:
+            return False
+        self.state = state
+        try:
+            catalog = load_catalog()
+        except (ValueError, OSError, KeyError, SystemExit) as exc:
+            # build_hunt stops a build with SystemExit; the server keeps serving.
+            print(f"Reload failed, still serving {self.catalog.version}: {exc}", flush=True)
+            return False
+        self.catalog = catalog
+        with self.lock:
+            self.cache.clear()
+        print(f"Reloaded {len(catalog.hunts)} hunts (version {catalog.version})", flush=True)
+        return True
+
+    def watch(self, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            self.reload_if_changed()
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "HuntQuery/1"
+
+    def do_GET(self):
+        self.send(head=False)
+
+    def do_HEAD(self):
+        self.send(head=True)
+
+    def send(self, head: bool) -> None:
+        url = urlsplit(self.path)
+        response = self.server.service.respond(url.path.rstrip("/") or "/", url.query)
+        if response.status == HTTPStatus.OK and response.etag in _tags(self.headers.get("If-None-Match")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", response.etag)
+            self.end_headers()
+            return
+        body = response.body
+        gzipped = response.gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = response.gzipped
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", response.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        # The app is opened from file:// or GitHub Pages, never from this origin.
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+def _tags(header: str | None) -> set[str]:
+    if not header:
+        return set()
+    return {t.strip().removeprefix("W/") for t in header.split(",")}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve hunt queries over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--poll", type=float, default=1.0,
+                        help="seconds between checks of data/ for changed CSVs (0: never reload)")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog()
+    service = HuntService(catalog)
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    server.daemon_threads = True
+    server.service = service
+    stop = threading.Event()
+    if args.poll > 0:
+        threading.Thread(target=service.watch, args=(args.poll, stop), daemon=True).start()
+    print(f"Serving {len(catalog.hunts)} hunts, season {catalog.meta()['season']}, "
+          f"on http://{args.host}:{server.server_address[1]}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Per-stage wall time, CPU time and peak memory for the builders' --profile mode.
+
+    profiler = StageProfiler(enabled=args.profile is not None, dump=args.profile_dump)
+    with profiler.stage("read"):
+        rows = read_rows(...)
+    for hunt in profiler.iterate("read", parse(lines)):   # times each next()
+        ...
+    profiler.finish(args.profile, "build_app_data")
+
+A stage records wall time (perf_counter), CPU time (process_time) and the
+peak traced allocation while it ran (tracemalloc, its peak reset as the stage
+is entered). CPU time is this process's own, so work handed to a process pool
+shows up in wall time only. A stage entered more than once, such as a
+per-hunt step in a streaming loop, adds up its times and keeps its highest
+peak. Stages do not nest: an inner stage resets the peak its outer stage is
+tracking.
+
+Disabled, stage() and iterate() record nothing and cost next to nothing, so
+main() can call them unconditionally. With dump set, each stage also runs
+under its own cProfile and the slowest stage's profile is written there (for
+pstats or snakeviz). Both tracemalloc and cProfile slow Python-heavy code, so
+compare profiled runs with each other, not with plain ones.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import contextlib
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+STAGES = ["discovery", "read", "stats", "scoring", "conflicts", "draw_odds", "aggregation",
+          "serialization", "write"]
+
+
+class StageProfiler:
+    def __init__(self, enabled: bool = False, dump: Path | None = None):
+        self.enabled = enabled or dump is not None
+        self.dump = dump
+        self.stages: dict[str, dict] = {}
+        self.profiles: dict[str, cProfile.Profile] = {}
+        self.started = time.perf_counter()
+        self.peak = 0
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        row = self.stages.setdefault(
+            name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_bytes": 0})
+        profile = self.profiles.setdefault(name, cProfile.Profile()) if self.dump else None
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            row["calls"] += 1
+            row["wall_seconds"] += time.perf_counter() - wall
+            row["cpu_seconds"] += time.process_time() - cpu
+            peak = tracemalloc.get_traced_memory()[1]
+            row["peak_bytes"] = max(row["peak_bytes"], peak - base)
+            self.peak = max(self.peak, peak)
+
+    def stage(self, name: str):
+        """Context manager timing its block as stage name."""
+        return self._timed(name) if self.enabled else contextlib.nullcontext()
+
+    def iterate(self, name: str, iterable):
+        """iterable, with the work behind each item charged to stage name."""
+        if not self.enabled:
+            return iterable
+        return self._iterate(name, iter(iterable))
+
+    def _iterate(self, name, it):
+        while True:
+            with self._timed(name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def report(self, builder: str) -> dict:
+        """Stages in STAGES order (others after), with totals and the slowest stage."""
+        order = {name: i for i, name in enumerate(STAGES)}
+        stages = {
+            name: {**row, "wall_seconds": round(row["wall_seconds"], 6),
+                   "cpu_seconds": round(row["cpu_seconds"], 6)}
+            for name, row in sorted(self.stages.items(), key=lambda kv: order.get(kv[0], len(order)))
+        }
+        slowest = max(stages, key=lambda s: stages[s]["wall_seconds"], default=None)
+        return {
+            "builder": builder,
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "traced_peak_bytes": self.peak,
+            "slowest": slowest,
+            "stages": stages,
+        }
+
+    def finish(self, path: Path | None, builder: str) -> dict | None:
+        """Write the JSON report (and the slowest stage's cProfile) and print a summary."""
+        if not self.enabled:
+            return None
+        report = self.report(builder)
+        tracemalloc.stop()
+        if self.dump and report["slowest"]:
+            self.dump.parent.mkdir(parents=True, exist_ok=True)
+            self.profiles[report["slowest"]].dump_stats(str(self.dump))
+            report["profile_dump"] = str(self.dump)
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nProfile ({builder}), {report['wall_seconds']:.2f} s wall:")
+        for name, row in report["stages"].items():
+            print(f"  {name:<14} {row['wall_seconds'] * 1000:>9.1f} ms wall "
+                  f"{row['cpu_seconds'] * 1000:>9.1f} ms cpu "
+                  f"{row['peak_bytes'] / 2**20:>8.1f} MiB peak  x{row['calls']}")
+        if path:
+            print(f"  report: {path}")
+        if self.dump and report["slowest"]:
+            print(f"  cProfile of {report['slowest']}: {self.dump}")
+        return report
@@ -0,0 +1,47 @@
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "analysis"))
+
+from build_2026_decision_data import build_strategy, solve_slate  # noqa: E402
+
+CATEGORIES = ["archery", "gun", "primitive_weapon"]
+
+
+def pool(hunts: int, wmas: int) -> list[dict]:
+    """hunts three-day hunts spread over wmas WMAs and all three categories."""
+    rows = []
+    for i in range(hunts):
+        start = date(2026, 10, 1) + timedelta(days=(i * 7) % 100)
+        rows.append({
+            "hunt_name": f"Hunt {i}",
+            "decision_score": 9 - (i * 37 % 80) / 10,
+            "wma_location": f"WMA {i % wmas}",
+            "category": CATEGORIES[i % 3],
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=2)).isoformat(),
+            "miles_drive": 10,
+        })
+    return rows
+
+
+def test_infeasible_slate_returns_quickly():
+    # Four WMAs cannot hold five hunts at one per WMA.
+    started = time.perf_counter()
+    assert solve_slate(pool(200, 4), 5, 3) == []
+    assert time.perf_counter() - started < 1
+
+
+def test_slate_smaller_than_min_methods():
+    slate = solve_slate(pool(50, 2), 2, 3)
+    assert len(slate) == 2
+    assert len({h["wma_location"] for h in slate}) == 2
+    assert len(solve_slate(pool(50, 2), 1, 3)) == 1
+
+
+def test_strategy_falls_back_to_fewer_hunts():
+    assert len(build_strategy(pool(60, 2), n=5)) == 2
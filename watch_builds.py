@@ -0,0 +1,328 @@
+"""Rebuild data.js and the decision JSON whenever one of their inputs changes.
+
+Watches the repo root, data/, data/raw/ and data/raw_2026/, and reruns only
+the stages that a changed file feeds:
+
+  data/raw/<category>_<season>.md       parse_mdwfp_draws.py <season>
+  data/raw_2026/*.pdf, data/*.pdf,
+  data/locations_from_cabin.json        analysis/build_2026_decision_data.py
+  data/<hunt CSVs>, applications_local.py,
+  origins_local.py                      build_app_data.py --incremental
+
+parse_mdwfp_draws and the decision builder write the CSVs that build_app_data
+reads. A plan therefore runs in STAGES order, and build_app_data runs after
+either of them. The two also write the same four deer CSVs for
+DECISION_SEASON. The decision builder's version, which has the decision
+columns, is the one the app uses. So a parse of that season is followed by
+the decision builder, which rewrites those files the way running the two
+scripts by hand in that order does.
+
+An editor save or a copied PDF arrives as a burst of events, so events are
+collected until nothing has changed for --debounce seconds. A file counts as
+changed only when its content hash differs from the last one seen. A touch, a
+save of identical text, or the CSVs a stage has just written (they are hashed
+after it runs) trigger nothing. A plan that fails leaves its inputs dirty:
+the next event for any of them, even a touch, reruns it, and so does the next
+plan that runs for some other change.
+
+On Linux the watcher uses inotify through libc. Elsewhere, or with --poll,
+it rescans the watched directories every --poll seconds. Each stage runs as a
+child process, because build_app_data imports applications_local only once
+and only a new process sees an edited application log. The builders replace
+their outputs atomically (atomic_write.py), so a browser or serve_hunts.py
+never reads a half-written data.js or CSV.
+
+Run:  python watch_builds.py
+      python watch_builds.py --poll 2 --debounce 1
+      python watch_builds.py --dry-run     (print what would run)
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import fnmatch
+import hashlib
+import os
+import re
+import select
+import struct
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from parse_mdwfp_draws import CATEGORIES
+
+ROOT = Path(__file__).parent
+DATA = ROOT / "data"
+WATCH_DIRS = [ROOT, DATA, DATA / "raw", DATA / "raw_2026"]
+LOCAL_MODULES = {"applications_local.py", "origins_local.py"}
+# discover_csvs' patterns; other CSVs in data/ (the scored export) feed nothing.
+HUNT_CSVS = ("deer_*hunts_*.csv", "refuge_hunts_*.csv", "waterfowl_hunts_*.csv")
+
+# Run order, and the command for each stage (parse_mdwfp_draws gets a season).
+STAGES = {
+    "parse_mdwfp_draws": ["parse_mdwfp_draws.py"],
+    "build_2026_decision_data": ["analysis/build_2026_decision_data.py"],
+    "build_app_data": ["build_app_data.py", "--incremental"],
+}
+# Stages that read what a stage writes.
+DOWNSTREAM = {
+    "parse_mdwfp_draws": {"build_app_data"},
+    "build_2026_decision_data": {"build_app_data"},
+}
+# The season build_2026_decision_data writes deer CSVs for (its file names).
+DECISION_SEASON = "2026_27"
+# A steady stream of events (a long copy) still gets a build this often.
+MAX_DELAY = 10.0
+
+
+def stages_for(path: Path) -> set[tuple[str, str | None]]:
+    """(stage, season) pairs a change to path calls for; season only for parses."""
+    try:
+        rel = path.absolute().relative_to(ROOT.absolute())
+    except ValueError:
+        return set()
+    where, name = rel.parent.as_posix(), rel.name
+    if where == "data/raw":
+        m = re.fullmatch(r"(.+)_(\d{4}_\d{2})\.md", name)
+        return {("parse_mdwfp_draws", m.group(2))} if m and m.group(1) in CATEGORIES else set()
+    if (where == "data/raw_2026" and name.endswith(".pdf")
+            or where == "data" and (name.endswith(".pdf") or name == "locations_from_cabin.json")):
+        return {("build_2026_decision_data", None)}
+    if where == "data" and re.search(r"_\d{4}_\d{2}\.csv$", name) \
+            and any(fnmatch.fnmatch(name, pat) for pat in HUNT_CSVS):
+        return {("build_app_data", None)}
+    if where == "." and name in LOCAL_MODULES:
+        return {("build_app_data", None)}
+    return set()
+
+
+def plan_for(paths) -> list[tuple[str, str | None]]:
+    """Every stage the changed paths call for, and those downstream, in run order."""
+    wanted = set()
+    for path in paths:
+        wanted |= stages_for(path)
+    if ("parse_mdwfp_draws", DECISION_SEASON) in wanted:
+        wanted.add(("build_2026_decision_data", None))
+    for stage, _ in list(wanted):
+        wanted |= {(down, None) for down in DOWNSTREAM.get(stage, ())}
+    order = list(STAGES)
+    return sorted(wanted, key=lambda s: (order.index(s[0]), s[1] or ""))
+
+
+def watched_files() -> set[Path]:
+    return {p for d in WATCH_DIRS if d.is_dir() for p in d.iterdir()
+            if p.is_file() and stages_for(p)}
+
+
+def digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+class Snapshot:
+    """Content hash of each watched file as last seen (None: missing)."""
+
+    def __init__(self, paths):
+        self.digests = {p: digest(p) for p in paths}
+
+    def changed(self, path: Path) -> bool:
+        """Whether path differs from the last look at it; records the new hash."""
+        now = digest(path)
+        if self.digests.get(path) == now:
+            return False
+        self.digests[path] = now
+        return True
+
+    def forget(self, paths) -> None:
+        """Make the next look at each path count as a change."""
+        for path in paths:
+            self.digests.pop(path, None)
+
+
+class PollingWatcher:
+    """Rescans WATCH_DIRS, comparing each file's mtime and size."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.state = self.scan()
+
+    @staticmethod
+    def scan() -> dict[Path, tuple[int, int]]:
+        state = {}
+        for p in watched_files():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            state[p] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        state = self.scan()
+        changed = {p for p in state.keys() | self.state.keys() if state.get(p) != self.state.get(p)}
+        self.state = state
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify on WATCH_DIRS, read through libc."""
+
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.add = libc.inotify_add_watch
+        self.add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, Path] = {}
+        for d in WATCH_DIRS:
+            if d.is_dir():
+                self.watch(d)
+
+    def watch(self, directory: Path) -> None:
+        wd = self.add(self.fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed on {directory}")
+        self.dirs[wd] = directory
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, length = self.EVENT.unpack_from(buf, offset)
+            start = offset + self.EVENT.size
+            name = os.fsdecode(buf[start:start + length].split(b"\0", 1)[0])
+            offset = start + length
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped; treat everything as possibly changed.
+                changed |= watched_files()
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & self.IN_ISDIR:
+                # data/raw or data/raw_2026 created after the watcher started.
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and path in WATCH_DIRS:
+                    self.watch(path)
+                    changed |= {p for p in path.iterdir() if p.is_file()}
+                continue
+            changed.add(path)
+        return {p for p in changed if not p.is_dir() and stages_for(p)}
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def open_watcher(poll: float | None):
+    if poll is None and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError) as exc:
+            print(f"inotify unavailable ({exc}); polling every second", flush=True)
+        poll = 1.0
+    return PollingWatcher(poll or 1.0)
+
+
+def log(message: str) -> None:
+    print(f"[{datetime.now():%H:%M:%S}] {message}", flush=True)
+
+
+def run_plan(plan, snapshot: Snapshot, dry_run: bool) -> bool:
+    """Run each stage in turn, stopping at the first that fails; True if none did.
+
+    After a stage, the files it wrote for the stages still to come are
+    rehashed, so their events do not start a second build.
+    """
+    for i, (stage, season) in enumerate(plan):
+        cmd = [sys.executable, *STAGES[stage], *([season] if season else [])]
+        log(f"{'would run' if dry_run else 'running'}: {' '.join(cmd[1:])}")
+        if not dry_run:
+            t0 = time.perf_counter()
+            result = subprocess.run(cmd, cwd=ROOT)
+            if result.returncode != 0:
+                log(f"{stage} failed (exit {result.returncode}); waiting for the next change")
+                return False
+            log(f"{stage} done in {time.perf_counter() - t0:.1f} s")
+        later = {s for s, _ in plan[i + 1:]}
+        for path in watched_files() | snapshot.digests.keys():
+            if {s for s, _ in stages_for(path)} <= later:
+                snapshot.changed(path)
+    return True
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Rerun the builders a changed input feeds.")
+    parser.add_argument("--debounce", type=float, default=0.5,
+                        help="seconds without events before a build starts (default 0.5)")
+    parser.add_argument("--poll", type=float, metavar="SECONDS",
+                        help="rescan every SECONDS instead of using inotify")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the stages a change calls for instead of running them")
+    args = parser.parse_args(argv)
+
+    snapshot = Snapshot(watched_files())
+    watcher = open_watcher(args.poll)
+    log(f"watching {len(snapshot.digests)} inputs with {type(watcher).__name__}; Ctrl-C stops")
+    pending: set[Path] = set()
+    failed: set[Path] = set()       # inputs of the last plan, if it failed
+    first = 0.0
+    try:
+        while True:
+            events = watcher.wait(args.debounce if pending else None)
+            if events:
+                if not pending:
+                    first = time.monotonic()
+                pending |= events
+                if time.monotonic() - first < MAX_DELAY:
+                    continue
+            if not pending:
+                continue
+            changed = {p for p in pending if snapshot.changed(p)}
+            pending.clear()
+            plan = plan_for(changed)
+            if plan:
+                log("changed: " + ", ".join(sorted(str(p.relative_to(ROOT)) for p in changed)))
+                changed |= failed
+                if run_plan(plan_for(changed), snapshot, args.dry_run):
+                    failed = set()
+                else:
+                    failed = changed
+                    snapshot.forget(failed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()